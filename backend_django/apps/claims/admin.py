@@ -2,6 +2,10 @@ from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 from apps.claims.models.claim import Claim, ClaimTag, ClaimStatus
 from django.utils.html import format_html
+from django.db.models import Q
+
+from apps.claims.queries.search import build_prefix_search_query, build_search_query
+from apps.claims.services.list_cache import invalidate_public_claim_lists
 
 
 @admin.register(Claim)
@@ -38,11 +42,13 @@ class ClaimAdmin(admin.ModelAdmin):
     @admin.action(description=_("Mark selected claims as public"))
     def make_public(self, request, queryset):
         updated = queryset.update(is_public=True)
+        invalidate_public_claim_lists()
         self.message_user(request, _(f"{updated} claim(s) marked as public."))
 
     @admin.action(description=_("Mark selected claims as private"))
     def make_private(self, request, queryset):
         updated = queryset.update(is_public=False)
+        invalidate_public_claim_lists()
         self.message_user(request, _(f"{updated} claim(s) marked as private."))
 
     def colored_status(self, obj):
@@ -50,6 +56,22 @@ class ClaimAdmin(admin.ModelAdmin):
         return format_html('<span style="color:{};">{}</span>', color, obj.status)
     colored_status.short_description = "Status"
 
+    def get_search_results(self, request, queryset, search_term):
+        # Only lookups an index can answer: the full-text and word-prefix
+        # matches on the GIN-indexed search vector, and the creator's exact
+        # email. The search_fields icontains scan is never used.
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        condition = Q(search_vector=build_search_query(search_term)) | Q(
+            created_by__email__iexact=search_term
+        )
+        prefix_query = build_prefix_search_query(search_term)
+        if prefix_query is not None:
+            condition |= Q(search_vector=prefix_query)
+        return queryset.filter(condition), False
+
+
 @admin.register(ClaimTag)
 class ClaimTagAdmin(admin.ModelAdmin):
     list_display = ("name",)
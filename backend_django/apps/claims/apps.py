@@ -5,3 +5,7 @@ from django.utils.translation import gettext_lazy as _
 class ClaimsConfig(AppConfig):
     name = "apps.claims"
     verbose_name = _("Claims")
+
+    def ready(self):
+        import apps.claims.checks  # noqa
+        import apps.claims.signals  # noqa
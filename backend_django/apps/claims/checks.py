@@ -0,0 +1,28 @@
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+# Backends whose entries live in one worker process only.
+PROCESS_LOCAL_CACHES = {"django.core.cache.backends.locmem.LocMemCache"}
+
+
+@register(Tags.caches, deploy=True)
+def check_list_cache_backend(app_configs, **kwargs):
+    """
+    The anonymous claim list cache is invalidated by bumping a version key,
+    which only reaches other workers through a shared cache backend.
+    """
+    from apps.claims.services.list_cache import CACHE_TIMEOUT
+
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if CACHE_TIMEOUT <= 0 or backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        Error(
+            "The anonymous claim list cache needs a shared cache backend.",
+            hint=(
+                "Point CACHE_BACKEND at Redis or Memcached, or set "
+                "CLAIM_LIST_CACHE_TIMEOUT = 0 to disable the list cache."
+            ),
+            id="claims.E001",
+        )
+    ]
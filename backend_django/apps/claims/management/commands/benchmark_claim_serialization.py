@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.claims.models import Claim
+from apps.claims.serializers import ClaimListSerializer
+from apps.common.queries.analytics import annotate_view_stats
+from apps.common.serializers import render_values, values_columns
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare rows/second for ClaimListSerializer over model instances "
+        "against the values() fast path, on seeded pages."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-size", type=int, default=1000)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        page_size = options["page_size"]
+        repeat = options["repeat"]
+
+        with transaction.atomic():
+            Claim.objects.bulk_create(
+                Claim(title=f"Benchmark claim {i}", description="Seeded")
+                for i in range(page_size)
+            )
+            queryset = annotate_view_stats(Claim.objects.order_by("-created_at"))
+            serializer = ClaimListSerializer()
+            columns = values_columns(serializer, queryset.query.annotations)
+
+            def model_path():
+                return ClaimListSerializer(list(queryset[:page_size]), many=True).data
+
+            def values_path():
+                rows = list(queryset.values(*columns.values())[:page_size])
+                return render_values(serializer, rows, columns)
+
+            for label, render in (("model instances", model_path), ("values()", values_path)):
+                render()  # warm up
+                started = time.perf_counter()
+                for _ in range(repeat):
+                    render()
+                elapsed = time.perf_counter() - started
+                rate = page_size * repeat / elapsed
+                self.stdout.write(f"{label}: {rate:,.0f} rows/s")
+
+            transaction.set_rollback(True)
@@ -0,0 +1,117 @@
+import time
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.claims.models import Claim
+from apps.claims.queries.visibility import (
+    VISIBLE_ORDERING,
+    legacy_visible_claims,
+    visible_claims,
+)
+
+User = get_user_model()
+
+SEED_SQL = """
+    INSERT INTO {table} (
+        id, title, description, status, is_public,
+        created_by_id, created_at, updated_at
+    )
+    SELECT
+        gen_random_uuid(),
+        'Benchmark claim ' || g,
+        'Seeded by benchmark_claim_visibility',
+        'open',
+        random() >= %s,
+        (%s::uuid[])[1 + (g %% %s)],
+        now() - (g || ' seconds')::interval,
+        now()
+    FROM generate_series(%s, %s) AS g
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare query plans and latency of the legacy public-or-owner claim "
+        "filter against visible_claims() on a seeded claims table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            nargs="+",
+            default=[1_000_000, 10_000_000],
+            help="Table sizes to benchmark at (seeded cumulatively).",
+        )
+        parser.add_argument("--owners", type=int, default=1000)
+        parser.add_argument("--private-ratio", type=float, default=0.2)
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--repeat", type=int, default=20)
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the seeded rows instead of rolling back.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            owners = self._create_owners(options["owners"])
+            viewer = owners[0]
+            seeded = 0
+
+            for target in sorted(options["rows"]):
+                if target > seeded:
+                    self._seed(seeded + 1, target, owners, options["private_ratio"])
+                    seeded = target
+
+                self.stdout.write(self.style.MIGRATE_HEADING(f"\n{target:,} claims"))
+                page_size = options["page_size"]
+                for label, builder in (
+                    ("legacy OR filter", legacy_visible_claims),
+                    (
+                        "visible_claims",
+                        lambda user: visible_claims(user, window=page_size),
+                    ),
+                ):
+                    for who, user in (("owner", viewer), ("anonymous", None)):
+                        qs = builder(user).order_by(*VISIBLE_ORDERING)[:page_size]
+                        self._report(f"{label} ({who})", qs, options["repeat"])
+
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+    def _create_owners(self, count):
+        owners = [
+            User(
+                id=uuid.uuid4(),
+                email=f"bench_{i}_{uuid.uuid4().hex[:6]}@example.com",
+                username=f"bench_{i}_{uuid.uuid4().hex[:6]}",
+            )
+            for i in range(count)
+        ]
+        for owner in owners:
+            owner.set_unusable_password()
+        return User.objects.bulk_create(owners)
+
+    def _seed(self, start, end, owners, private_ratio):
+        self.stdout.write(f"Seeding claims {start:,}..{end:,}")
+        owner_ids = [str(owner.id) for owner in owners]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                SEED_SQL.format(table=Claim._meta.db_table),
+                [private_ratio, owner_ids, len(owner_ids), start, end],
+            )
+            cursor.execute(f"ANALYZE {Claim._meta.db_table}")
+
+    def _report(self, label, qs, repeat):
+        list(qs)  # warm up caches before timing
+        started = time.perf_counter()
+        for _ in range(repeat):
+            list(qs)
+        elapsed_ms = (time.perf_counter() - started) * 1000 / repeat
+
+        self.stdout.write(self.style.SUCCESS(f"{label}: {elapsed_ms:.2f} ms/query"))
+        self.stdout.write(qs.explain(analyze=True, buffers=True))
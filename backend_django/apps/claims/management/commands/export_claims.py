@@ -0,0 +1,46 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from apps.claims.queries.visibility import visible_claims
+from apps.claims.services.export import DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, stream_claims
+
+
+class Command(BaseCommand):
+    help = "Stream all public claims as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            dest="export_format",
+            choices=list(EXPORT_FORMATS),
+            default="ndjson",
+        )
+        parser.add_argument(
+            "--output",
+            help="File to write to. Defaults to stdout.",
+        )
+        parser.add_argument("--gzip", action="store_true")
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        chunks = stream_claims(
+            visible_claims(None),
+            options["export_format"],
+            compress=options["gzip"],
+            chunk_size=options["chunk_size"],
+        )
+
+        if options["output"]:
+            if options["gzip"]:
+                out = open(options["output"], "wb")
+            else:
+                out = open(options["output"], "w", encoding="utf-8", newline="")
+            with out:
+                for chunk in chunks:
+                    out.write(chunk)
+            return
+
+        out = sys.stdout.buffer if options["gzip"] else sys.stdout
+        for chunk in chunks:
+            out.write(chunk)
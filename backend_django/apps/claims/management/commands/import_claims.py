@@ -0,0 +1,66 @@
+import json
+import sys
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.claims.services.ingest import DEFAULT_CHUNK_SIZE, ingest_claims
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Bulk import claims from an NDJSON file (one claim object per line)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="NDJSON file to read, or - for stdin.")
+        parser.add_argument(
+            "--created-by",
+            help="Email of the user the claims are attributed to.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        created_by = None
+        if options["created_by"]:
+            try:
+                created_by = User.objects.get(email=options["created_by"])
+            except User.DoesNotExist:
+                raise CommandError(f"No user with email {options['created_by']}.")
+
+        source = sys.stdin if options["path"] == "-" else open(options["path"], encoding="utf-8")
+
+        self.line_numbers = []
+        started = time.perf_counter()
+        with source:
+            result = ingest_claims(
+                self._read_items(source),
+                created_by=created_by,
+                chunk_size=options["chunk_size"],
+            )
+        elapsed = time.perf_counter() - started
+
+        for error in result["errors"]:
+            line_number = self.line_numbers[error["index"]]
+            self.stderr.write(f"line {line_number}: {error['errors']}")
+
+        rate = result["created"] / elapsed if elapsed else 0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result['created']} claims in {elapsed:.2f}s "
+                f"({rate:,.0f}/s), {len(result['errors'])} failed."
+            )
+        )
+
+    def _read_items(self, source):
+        for line_number, line in enumerate(source, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            self.line_numbers.append(line_number)
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Passed through so validation reports it against this line.
+                yield line
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-18 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("claims", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="claim",
+            index=models.Index(
+                condition=models.Q(("is_public", True)),
+                fields=["-created_at"],
+                name="claim_public_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="claim",
+            index=models.Index(
+                fields=["created_by", "-created_at"],
+                name="claim_owner_recent_idx",
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -36,12 +38,33 @@ class Claim(TimeStampedModel):
 
     is_public = models.BooleanField(default=True)
 
+    # Stored tsvector kept in sync by Postgres on every insert/update.
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("title", weight="A", config="english")
+            + SearchVector("description", weight="B", config="english")
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
     class Meta:
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["status"]),
             models.Index(fields=["created_at"]),
             models.Index(fields=["is_public"]),
+            # Visibility branches: public claims by recency, owners' claims by recency.
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(is_public=True),
+                name="claim_public_recent_idx",
+            ),
+            models.Index(
+                fields=["created_by", "-created_at"],
+                name="claim_owner_recent_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="claim_search_vector_idx"),
         ]
 
     def __str__(self):
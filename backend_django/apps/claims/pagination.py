@@ -0,0 +1,107 @@
+from functools import cached_property, partial
+
+from django.core.paginator import Paginator
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+from apps.claims.queries.visibility import VISIBLE_ORDERING, visible_claims
+
+
+class CountedPaginator(Paginator):
+    """
+    Django paginator whose total comes from ``count`` instead of counting
+    ``object_list``, which for a windowed queryset only holds the newest rows.
+    """
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._count = count
+
+    @cached_property
+    def count(self):
+        return self._count()
+
+
+class ClaimPageNumberPagination(PageNumberPagination):
+    """
+    The default page-number pagination, for ``visible_claims`` querysets cut
+    to ``visibility_window``. The total comes from the view's
+    ``count_visible_claims``.
+    """
+
+    def visibility_window(self, request):
+        """
+        ``(bound, window)`` for the requested page, or ``None`` when it can't
+        be known before counting (e.g. ``?page=last``).
+        """
+        page_size = self.get_page_size(request)
+        try:
+            page_number = int(request.query_params.get(self.page_query_param) or 1)
+        except ValueError:
+            return None
+        if not page_size or page_number < 1:
+            return None
+        return {}, page_number * page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        count = getattr(view, "count_visible_claims", None)
+        if count is not None:
+            self.django_paginator_class = partial(CountedPaginator, count=count)
+        return super().paginate_queryset(queryset, request, view)
+
+
+class ClaimCursorPagination(CursorPagination):
+    """
+    Opaque cursor pagination for claim lists.
+
+    Seeks on (created_at, id) instead of counting and offsetting, so page
+    cost stays constant however deep the client scrolls.
+    """
+    ordering = VISIBLE_ORDERING
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def visibility_window(self, request):
+        """
+        ``(bound, window)`` for the requested page: the cursor position as a
+        filter every branch applies, and the rows the page reads past it.
+        Backwards cursors are not windowed.
+        """
+        page_size = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        if cursor is None:
+            return {}, page_size + 1
+        if cursor.reverse:
+            return None
+        # Mirrors the filter paginate_queryset applies for a forward cursor
+        # on a descending ordering.
+        bound = {} if cursor.position is None else {"created_at__lt": cursor.position}
+        return bound, cursor.offset + page_size + 1
+
+
+def wants_cursor_pagination(request) -> bool:
+    """
+    Cursor mode is opt-in per request via ``?pagination=cursor``; any request
+    already carrying a cursor stays in cursor mode for the following pages.
+    """
+    if request is None:
+        return False
+    params = request.query_params
+    return (
+        params.get("pagination") == "cursor"
+        or ClaimCursorPagination.cursor_query_param in params
+    )
+
+
+def visible_claims_page(view, queryset):
+    """
+    ``visible_claims`` of ``queryset`` for the page the view's paginator is
+    about to read: bounded by its cursor and cut to its window when it has
+    one, ordered by ``VISIBLE_ORDERING``.
+    """
+    bound, window = {}, None
+    paginator = view.paginator
+    if hasattr(paginator, "visibility_window"):
+        bound, window = paginator.visibility_window(view.request) or ({}, None)
+    return visible_claims(
+        view.request.user, queryset.filter(**bound), window=window
+    ).order_by(*VISIBLE_ORDERING)
@@ -0,0 +1,54 @@
+import re
+
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
+
+from apps.claims.queries.visibility import visible_claims
+
+SEARCH_CONFIG = "english"
+
+
+def build_search_query(term: str) -> SearchQuery:
+    return SearchQuery(term, search_type="websearch", config=SEARCH_CONFIG)
+
+
+def build_prefix_search_query(term: str) -> SearchQuery | None:
+    """
+    Every word of ``term`` as a lexeme prefix (``riversi`` matches
+    "Riverside"), for partial words the websearch query misses. Still
+    answered from the search vector's GIN index. ``None`` if ``term`` has no
+    words.
+    """
+    words = re.findall(r"[^\W_]+", term)
+    if not words:
+        return None
+    return SearchQuery(
+        " & ".join(f"{word}:*" for word in words), search_type="raw", config=SEARCH_CONFIG
+    )
+
+
+def search_matches(term: str, queryset=None):
+    """
+    Claims matching ``term``, before any visibility rules.
+    """
+    from apps.claims.models import Claim
+
+    if queryset is None:
+        queryset = Claim.objects.all()
+    return queryset.filter(search_vector=build_search_query(term))
+
+
+def search_claims(user, term: str):
+    """
+    Full-text search over claim title and description, best matches first.
+
+    Runs against the stored ``search_vector`` column (GIN indexed) and applies
+    the same visibility rules as the claim list. The match filter goes into
+    each visibility branch, so only matching ids are merged.
+    """
+    query = build_search_query(term)
+    return (
+        visible_claims(user, search_matches(term))
+        .annotate(rank=SearchRank(F("search_vector"), query))
+        .order_by("-rank", "-created_at")
+    )
@@ -0,0 +1,93 @@
+from django.db.models import Q
+
+
+def public_claims_q() -> Q:
+    return Q(is_public=True)
+
+
+def owned_private_claims_q(user) -> Q:
+    return Q(is_public=False, created_by=user)
+
+
+# Newest first, with id as the tie-breaker; every page ordering and each
+# windowed branch use it, so a window always holds the rows a page needs.
+VISIBLE_ORDERING = ("-created_at", "-id")
+
+
+def visible_claims(user, queryset=None, window=None):
+    """
+    Claims the given user may see: every public claim plus their own private ones.
+
+    For signed-in users there is no OR: the ids come from a UNION ALL of two
+    disjoint branches, public claims (``claim_public_recent_idx``) and the
+    user's private claims (``claim_owner_recent_idx``), each planned against
+    its own index. Filters already on ``queryset`` (a search match, a cursor
+    bound) are applied inside each branch.
+
+    With ``window``, each branch is cut to its newest ``window`` rows before
+    the merge, so a page that needs the first ``window`` visible claims
+    reads that many index entries per branch instead of every public id.
+    Order the result by ``VISIBLE_ORDERING``. The result is still a plain
+    queryset, so callers can keep filtering, ordering and paginating it.
+    """
+    from apps.claims.models import Claim
+
+    if queryset is None:
+        queryset = Claim.objects.all()
+
+    if user is None or not user.is_authenticated:
+        return queryset.filter(public_claims_q())
+
+    return queryset.filter(pk__in=visible_claim_ids(user, queryset, window))
+
+
+def visible_claim_ids(user, queryset=None, window=None):
+    """
+    ``UNION ALL`` of the public and owned-private branches of ``queryset``,
+    as a ``pk`` subquery for ``visible_claims``.
+    """
+    from apps.claims.models import Claim
+
+    if queryset is None:
+        queryset = Claim.objects.all()
+
+    branches = []
+    for condition in (public_claims_q(), owned_private_claims_q(user)):
+        branch = queryset.filter(condition).values("pk")
+        if window is None:
+            branch = branch.order_by()
+        else:
+            branch = branch.order_by(*VISIBLE_ORDERING)[:window]
+        branches.append(branch)
+    public, owned = branches
+    return public.union(owned, all=True)
+
+
+def count_visible_claims(user, queryset=None) -> int:
+    """
+    How many claims of ``queryset`` the user may see, counted over the two
+    branches (``COUNT(*)`` of the UNION ALL) rather than by hashing every id.
+    """
+    from apps.claims.models import Claim
+
+    if queryset is None:
+        queryset = Claim.objects.all()
+
+    if user is None or not user.is_authenticated:
+        return queryset.filter(public_claims_q()).count()
+    return visible_claim_ids(user, queryset).count()
+
+
+def legacy_visible_claims(user, queryset=None):
+    """
+    The original ``is_public OR created_by`` filter, kept for benchmarking.
+    """
+    from apps.claims.models import Claim
+
+    if queryset is None:
+        queryset = Claim.objects.all()
+
+    if user is None or not user.is_authenticated:
+        return queryset.filter(is_public=True)
+
+    return queryset.filter(Q(is_public=True) | Q(created_by=user))
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from apps.claims.models import Claim, ClaimTag
+from apps.claims.services.tags import add_claim_tags, set_claim_tags
+from apps.common.serializers import SparseFieldsetMixin
 from apps.user_auth.serializers import UserPublicSerializer
 
 class ClaimBaseSerializer(serializers.ModelSerializer):
@@ -8,26 +10,33 @@ class ClaimBaseSerializer(serializers.ModelSerializer):
         model = Claim
         fields = ["title", "description", "is_public"]
 
-class ClaimListSerializer(serializers.ModelSerializer):
-    
+class ClaimListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    # Filled by apps.common.queries.analytics.annotate_view_stats
+    view_count = serializers.IntegerField(read_only=True)
+    unique_viewer_count = serializers.IntegerField(read_only=True)
+
     class Meta:
         model = Claim
-        fields = ["id", "title", "status", "created_at"]
+        fields = ["id", "title", "status", "created_at", "view_count", "unique_viewer_count"]
 
 class ClaimTagSerializer(serializers.ModelSerializer):
     class Meta:
         model = ClaimTag
         fields = ["name"]
 
+class ClaimTagNamesField(serializers.ListField):
+    """
+    Tag names in, tag names out. Names are resolved to ClaimTag rows in bulk
+    by the tag service rather than one lookup per name during validation.
+    """
+    child = serializers.CharField(allow_blank=True, max_length=50)
+
+    def to_representation(self, value):
+        return [tag.name for tag in value.all()]
+
 class ClaimCreateSerializer(serializers.ModelSerializer):
     created_by = UserPublicSerializer(read_only=True)
-    # Use SlugRelatedField to convert ClaimTag objects into their 'name' string
-    tags = serializers.SlugRelatedField(
-        many=True,
-        slug_field="name",
-        queryset=ClaimTag.objects.all(),
-        required=False
-    )
+    tags = ClaimTagNamesField(required=False)
 
     class Meta:
         model = Claim
@@ -43,24 +52,10 @@ class ClaimCreateSerializer(serializers.ModelSerializer):
             validated_data["created_by"] = request.user
         claim = Claim.objects.create(**validated_data)
 
-        # Add tags to the claim
-        for name in tag_names:
-            tag, _ = ClaimTag.objects.get_or_create(name=name)
-            claim.tags.add(tag)
+        add_claim_tags(claim, tag_names)
 
         return claim
 
-    def _set_tags(self, claim, tags):
-        normalized_tags = {
-            tag.strip().lower()
-            for tag in tags
-            if tag.strip()
-        }
-
-        for tag_name in normalized_tags:
-            tag, _ = ClaimTag.objects.get_or_create(name=tag_name)
-            claim.tags.add(tag)
-
 class ClaimUpdateSerializer(ClaimCreateSerializer):
 
     def update(self, instance, validated_data):
@@ -72,12 +67,11 @@ class ClaimUpdateSerializer(ClaimCreateSerializer):
         instance.save()
 
         if tags_data is not None:
-            instance.tags.clear()
-            self._set_tags(instance, tags_data)
+            set_claim_tags(instance, tags_data)
 
         return instance
 
-class ClaimDetailSerializer(serializers.ModelSerializer):
+class ClaimDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     tags = serializers.SlugRelatedField(
         many=True,
         read_only=True,
@@ -0,0 +1,90 @@
+import csv
+import io
+import json
+import zlib
+from typing import Iterable, Iterator
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+EXPORT_FIELDS = [
+    "id",
+    "title",
+    "description",
+    "status",
+    "is_public",
+    "created_by",
+    "created_at",
+    "updated_at",
+    "tags",
+]
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def iter_export_rows(queryset, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[dict]:
+    """
+    Yield one plain dict per claim using a server-side cursor.
+
+    Tags are loaded per chunk, so memory stays bounded by ``chunk_size``
+    rather than by the size of the table. Only the creator's id is exported,
+    so the creator itself is never joined.
+    """
+    queryset = queryset.prefetch_related("tags").order_by("created_at", "id")
+    for claim in queryset.iterator(chunk_size=chunk_size):
+        yield {
+            "id": str(claim.id),
+            "title": claim.title,
+            "description": claim.description,
+            "status": claim.status,
+            "is_public": claim.is_public,
+            "created_by": str(claim.created_by_id) if claim.created_by_id else None,
+            "created_at": claim.created_at.isoformat(),
+            "updated_at": claim.updated_at.isoformat(),
+            "tags": sorted(tag.name for tag in claim.tags.all()),
+        }
+
+
+def iter_ndjson(rows: Iterable[dict]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+def iter_csv(rows: Iterable[dict]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+
+    def drain() -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return value
+
+    writer.writeheader()
+    yield drain()
+    for row in rows:
+        writer.writerow({**row, "tags": "|".join(row["tags"])})
+        yield drain()
+
+
+def iter_gzip(chunks: Iterable[str]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_claims(
+    queryset,
+    export_format: str = "ndjson",
+    *,
+    compress: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator:
+    rows = iter_export_rows(queryset, chunk_size=chunk_size)
+    chunks = iter_csv(rows) if export_format == "csv" else iter_ndjson(rows)
+    return iter_gzip(chunks) if compress else chunks
@@ -0,0 +1,86 @@
+from itertools import islice
+from typing import Iterable
+
+from django.db import DatabaseError, transaction
+from rest_framework.exceptions import ValidationError
+
+from apps.claims.models import Claim, ClaimTag
+from apps.claims.services.list_cache import invalidate_public_claim_lists
+from apps.claims.services.tags import normalize_tag_names, resolve_tag_ids
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def ingest_claims(items: Iterable, *, created_by=None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """
+    Validate and bulk-insert claims, one transaction per chunk.
+
+    Invalid items are skipped and reported by their position in ``items``;
+    they never abort the rest of the batch. Returns
+    ``{"created": <count>, "errors": [{"index": i, "errors": ...}, ...]}``.
+    """
+    from apps.claims.serializers import ClaimCreateSerializer
+
+    # One serializer instance validates every item, so its fields are only
+    # built once.
+    validator = ClaimCreateSerializer()
+    result = {"created": 0, "errors": []}
+
+    for chunk in _chunked(enumerate(items), chunk_size):
+        valid = []
+        for index, item in chunk:
+            try:
+                valid.append((index, validator.run_validation(item)))
+            except ValidationError as exc:
+                result["errors"].append({"index": index, "errors": exc.detail})
+
+        if not valid:
+            continue
+
+        try:
+            _insert_chunk([data for _, data in valid], created_by)
+        except DatabaseError as exc:
+            result["errors"].extend(
+                {"index": index, "errors": {"non_field_errors": [str(exc)]}}
+                for index, _ in valid
+            )
+        else:
+            result["created"] += len(valid)
+
+    if result["created"]:
+        # bulk_create skips the post_save/m2m_changed signals.
+        invalidate_public_claim_lists()
+
+    return result
+
+
+def _insert_chunk(rows: list[dict], created_by) -> None:
+    claims = []
+    claim_tag_names = []
+    for data in rows:
+        tag_names = normalize_tag_names(data.pop("tags", []))
+        claim = Claim(**data, created_by=created_by)
+        claims.append(claim)
+        claim_tag_names.append((claim, tag_names))
+
+    Through = ClaimTag.claims.through
+
+    with transaction.atomic():
+        Claim.objects.bulk_create(claims)
+
+        tag_ids = resolve_tag_ids(
+            name for _, names in claim_tag_names for name in names
+        )
+        Through.objects.bulk_create(
+            [
+                Through(claim_id=claim.id, claimtag_id=tag_ids[name])
+                for claim, names in claim_tag_names
+                for name in names
+            ]
+        )
@@ -0,0 +1,77 @@
+import hashlib
+import time
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY = "claims:public-list:version"
+
+# Invalidation bumps a version key in the default cache, so every worker must
+# share that cache (see checks.check_list_cache_backend). 0 disables caching.
+CACHE_TIMEOUT = getattr(settings, "CLAIM_LIST_CACHE_TIMEOUT", 60)
+LOCK_TIMEOUT = 10
+LOCK_WAIT = 2.0
+POLL_INTERVAL = 0.05
+
+
+def _current_version() -> int:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Seed from the clock so a version evicted from the cache never
+        # resurrects entries written under an older counter.
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY, 0)
+    return version
+
+
+def invalidate_public_claim_lists() -> None:
+    """
+    Drop every cached anonymous claim list page by moving to a new key version.
+    """
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def _cache_key(request) -> str:
+    # The absolute URI covers page/cursor/filter params and the host used in
+    # next/previous links.
+    digest = hashlib.sha256(request.build_absolute_uri().encode()).hexdigest()
+    return f"claims:public-list:{_current_version()}:{digest}"
+
+
+def get_or_build_public_list(request, build: Callable[[], Any]) -> Any:
+    """
+    Return the cached list payload for this request, building it on a miss.
+
+    Only one caller rebuilds a cold key; concurrent callers wait briefly for
+    that result instead of all hitting the database at once.
+    """
+    if CACHE_TIMEOUT <= 0:
+        return build()
+
+    key = _cache_key(request)
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, 1, timeout=LOCK_TIMEOUT):
+        try:
+            data = build()
+            cache.set(key, data, timeout=CACHE_TIMEOUT)
+        finally:
+            cache.delete(lock_key)
+        return data
+
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        data = cache.get(key)
+        if data is not None:
+            return data
+
+    # The rebuilding worker is slow or died; serve this request uncached.
+    return build()
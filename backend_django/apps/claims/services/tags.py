@@ -0,0 +1,37 @@
+from typing import Iterable
+
+from apps.claims.models import ClaimTag
+
+
+def normalize_tag_names(names: Iterable[str]) -> set[str]:
+    return {name.strip().lower() for name in names if name and name.strip()}
+
+
+def resolve_tag_ids(names: Iterable[str]) -> dict[str, int]:
+    """
+    Map tag names to ids, creating any missing tags in a single insert.
+    """
+    normalized = normalize_tag_names(names)
+    if not normalized:
+        return {}
+
+    ClaimTag.objects.bulk_create(
+        [ClaimTag(name=name) for name in normalized],
+        ignore_conflicts=True,
+    )
+    return dict(
+        ClaimTag.objects.filter(name__in=normalized).values_list("name", "id")
+    )
+
+
+def add_claim_tags(claim, names: Iterable[str]) -> None:
+    tag_ids = resolve_tag_ids(names).values()
+    if tag_ids:
+        claim.tags.add(*tag_ids)
+
+
+def set_claim_tags(claim, names: Iterable[str]) -> None:
+    """
+    Replace the claim's tags, only inserting/deleting links that changed.
+    """
+    claim.tags.set(list(resolve_tag_ids(names).values()))
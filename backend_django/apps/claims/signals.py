@@ -0,0 +1,41 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Claim, ClaimTag
+from .services.list_cache import invalidate_public_claim_lists
+
+
+@receiver(post_save, sender=Claim)
+@receiver(post_delete, sender=Claim)
+def invalidate_claim_lists_on_claim_change(sender, instance, **kwargs):
+    invalidate_public_claim_lists()
+
+
+@receiver(m2m_changed, sender=ClaimTag.claims.through)
+def invalidate_claim_lists_on_tag_change(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_public_claim_lists()
+
+
+@receiver(m2m_changed, sender=ClaimTag.claims.through)
+def touch_claims_on_tag_change(sender, instance, action, reverse, pk_set, **kwargs):
+    # Tags are part of the claim's representation, so a tag change must move
+    # updated_at for ETag/Last-Modified to notice it.
+    if action == "pre_clear" and isinstance(instance, ClaimTag):
+        # post_clear has no pk_set; remember which claims lose this tag.
+        instance._cleared_claim_ids = list(instance.claims.values_list("pk", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+
+    if isinstance(instance, Claim):
+        claim_ids = [instance.pk]
+    elif action == "post_clear":
+        claim_ids = instance.__dict__.pop("_cleared_claim_ids", [])
+    else:
+        claim_ids = list(pk_set or ())
+    if not claim_ids:
+        return
+
+    Claim.objects.filter(pk__in=claim_ids).update(updated_at=timezone.now())
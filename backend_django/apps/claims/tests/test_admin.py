@@ -0,0 +1,45 @@
+from django.contrib.admin.sites import site
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory, TestCase
+
+from apps.claims.admin import ClaimAdmin
+from apps.claims.models import Claim
+
+User = get_user_model()
+
+
+class ClaimAdminSearchTests(TestCase):
+    def setUp(self):
+        self.admin = ClaimAdmin(Claim, site)
+        self.request = RequestFactory().get("/admin/claims/claim/")
+        self.user = User.objects.create_user(
+            email="reporter@example.com", password="testpass123"
+        )
+        self.claim = Claim.objects.create(
+            title="Flooding on Riverside Avenue",
+            description="Water over the road",
+            created_by=self.user,
+        )
+
+    def search(self, term):
+        results, _ = self.admin.get_search_results(
+            self.request, Claim.objects.all(), term
+        )
+        return list(results)
+
+    def test_full_text_match(self):
+        self.assertEqual(self.search("flooding"), [self.claim])
+
+    def test_partial_title_matches_word_prefix(self):
+        self.assertEqual(self.search("Riversi"), [self.claim])
+
+    def test_exact_email_match(self):
+        self.assertEqual(self.search("Reporter@example.com"), [self.claim])
+
+    def test_never_falls_back_to_substring_scan(self):
+        # "verside" is inside "Riverside" but is not a word prefix.
+        self.assertEqual(self.search("verside"), [])
+        self.assertEqual(self.search("reporter@"), [])
+
+    def test_punctuation_only_term(self):
+        self.assertEqual(self.search("&|!"), [])
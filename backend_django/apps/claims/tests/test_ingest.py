@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.claims.models import Claim, ClaimTag
+from apps.claims.services.ingest import ingest_claims
+
+User = get_user_model()
+
+
+class IngestClaimsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="desk@example.com", password="testpass123"
+        )
+
+    def test_bulk_inserts_claims_and_tags(self):
+        items = [
+            {"title": f"Claim {i}", "description": "Desk", "tags": ["Flood", "river"]}
+            for i in range(5)
+        ]
+
+        result = ingest_claims(items, created_by=self.user, chunk_size=2)
+
+        self.assertEqual(result, {"created": 5, "errors": []})
+        self.assertEqual(Claim.objects.filter(created_by=self.user).count(), 5)
+        self.assertEqual(ClaimTag.objects.count(), 2)
+        self.assertEqual(ClaimTag.claims.through.objects.count(), 10)
+
+    def test_invalid_items_are_reported_without_aborting(self):
+        items = [
+            {"title": "Good", "description": "Desk"},
+            {"description": "Missing title"},
+            "not an object",
+            {"title": "Also good", "description": "Desk"},
+        ]
+
+        result = ingest_claims(items, created_by=self.user)
+
+        self.assertEqual(result["created"], 2)
+        self.assertEqual([e["index"] for e in result["errors"]], [1, 2])
+        self.assertIn("title", result["errors"][0]["errors"])
+
+
+class BatchCreateViewTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="desk@example.com", password="testpass123"
+        )
+        self.url = reverse("claims:claim-batch-create")
+
+    def test_batch_create(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            self.url,
+            [{"title": "One", "description": "Desk"}, {"description": "Bad"}],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["errors"][0]["index"], 1)
+
+    def test_batch_create_requires_authentication(self):
+        response = self.client.post(self.url, [], format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,88 @@
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from apps.claims.models import Claim, ClaimTag
+from apps.claims.views.claim_viewset import ClaimViewSet
+from apps.common.models import ContentView
+from apps.common.tests.utils import QueryBudgetMixin
+
+User = get_user_model()
+
+
+class ClaimQueryBudgetTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        self.tags = [ClaimTag.objects.create(name=f"tag{i}") for i in range(5)]
+        self.claim = self._create_claims(1)[0]
+        self.list_url = reverse("claims:claim-list")
+        # Warm the ContentType cache, as it is in a running process.
+        ContentType.objects.get_for_model(Claim)
+
+    def _create_claims(self, count):
+        claims = []
+        for i in range(count):
+            claim = Claim.objects.create(
+                title=f"Claim {i}",
+                description="Budgeted",
+                created_by=self.user,
+            )
+            claim.tags.add(*self.tags)
+            claims.append(claim)
+        return claims
+
+    def test_list_query_count_is_independent_of_page_size(self):
+        self.assertQueryCountStable(
+            lambda: self.client.get(self.list_url),
+            lambda: self._create_claims(9),
+        )
+
+    def test_cursor_list_query_count_is_independent_of_page_size(self):
+        self.assertQueryCountStable(
+            lambda: self.client.get(self.list_url, {"pagination": "cursor"}),
+            lambda: self._create_claims(9),
+        )
+
+    def test_list_view_counts_do_not_add_queries(self):
+        def add_views():
+            for i, claim in enumerate(self._create_claims(9)):
+                for j in range(i):
+                    ContentView.record_view(claim, None, f"10.0.{i}.{j}")
+
+        self.assertQueryCountStable(lambda: self.client.get(self.list_url), add_views)
+
+    def test_list_budget(self):
+        self._create_claims(9)
+        # COUNT(*) + page
+        with self.assertQueryBudget(2):
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_retrieve_budget(self):
+        # Called directly so the response is not closed yet: view tracking
+        # runs on close, after the body has been sent.
+        view = ClaimViewSet.as_view({"get": "retrieve"})
+        request = APIRequestFactory().get(
+            reverse("claims:claim-detail", args=[self.claim.id])
+        )
+        # updated_at for ETag, claim + created_by join, tags prefetch
+        with self.assertQueryBudget(3):
+            response = view(request, pk=self.claim.id)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["tags"]), 5)
+
+        self.assertFalse(ContentView.objects.exists())
+        response.close()
+        self.assertEqual(ContentView.objects.count(), 1)
+
+    def test_not_modified_retrieve_budget(self):
+        url = reverse("claims:claim-detail", args=[self.claim.id])
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertQueryBudget(1):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
@@ -1,6 +1,8 @@
 from django.test import TestCase
 from django.db.utils import IntegrityError
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from apps.claims.models.claim import Claim, ClaimTag, ClaimStatus
 from apps.claims.serializers.claim import *
@@ -110,6 +112,23 @@ class ClaimCreateSerializerTests(TestCase):
         self.assertEqual(ClaimTag.objects.filter(name="science").count(), 1)
         self.assertIn(existing, claim.tags.all())
     
+    def test_tag_queries_do_not_grow_with_tag_count(self):
+        ClaimTag.objects.create(name="tag0")
+        serializer = ClaimCreateSerializer(
+            data={
+                "title": "Test",
+                "description": "Test",
+                "tags": [f"Tag{i}" for i in range(12)],
+            }
+        )
+        serializer.is_valid(raise_exception=True)
+
+        with CaptureQueriesContext(connection) as ctx:
+            claim = serializer.save(created_by=self.user)
+
+        self.assertEqual(claim.tags.count(), 12)
+        self.assertLessEqual(len(ctx.captured_queries), 6)
+
     def test_tags_must_be_list(self):
         serializer = ClaimCreateSerializer(
             data={
@@ -121,6 +140,53 @@ class ClaimCreateSerializerTests(TestCase):
         self.assertFalse(serializer.is_valid())
 
 
+class ClaimUpdateSerializerTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="creator@example.com",
+            password="testpass123"
+        )
+        self.claim = Claim.objects.create(
+            title="Test",
+            description="Test",
+            created_by=self.user,
+        )
+        self.claim.tags.add(
+            ClaimTag.objects.create(name="science"),
+            ClaimTag.objects.create(name="ai"),
+        )
+
+    def _update(self, tags):
+        serializer = ClaimUpdateSerializer(
+            self.claim, data={"tags": tags}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        return serializer.save()
+
+    def test_update_only_touches_changed_links(self):
+        Through = ClaimTag.claims.through
+        kept_link = Through.objects.get(claim=self.claim, claimtag__name="science")
+
+        claim = self._update(["Science", "Climate"])
+
+        self.assertCountEqual(
+            claim.tags.values_list("name", flat=True), ["science", "climate"]
+        )
+        self.assertTrue(Through.objects.filter(pk=kept_link.pk).exists())
+
+    def test_update_with_empty_list_clears_tags(self):
+        claim = self._update([])
+        self.assertEqual(claim.tags.count(), 0)
+
+    def test_update_without_tags_keeps_tags(self):
+        serializer = ClaimUpdateSerializer(
+            self.claim, data={"title": "Renamed"}, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        claim = serializer.save()
+        self.assertEqual(claim.tags.count(), 2)
+
+
 class ClaimDetailSerializerTests(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
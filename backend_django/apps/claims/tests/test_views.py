@@ -1,8 +1,22 @@
+import csv
+import gzip
+import io
+import json
+from datetime import timedelta
+from unittest import mock
+
 from django.urls import reverse
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from apps.claims.models import Claim, ClaimTag, ClaimStatus
+from apps.claims.serializers import ClaimListSerializer
+from apps.common.models import ContentView
+from apps.common.services.engagement import update_engagement
+from apps.common.services.recent_views import get_recent_views
+from apps.common.queries.analytics import annotate_view_stats
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -61,6 +75,17 @@ class ClaimViewTests(APITestCase):
         self.assertIn("Public Claim", titles)
         self.assertNotIn("Private Claim", titles)
 
+    def test_list_includes_view_counts(self):
+        self.client.force_authenticate(user=self.user)
+        ContentView.record_view(self.claim, self.user, "10.0.0.1")
+        ContentView.record_view(self.claim, None, "10.0.0.2")
+
+        response = self.client.get(reverse("claims:claim-list"))
+
+        row = next(r for r in response.data["results"] if r["title"] == "Public Claim")
+        self.assertEqual(row["view_count"], 2)
+        self.assertEqual(row["unique_viewer_count"], 2)
+
     def test_retrieve_public_claim(self):
         url = reverse("claims:claim-detail", args=[self.claim.id])
         response = self.client.get(url)
@@ -200,4 +225,467 @@ class ClaimViewSetTests(APITestCase):
         self.client.force_authenticate(user=self.user)
         response = self.client.delete(url)
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
-        self.assertFalse(Claim.objects.filter(id=self.claim.id).exists())
\ No newline at end of file
+        self.assertFalse(Claim.objects.filter(id=self.claim.id).exists())
+
+class ClaimCursorPaginationTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        for i in range(15):
+            Claim.objects.create(
+                title=f"Claim {i}",
+                description="Paged",
+                created_by=self.user,
+                is_public=True,
+            )
+        self.url = reverse("claims:claim-list")
+
+    def test_cursor_mode_omits_count(self):
+        response = self.client.get(self.url, {"pagination": "cursor"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", response.data)
+        self.assertIsNotNone(response.data["next"])
+        self.assertEqual(len(response.data["results"]), 10)
+
+    def test_cursor_pages_do_not_overlap(self):
+        first = self.client.get(self.url, {"pagination": "cursor"})
+        second = self.client.get(first.data["next"])
+
+        first_ids = {c["id"] for c in first.data["results"]}
+        second_ids = {c["id"] for c in second.data["results"]}
+
+        self.assertEqual(len(second_ids), 5)
+        self.assertFalse(first_ids & second_ids)
+        self.assertIsNone(second.data["next"])
+
+    def test_default_mode_is_page_number(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 15)
+
+    def _signed_in_with_private_claims(self):
+        for i in range(4):
+            Claim.objects.create(
+                title=f"Private {i}",
+                description="Paged",
+                created_by=self.user,
+                is_public=False,
+            )
+        self.client.force_authenticate(user=self.user)
+        return [
+            str(pk)
+            for pk in Claim.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        ]
+
+    def test_windowed_pages_follow_the_full_ordering(self):
+        expected = self._signed_in_with_private_claims()
+
+        first = self.client.get(self.url)
+        second = self.client.get(self.url, {"page": 2})
+
+        self.assertEqual(first.data["count"], 19)
+        self.assertEqual(
+            [c["id"] for c in first.data["results"] + second.data["results"]], expected
+        )
+
+    def test_windowed_cursor_pages_cover_every_claim(self):
+        expected = self._signed_in_with_private_claims()
+
+        seen = []
+        response = self.client.get(self.url, {"pagination": "cursor", "page_size": 4})
+        while True:
+            seen += [c["id"] for c in response.data["results"]]
+            if response.data["next"] is None:
+                break
+            response = self.client.get(response.data["next"])
+
+        self.assertEqual(seen, expected)
+
+
+class ClaimSearchTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        self.flood = Claim.objects.create(
+            title="River flood in the old town",
+            description="Photos show the bridge under water",
+            created_by=self.user,
+        )
+        self.fire = Claim.objects.create(
+            title="Warehouse fire",
+            description="Smoke visible near the river",
+            created_by=self.user,
+        )
+        self.private = Claim.objects.create(
+            title="Private flood report",
+            description="Not yet published",
+            created_by=self.user,
+            is_public=False,
+        )
+        self.url = reverse("claims:claim-search")
+
+    def test_search_requires_term(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_search_ranks_title_matches_first(self):
+        response = self.client.get(self.url, {"q": "river"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        ids = [c["id"] for c in response.data["results"]]
+        self.assertEqual(ids, [str(self.flood.id), str(self.fire.id)])
+
+    def test_search_respects_visibility(self):
+        response = self.client.get(self.url, {"q": "flood"})
+        titles = [c["title"] for c in response.data["results"]]
+        self.assertNotIn("Private flood report", titles)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url, {"q": "flood"})
+        titles = [c["title"] for c in response.data["results"]]
+        self.assertIn("Private flood report", titles)
+
+    def test_search_results_include_view_counts(self):
+        ContentView.record_view(self.flood, None, "10.0.0.1")
+
+        response = self.client.get(self.url, {"q": "river"})
+
+        row = next(c for c in response.data["results"] if c["id"] == str(self.flood.id))
+        self.assertEqual((row["view_count"], row["unique_viewer_count"]), (1, 1))
+
+
+class AnonymousClaimListCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        self.claim = Claim.objects.create(
+            title="Cached Claim",
+            description="Cached",
+            created_by=self.user,
+        )
+        self.url = reverse("claims:claim-list")
+
+    def test_second_anonymous_request_skips_database(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 1)
+
+    def test_claim_save_invalidates_cache(self):
+        self.client.get(self.url)
+        Claim.objects.create(
+            title="Fresh Claim", description="New", created_by=self.user
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 2)
+
+    def test_claim_delete_invalidates_cache(self):
+        self.client.get(self.url)
+        self.claim.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["count"], 0)
+
+    def test_tag_change_invalidates_cache(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            self.client.get(self.url)
+
+        self.claim.tags.add(ClaimTag.objects.create(name="science"))
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_authenticated_requests_bypass_cache(self):
+        self.client.get(self.url)
+        self.client.force_authenticate(user=self.user)
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
+
+    def test_zero_timeout_disables_cache(self):
+        with mock.patch("apps.claims.services.list_cache.CACHE_TIMEOUT", 0):
+            self.client.get(self.url)
+            with self.assertNumQueries(2):
+                self.client.get(self.url)
+
+    def test_deploy_check_requires_shared_cache(self):
+        from apps.claims.checks import check_list_cache_backend
+
+        locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+        shared = {"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+        with self.settings(CACHES=locmem):
+            self.assertEqual(
+                [e.id for e in check_list_cache_backend(None)], ["claims.E001"]
+            )
+        with self.settings(CACHES=shared):
+            self.assertEqual(check_list_cache_backend(None), [])
+
+
+class ClaimExportTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        self.claim = Claim.objects.create(
+            title="Exported Claim",
+            description="Line one, with a comma",
+            created_by=self.user,
+        )
+        self.claim.tags.add(ClaimTag.objects.create(name="science"))
+        Claim.objects.create(
+            title="Private Claim",
+            description="Hidden",
+            created_by=self.user,
+            is_public=False,
+        )
+        self.url = reverse("claims:claim-export")
+
+    def _body(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_ndjson_export_respects_visibility(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        rows = [json.loads(line) for line in self._body(response).splitlines()]
+        self.assertEqual([r["title"] for r in rows], ["Exported Claim"])
+        self.assertEqual(rows[0]["tags"], ["science"])
+
+    def test_csv_export(self):
+        response = self.client.get(self.url, {"file_format": "csv"})
+        reader = csv.DictReader(io.StringIO(self._body(response).decode()))
+        rows = list(reader)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["description"], "Line one, with a comma")
+
+    def test_gzip_export(self):
+        response = self.client.get(self.url, {"gzip": "1"})
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertNotIn("Content-Encoding", response)
+        self.assertIn('filename="claims.ndjson.gz"', response["Content-Disposition"])
+
+        lines = gzip.decompress(self._body(response)).splitlines()
+        self.assertEqual(len(lines), 1)
+
+    def test_unknown_format_is_rejected(self):
+        response = self.client.get(self.url, {"file_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ClaimViewTrackingTests(APITestCase):
+    def setUp(self):
+        get_recent_views.cache_clear()
+        self.addCleanup(get_recent_views.cache_clear)
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        self.claim = Claim.objects.create(
+            title="Tracked Claim", description="Counted", created_by=self.user
+        )
+        self.url = reverse("claims:claim-detail", args=[self.claim.id])
+
+    def test_anonymous_retrieve_records_view(self):
+        response = self.client.get(self.url, REMOTE_ADDR="10.0.0.7")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        view = ContentView.objects.get()
+        self.assertEqual(view.object_id, self.claim.id)
+        self.assertEqual(view.viewer_ip, "10.0.0.7")
+
+    def test_owner_views_are_not_recorded(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.get(self.url)
+
+        self.assertFalse(ContentView.objects.exists())
+
+    def test_not_modified_is_not_recorded(self):
+        etag = self.client.get(self.url, REMOTE_ADDR="10.0.0.7")["ETag"]
+        get_recent_views.cache_clear()
+
+        self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, REMOTE_ADDR="10.0.0.8")
+
+        self.assertEqual(ContentView.objects.count(), 1)
+
+    def test_tracking_failure_does_not_fail_request(self):
+        with mock.patch(
+            "apps.common.services.view_tracking.record_view",
+            side_effect=RuntimeError("database unavailable"),
+        ):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ClaimTrendingTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        self.hot = Claim.objects.create(title="Hot", description="d", created_by=self.user)
+        self.warm = Claim.objects.create(title="Warm", description="d", created_by=self.user)
+        self.private = Claim.objects.create(
+            title="Hidden", description="d", created_by=self.user, is_public=False
+        )
+        for claim, viewers in ((self.hot, 3), (self.warm, 1), (self.private, 5)):
+            for i in range(viewers):
+                ContentView.record_view(claim, None, f"10.0.0.{i}")
+        update_engagement(now=timezone.now() + timedelta(minutes=10))
+        self.url = reverse("claims:claim-trending")
+
+    def test_trending_is_ranked_and_respects_visibility(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row["title"] for row in response.data], ["Hot", "Warm"])
+        self.assertGreater(
+            response.data[0]["trending_score"], response.data[1]["trending_score"]
+        )
+
+    def test_owner_sees_own_private_claims(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(self.url)
+
+        self.assertEqual(
+            [row["title"] for row in response.data], ["Hidden", "Hot", "Warm"]
+        )
+
+    def test_limit(self):
+        response = self.client.get(self.url, {"limit": 1})
+        self.assertEqual([row["title"] for row in response.data], ["Hot"])
+
+        response = self.client.get(self.url, {"limit": "many"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ClaimConditionalGetTests(APITestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        self.claim = Claim.objects.create(
+            title="Polled Claim", description="Live", created_by=self.user
+        )
+        self.url = reverse("claims:claim-detail", args=[self.claim.id])
+
+    def test_retrieve_sets_validators(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+
+    def test_unchanged_claim_returns_304(self):
+        etag = self.client.get(self.url)["ETag"]
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_claim_update_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.claim.status = ClaimStatus.OPEN
+        self.claim.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_tag_change_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.claim.tags.add(ClaimTag.objects.create(name="live"))
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["tags"], ["live"])
+
+    def test_tag_clear_changes_etag(self):
+        tag = ClaimTag.objects.create(name="live")
+        self.claim.tags.add(tag)
+        etag = self.client.get(self.url)["ETag"]
+
+        tag.claims.clear()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["tags"], [])
+
+    def test_fieldset_is_part_of_etag(self):
+        etag = self.client.get(self.url, {"fields": "id,title"})["ETag"]
+
+        response = self.client.get(
+            self.url, {"fields": "title,id"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_creator_change_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.user.full_name = "Renamed Reporter"
+        self.user.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created_by"]["full_name"], "Renamed Reporter")
+
+    def test_private_claim_is_not_revealed_by_conditional_get(self):
+        self.claim.is_public = False
+        self.claim.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ClaimSparseFieldsetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            email="creator@example.com", password="testpass123"
+        )
+        self.claim = Claim.objects.create(
+            title="Sparse Claim", description="Trimmed", created_by=self.user
+        )
+
+    def test_list_fields_param_trims_output(self):
+        response = self.client.get(
+            reverse("claims:claim-list"), {"fields": "id,title"}
+        )
+        self.assertEqual(
+            response.data["results"],
+            [{"id": str(self.claim.id), "title": "Sparse Claim"}],
+        )
+
+    def test_values_path_matches_serializer_output(self):
+        response = self.client.get(reverse("claims:claim-list"))
+        claim = annotate_view_stats(Claim.objects.filter(pk=self.claim.pk)).get()
+        expected = ClaimListSerializer(claim).data
+        self.assertEqual(response.data["results"], [dict(expected)])
+
+    def test_sparse_cursor_pagination(self):
+        response = self.client.get(
+            reverse("claims:claim-list"),
+            {"fields": "title", "pagination": "cursor"},
+        )
+        self.assertEqual(response.data["results"], [{"title": "Sparse Claim"}])
+
+    def test_detail_fields_param(self):
+        response = self.client.get(
+            reverse("claims:claim-detail", args=[self.claim.id]),
+            {"fields": "title,tags"},
+        )
+        self.assertEqual(set(response.data), {"title", "tags"})
+
+    def test_unknown_fields_return_full_representation(self):
+        response = self.client.get(
+            reverse("claims:claim-list"), {"fields": "nope"}
+        )
+        self.assertIn("status", response.data["results"][0])
@@ -1,8 +1,11 @@
-from django.db.models import Q
 from rest_framework.generics import CreateAPIView, ListAPIView, RetrieveAPIView
 from rest_framework.permissions import IsAuthenticated
 
 from apps.claims.models import Claim
+from apps.claims.pagination import ClaimPageNumberPagination, visible_claims_page
+from apps.claims.queries.visibility import count_visible_claims, visible_claims
+from apps.common.queries.analytics import annotate_view_stats
+from apps.common.views import ViewTrackingMixin
 from apps.claims.serializers.claim import (
     ClaimCreateSerializer,
     ClaimDetailSerializer,
@@ -20,24 +23,22 @@ class ClaimCreateView(CreateAPIView):
 
 class ClaimListView(ListAPIView):
     serializer_class = ClaimListSerializer
+    pagination_class = ClaimPageNumberPagination
 
     def get_queryset(self):
-        user = self.request.user
-        if user.is_authenticated:
-            return Claim.objects.filter(
-                Q(is_public=True) | Q(created_by=user)
-            ).order_by("-created_at")
-        return Claim.objects.filter(is_public=True).order_by("-created_at")
+        return annotate_view_stats(visible_claims_page(self, Claim.objects.all()))
 
+    def count_visible_claims(self) -> int:
+        return count_visible_claims(self.request.user)
 
 
-class ClaimDetailView(RetrieveAPIView):
+
+class ClaimDetailView(ViewTrackingMixin, RetrieveAPIView):
     serializer_class = ClaimDetailSerializer
 
     def get_queryset(self):
-        user = self.request.user
-        if user.is_authenticated:
-            return Claim.objects.filter(
-                Q(is_public=True) | Q(created_by=user)
-            )
-        return Claim.objects.filter(is_public=True)
+        return (
+            visible_claims(self.request.user)
+            .select_related("created_by")
+            .prefetch_related("tags")
+        )
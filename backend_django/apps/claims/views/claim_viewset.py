@@ -1,27 +1,75 @@
-from rest_framework import viewsets
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404, StreamingHttpResponse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from django.db.models import Q
+from rest_framework.response import Response
 
 from apps.claims.models import Claim
+from apps.claims.queries.search import search_claims, search_matches
+from apps.claims.services.ingest import ingest_claims
+from apps.claims.services.export import EXPORT_FORMATS, stream_claims
+from apps.claims.services.list_cache import get_or_build_public_list
+from apps.claims.queries.visibility import (
+    VISIBLE_ORDERING,
+    count_visible_claims,
+    visible_claims,
+)
+from apps.claims.pagination import (
+    ClaimCursorPagination,
+    ClaimPageNumberPagination,
+    visible_claims_page,
+    wants_cursor_pagination,
+)
 from apps.claims.serializers import ClaimCreateSerializer, ClaimDetailSerializer, ClaimListSerializer
 from apps.claims.permissions import (
     IsClaimOwner,
     IsClaimPublicOrOwner,
     CanCreateClaim,
 )
+from apps.common.queries.analytics import annotate_view_stats
+from apps.common.services.engagement import TRENDING_SIZE, get_trending
+from apps.common.serializers import render_values, values_columns
+from apps.common.views import ConditionalRetrieveMixin, ViewTrackingMixin
+from apps.user_auth.serializers import UserPublicSerializer
+
+# Actions rendered with ClaimDetailSerializer (nested created_by + tags).
+DETAIL_ACTIONS = ["retrieve", "update", "partial_update"]
+
+MAX_BATCH_SIZE = 1000
 
-class ClaimViewSet(viewsets.ModelViewSet):
+DEFAULT_TRENDING_LIMIT = 20
+
+
+class ClaimViewSet(ViewTrackingMixin, ConditionalRetrieveMixin, viewsets.ModelViewSet):
     queryset = Claim.objects.all()
+    pagination_class = ClaimPageNumberPagination
+    # Nested created_by data; users have no updated_at to bump.
+    conditional_related_fields = tuple(
+        f"created_by__{name}" for name in UserPublicSerializer.Meta.fields if name != "id"
+    )
+
+    @property
+    def paginator(self):
+        # Page-number pagination stays the default; infinite-scroll clients
+        # opt into keyset paging with ?pagination=cursor.
+        if not hasattr(self, "_paginator"):
+            if self.action == "list" and wants_cursor_pagination(self.request):
+                self._paginator = ClaimCursorPagination()
+            else:
+                return super().paginator
+        return self._paginator
 
     def get_serializer_class(self):
         if self.action == "create":
             return ClaimCreateSerializer
-        if self.action == "list":
+        if self.action in ["list", "search", "trending"]:
             return ClaimListSerializer
         return ClaimDetailSerializer
 
     def get_permissions(self):
-        if self.action == "create":
+        if self.action in ["create", "batch_create"]:
             # Only authenticated contributors can create claims
             permission_classes = [IsAuthenticated, CanCreateClaim]
         elif self.action in ["update", "partial_update", "destroy"]:
@@ -30,20 +78,163 @@ class ClaimViewSet(viewsets.ModelViewSet):
         elif self.action == "retrieve":
             # Public claims are visible to all, private claims only to owner
             permission_classes = [IsClaimPublicOrOwner]
-        elif self.action == "list":
-            # Anyone can list public claims
+        elif self.action in ["list", "search", "export", "trending"]:
+            # Anyone can list, search, export or rank public claims
             permission_classes = [AllowAny]
         else:
             permission_classes = [IsAuthenticated]
 
         return [permission() for permission in permission_classes]
 
+    def list(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return Response(self._list_data())
+
+        # Anonymous pages are identical for every visitor, so serve them from
+        # the cache; claim and tag writes invalidate it via signals.
+        return Response(get_or_build_public_list(request, self._list_data))
+
+    def _list_data(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = self.get_serializer()
+
+        # Plain-column fieldsets skip model instantiation entirely.
+        columns = values_columns(serializer, queryset.query.annotations)
+        if columns is not None:
+            # created_at is always fetched: cursor pagination reads it.
+            queryset = queryset.values(*{*columns.values(), "created_at"})
+
+        page = self.paginate_queryset(queryset)
+        rows = page if page is not None else queryset
+
+        if columns is not None:
+            data = render_values(serializer, rows, columns)
+        else:
+            data = self.get_serializer(rows, many=True).data
+
+        if page is not None:
+            return self.get_paginated_response(data).data
+        return data
+
     def get_queryset(self):
-        user = self.request.user
-        if user.is_authenticated:
-            return Claim.objects.filter(
-                Q(is_public=True) | Q(created_by=user)
-            ).order_by("-created_at")
-        return Claim.objects.filter(is_public=True).order_by("-created_at")
-
-    
+        if self.action == "list":
+            # Each visibility branch is cut to what the requested page needs.
+            return annotate_view_stats(visible_claims_page(self, Claim.objects.all()))
+        if self.action == "search":
+            return annotate_view_stats(search_claims(self.request.user, self.search_term()))
+
+        queryset = visible_claims(self.request.user, self._lookup_claims()).order_by(
+            *VISIBLE_ORDERING
+        )
+        if self.action in DETAIL_ACTIONS:
+            queryset = queryset.select_related("created_by").prefetch_related("tags")
+        return queryset
+
+    def _lookup_claims(self):
+        """
+        The claim named in the URL, if any, so the visibility branches look
+        up that one row instead of merging every visible id.
+        """
+        lookup = self.kwargs.get(self.lookup_url_kwarg or self.lookup_field)
+        if lookup is None:
+            return Claim.objects.all()
+        try:
+            return Claim.objects.filter(**{self.lookup_field: lookup})
+        except (TypeError, ValueError, DjangoValidationError):
+            raise Http404
+
+    def count_visible_claims(self) -> int:
+        """
+        Total for page-number pagination, counted without the page window.
+        """
+        queryset = search_matches(self.search_term()) if self.action == "search" else None
+        return count_visible_claims(self.request.user, queryset)
+
+    def search_term(self) -> str:
+        term = self.request.query_params.get("q", "").strip()
+        if not term:
+            raise ValidationError({"q": "A search term is required."})
+        return term
+
+    @action(detail=False, methods=["get"])
+    def search(self, request):
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=["get"])
+    def trending(self, request):
+        """
+        Claims ranked by engagement velocity, served from the ranking that
+        ``update_engagement`` precomputes.
+        """
+        try:
+            limit = int(request.query_params.get("limit", DEFAULT_TRENDING_LIMIT))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        limit = max(1, min(limit, TRENDING_SIZE))
+
+        ranking = get_trending(Claim)
+        ranked_claims = Claim.objects.filter(id__in=[object_id for object_id, _ in ranking])
+        claims = {
+            str(claim.id): claim
+            for claim in annotate_view_stats(
+                visible_claims(request.user, ranked_claims)
+            )
+        }
+        # Private claims drop out here, so rank on what this user may see.
+        ranked = [
+            (claims[object_id], velocity)
+            for object_id, velocity in ranking
+            if object_id in claims
+        ][:limit]
+
+        data = self.get_serializer([claim for claim, _ in ranked], many=True).data
+        for row, (_, velocity) in zip(data, ranked):
+            row["trending_score"] = round(velocity, 3)
+        return Response(data)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        # "format" is reserved by DRF for content negotiation.
+        export_format = request.query_params.get("file_format", "ndjson")
+        if export_format not in EXPORT_FORMATS:
+            raise ValidationError(
+                {"file_format": f"Choose one of: {', '.join(EXPORT_FORMATS)}."}
+            )
+        compress = request.query_params.get("gzip") in ("1", "true")
+
+        response = StreamingHttpResponse(
+            stream_claims(
+                visible_claims(request.user),
+                export_format,
+                compress=compress,
+            ),
+            # A .gz file download, not a transfer encoding: clients must
+            # not transparently inflate it and save it under the .gz name.
+            content_type="application/gzip" if compress else EXPORT_FORMATS[export_format],
+        )
+        filename = f"claims.{export_format}" + (".gz" if compress else "")
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @action(detail=False, methods=["post"], url_path="batch")
+    def batch_create(self, request):
+        items = request.data
+        if not isinstance(items, list):
+            raise ValidationError({"non_field_errors": ["Expected a list of claims."]})
+        if len(items) > MAX_BATCH_SIZE:
+            raise ValidationError(
+                {"non_field_errors": [f"At most {MAX_BATCH_SIZE} claims per batch."]}
+            )
+
+        result = ingest_claims(items, created_by=request.user)
+        response_status = (
+            status.HTTP_207_MULTI_STATUS if result["errors"] else status.HTTP_201_CREATED
+        )
+        return Response(result, status=response_status)
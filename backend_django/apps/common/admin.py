@@ -17,7 +17,7 @@ class ContentViewAdmin(admin.ModelAdmin):
         "last_viewed",
         "created_at",
     ]
-    list_filter = ["content_type", "last_viewed", "created_at"]
+    list_filter = ["content_type", "month", "last_viewed", "created_at"]
     date_hierarchy = "last_viewed"
     readonly_fields = [
         "content_type",
@@ -25,12 +25,13 @@ class ContentViewAdmin(admin.ModelAdmin):
         "content_object",
         "user",
         "viewer_ip",
+        "month",
         "created_at",
         "updated_at",
     ]
     fieldsets = (
         (None, {"fields": ("content_type", "object_id", "content_object")}),
-        (_("View Details"), {"fields": ("user", "viewer_ip", "last_viewed")}),
+        (_("View Details"), {"fields": ("user", "viewer_ip", "last_viewed", "month")}),
         (
             _("Timestamps"),
             {"fields": ("created_at", "updated_at"), "classes": ("collapse",)},
@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class CommonConfig(AppConfig):
     name = "apps.common"
     verbose_name = _("Common")
+
+    def ready(self):
+        import apps.common.checks  # noqa
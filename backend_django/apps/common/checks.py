@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+from django.core.checks import Error, Tags, register
+
+
+@register(Tags.database, deploy=True)
+def check_view_partitions(app_configs, databases=None, **kwargs):
+    """
+    ContentView has no DEFAULT partition, so a view for a month without one
+    fails to insert. The hourly rollup creates them ahead of time; a missing
+    partition for this or next month means neither it nor
+    ``create_view_partitions`` is running.
+    """
+    if not databases or "default" not in databases:
+        return []
+
+    from apps.common.services.partitions import add_months, list_partitions, month_start
+
+    this_month = month_start(datetime.now(timezone.utc).date())
+    existing = list_partitions()
+    missing = [
+        month
+        for month in (this_month, add_months(this_month, 1))
+        if month not in existing
+    ]
+    if not missing:
+        return []
+    return [
+        Error(
+            "ContentView has no partition for "
+            + ", ".join(month.strftime("%Y-%m") for month in missing)
+            + "; views for those months can't be recorded.",
+            hint=(
+                "Run `python manage.py create_view_partitions` and schedule "
+                "`python manage.py rollup_views` hourly."
+            ),
+            id="common.E001",
+        )
+    ]
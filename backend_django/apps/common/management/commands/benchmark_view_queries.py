@@ -0,0 +1,88 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.common.queries.view_plans import (
+    DEFAULT_BUDGET_MS,
+    explain,
+    hot_view_queries,
+    plan_problems,
+    seed_content_views,
+)
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed a synthetic ContentView table, EXPLAIN ANALYZE every hot query "
+        "and fail if a plan falls back to a sequential scan or exceeds the "
+        "latency budget."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=1_000_000)
+        parser.add_argument("--objects", type=int, default=10_000)
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print the full JSON plan for every query.",
+        )
+        parser.add_argument(
+            "--keep",
+            action="store_true",
+            help="Keep the seeded rows instead of rolling back.",
+        )
+
+    def handle(self, *args, **options):
+        failures = {}
+        with transaction.atomic():
+            users = self._create_users(options["users"])
+            object_ids = [uuid.uuid4() for _ in range(options["objects"])]
+            content_type = ContentType.objects.get_for_model(User)
+
+            self.stdout.write(f"Seeding {options['rows']:,} views")
+            seed_content_views(
+                1,
+                options["rows"],
+                content_type.id,
+                object_ids,
+                [user.id for user in users],
+            )
+
+            queries = hot_view_queries(content_type.id, object_ids[0], "10.0.0.3")
+            for name, queryset in queries.items():
+                result = explain(queryset)
+                problems = plan_problems(result, options["budget_ms"])
+                style = self.style.ERROR if problems else self.style.SUCCESS
+                self.stdout.write(style(f"{name}: {result['Execution Time']:.2f} ms"))
+                for problem in problems:
+                    self.stdout.write(f"  {problem}")
+                if options["verbose_plans"]:
+                    self.stdout.write(queryset.explain(analyze=True, buffers=True))
+                if problems:
+                    failures[name] = problems
+
+            if not options["keep"]:
+                transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"Plan regressions in: {', '.join(failures)}")
+
+    def _create_users(self, count):
+        users = [
+            User(
+                id=uuid.uuid4(),
+                email=f"bench_{i}_{uuid.uuid4().hex[:6]}@example.com",
+                username=f"bench_{i}_{uuid.uuid4().hex[:6]}",
+            )
+            for i in range(count)
+        ]
+        for user in users:
+            user.set_unusable_password()
+        return User.objects.bulk_create(users)
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from apps.common.services.partitions import PARTITIONS_AHEAD, ensure_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Create monthly ContentView partitions ahead of time. Schedule it at "
+        "least monthly; views for a month without a partition cannot be stored."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead",
+            type=int,
+            default=PARTITIONS_AHEAD,
+            help="Months to create beyond the current one.",
+        )
+
+    def handle(self, *args, **options):
+        created = ensure_partitions(ahead=options["ahead"])
+        self.stdout.write(f"{len(created)} partition(s) created")
+        for name in created:
+            self.stdout.write(f"  {name}")
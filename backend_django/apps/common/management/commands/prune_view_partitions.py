@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from apps.common.services.partitions import RETENTION_MONTHS, prune_partitions
+
+
+class Command(BaseCommand):
+    help = (
+        "Drop (or archive) whole monthly ContentView partitions older than the "
+        "retention window. Months not yet covered by the hourly and daily rollups "
+        "are kept."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-months",
+            type=int,
+            default=RETENTION_MONTHS,
+            help="Full months to keep before the current one.",
+        )
+        parser.add_argument(
+            "--archive",
+            action="store_true",
+            help="Detach into the archive schema instead of dropping.",
+        )
+
+    def handle(self, *args, **options):
+        removed = prune_partitions(
+            keep_months=options["keep_months"], archive=options["archive"]
+        )
+        action = "archived" if options["archive"] else "dropped"
+        self.stdout.write(f"{len(removed)} partition(s) {action}")
+        for name in removed:
+            self.stdout.write(f"  {name}")
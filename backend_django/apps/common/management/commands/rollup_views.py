@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.services.rollups import (
+    backfill_view_totals,
+    rebuild_viewer_sketches,
+    run_rollups,
+)
+
+
+class Command(BaseCommand):
+    help = "Roll new ContentView rows up into hourly and daily ViewRollup buckets."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backfill-totals",
+            action="store_true",
+            help="Once, after upgrading: build ViewTotal from already rolled-up views.",
+        )
+        parser.add_argument(
+            "--rebuild-sketches",
+            action="store_true",
+            help="Refold retained views into the unique-viewer sketches.",
+        )
+
+    def handle(self, *args, **options):
+        if options["backfill_totals"]:
+            try:
+                written = backfill_view_totals()
+            except ValueError as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(f"{written} view total(s) written")
+            return
+
+        if options["rebuild_sketches"]:
+            written = rebuild_viewer_sketches()
+            self.stdout.write(f"{written} viewer sketch(es) written")
+            return
+
+        for granularity, written in run_rollups().items():
+            self.stdout.write(f"{granularity}: {written} bucket(s) written")
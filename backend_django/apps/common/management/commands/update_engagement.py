@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.common.services.engagement import update_engagement
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold new ContentView rows into decayed engagement scores and refresh "
+        "trending rankings. Incremental; schedule it every minute."
+    )
+
+    def handle(self, *args, **options):
+        updated = update_engagement()
+        self.stdout.write(f"{updated} object(s) updated")
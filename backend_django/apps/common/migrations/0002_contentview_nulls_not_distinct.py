@@ -0,0 +1,37 @@
+# Generated by Django 6.0.1 on 2026-10-18 13:40
+
+from django.db import migrations, models
+
+DEDUPE_SQL = """
+DELETE FROM common_contentview AS older
+USING common_contentview AS newer
+WHERE older.content_type_id = newer.content_type_id
+  AND older.object_id = newer.object_id
+  AND older.user_id IS NOT DISTINCT FROM newer.user_id
+  AND older.viewer_ip IS NOT DISTINCT FROM newer.viewer_ip
+  AND (older.last_viewed, older.id) < (newer.last_viewed, newer.id);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0001_initial"),
+    ]
+
+    operations = [
+        # Anonymous duplicates were allowed while NULLs were distinct.
+        migrations.RunSQL(DEDUPE_SQL, reverse_sql=migrations.RunSQL.noop),
+        migrations.RemoveConstraint(
+            model_name="contentview",
+            name="unique_content_view_per_user_or_ip",
+        ),
+        migrations.AddConstraint(
+            model_name="contentview",
+            constraint=models.UniqueConstraint(
+                fields=("content_type", "object_id", "user", "viewer_ip"),
+                name="unique_content_view_per_user_or_ip",
+                nulls_distinct=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 6.0.1 on 2026-10-18 14:52
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0002_contentview_nulls_not_distinct"),
+        ("contenttypes", "0002_remove_content_type_name"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ViewerSketch",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("object_id", models.UUIDField()),
+                ("bucket", models.DateField()),
+                ("registers", models.BinaryField()),
+                (
+                    "content_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Viewer Sketch",
+                "verbose_name_plural": "Viewer Sketches",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("content_type", "object_id", "bucket"),
+                        name="unique_viewer_sketch_per_object_and_bucket",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,151 @@
+# Generated by Django 6.0.1 on 2026-10-18 16:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+import apps.common.models.content_view
+
+# Months created ahead of the current one; create_view_partitions keeps this
+# window topped up afterwards.
+PARTITIONS_AHEAD = 3
+
+
+def _add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return month.replace(year=index // 12, month=index % 12 + 1, day=1)
+
+
+def partition_content_views(apps, schema_editor):
+    """
+    Rebuild common_contentview as a table range-partitioned on ``month``.
+
+    Postgres cannot convert a table in place, so rows are copied into a new
+    partitioned table which then takes over the old name. Primary key and
+    unique constraint include ``month`` because Postgres requires the
+    partition key in both.
+    """
+    ContentView = apps.get_model("common", "ContentView")
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    ContentType = apps.get_model("contenttypes", "ContentType")
+
+    quote = schema_editor.quote_name
+    table = ContentView._meta.db_table
+    staging = f"{table}_partitioned"
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            CREATE TABLE {quote(staging)} (
+                id uuid NOT NULL,
+                created_at timestamp with time zone NOT NULL,
+                updated_at timestamp with time zone NOT NULL,
+                object_id uuid NOT NULL,
+                viewer_ip inet NULL,
+                last_viewed timestamp with time zone NOT NULL,
+                content_type_id integer NOT NULL,
+                user_id uuid NULL,
+                month date NOT NULL
+            ) PARTITION BY RANGE (month)
+            """
+        )
+
+        cursor.execute(
+            f"""
+            SELECT DISTINCT date_trunc('month', created_at AT TIME ZONE 'UTC')::date
+            FROM {quote(table)}
+            """
+        )
+        months = {row[0] for row in cursor.fetchall()}
+        cursor.execute("SELECT date_trunc('month', now() AT TIME ZONE 'UTC')::date")
+        current = cursor.fetchone()[0]
+        months.update(_add_months(current, offset) for offset in range(PARTITIONS_AHEAD + 1))
+
+        for month in sorted(months):
+            cursor.execute(
+                f"CREATE TABLE {quote(f'{table}_y{month.year:04d}m{month.month:02d}')} "
+                f"PARTITION OF {quote(staging)} FOR VALUES FROM (%s) TO (%s)",
+                [month, _add_months(month, 1)],
+            )
+
+        cursor.execute(
+            f"""
+            INSERT INTO {quote(staging)} (
+                id, created_at, updated_at, object_id, viewer_ip, last_viewed,
+                content_type_id, user_id, month
+            )
+            SELECT
+                id, created_at, updated_at, object_id, viewer_ip, last_viewed,
+                content_type_id, user_id,
+                date_trunc('month', created_at AT TIME ZONE 'UTC')::date
+            FROM {quote(table)}
+            """
+        )
+        cursor.execute(f"DROP TABLE {quote(table)}")
+        cursor.execute(f"ALTER TABLE {quote(staging)} RENAME TO {quote(table)}")
+
+        cursor.execute(
+            f"ALTER TABLE {quote(table)} ADD CONSTRAINT {quote(f'{table}_pkey')} "
+            "PRIMARY KEY (id, month)"
+        )
+        cursor.execute(
+            f"""
+            ALTER TABLE {quote(table)}
+            ADD CONSTRAINT unique_content_view_per_viewer_per_month
+            UNIQUE NULLS NOT DISTINCT (content_type_id, object_id, user_id, viewer_ip, month)
+            """
+        )
+        for column, target in (
+            ("content_type_id", ContentType._meta.db_table),
+            ("user_id", User._meta.db_table),
+        ):
+            cursor.execute(
+                f"""
+                ALTER TABLE {quote(table)}
+                ADD CONSTRAINT {quote(f'{table}_{column}_fk')}
+                FOREIGN KEY ({column}) REFERENCES {quote(target)} (id)
+                DEFERRABLE INITIALLY DEFERRED
+                """
+            )
+            cursor.execute(
+                f"CREATE INDEX {quote(f'{table}_{column}_idx')} ON {quote(table)} ({column})"
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0004_viewrollup_rollupwatermark"),
+        ("contenttypes", "0002_remove_content_type_name"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddField(
+                    model_name="contentview",
+                    name="month",
+                    field=models.DateField(
+                        default=apps.common.models.content_view.current_month,
+                        editable=False,
+                    ),
+                ),
+                migrations.RemoveConstraint(
+                    model_name="contentview",
+                    name="unique_content_view_per_user_or_ip",
+                ),
+                migrations.AddConstraint(
+                    model_name="contentview",
+                    constraint=models.UniqueConstraint(
+                        fields=("content_type", "object_id", "user", "viewer_ip", "month"),
+                        name="unique_content_view_per_viewer_per_month",
+                        nulls_distinct=False,
+                    ),
+                ),
+            ],
+            # Irreversible: un-partitioning would have to merge monthly rows.
+            database_operations=[
+                migrations.RunPython(partition_content_views),
+            ],
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.1 on 2026-10-18 16:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0005_partition_contentview_by_month"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contentview",
+            index=models.Index(
+                fields=["content_type", "object_id", "created_at"],
+                include=["user", "viewer_ip"],
+                name="content_view_object_recent_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contentview",
+            index=models.Index(
+                fields=["user", "created_at"], name="content_view_user_recent_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contentview",
+            index=models.Index(fields=["created_at"], name="content_view_created_idx"),
+        ),
+        # The plain FK indexes from 0005 are prefixes of the unique constraint
+        # and content_view_user_recent_idx.
+        migrations.RunSQL(
+            sql=[
+                "DROP INDEX IF EXISTS common_contentview_content_type_id_idx",
+                "DROP INDEX IF EXISTS common_contentview_user_id_idx",
+            ],
+            reverse_sql=[
+                "CREATE INDEX common_contentview_content_type_id_idx "
+                "ON common_contentview (content_type_id)",
+                "CREATE INDEX common_contentview_user_id_idx "
+                "ON common_contentview (user_id)",
+            ],
+        ),
+    ]
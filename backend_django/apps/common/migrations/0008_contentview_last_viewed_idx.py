@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0007_engagementscore_trendingranking_engagementwatermark"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contentview",
+            index=models.Index(fields=["last_viewed"], name="content_view_last_viewed_idx"),
+        ),
+    ]
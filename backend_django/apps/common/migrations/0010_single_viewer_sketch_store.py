@@ -0,0 +1,58 @@
+# Generated by Django 6.0.1 on 2026-10-18 22:10
+
+from django.db import migrations, models
+
+# ViewTotal.viewers already used the Coalesce(user, ip) identity; it becomes
+# the object's all-time sketch. Daily sketches were keyed on (user, ip) and
+# can't be converted, so they are dropped; `rollup_views --rebuild-sketches`
+# refolds the retained rows.
+MOVE_TOTALS_SQL = """
+DELETE FROM common_viewersketch;
+INSERT INTO common_viewersketch (
+    id, created_at, updated_at, content_type_id, object_id, bucket, registers
+)
+SELECT gen_random_uuid(), now(), now(), content_type_id, object_id, NULL, viewers
+FROM common_viewtotal;
+"""
+
+RESTORE_TOTALS_SQL = """
+UPDATE common_viewtotal AS t
+SET viewers = s.registers
+FROM common_viewersketch AS s
+WHERE s.bucket IS NULL
+  AND s.content_type_id = t.content_type_id
+  AND s.object_id = t.object_id;
+DELETE FROM common_viewersketch WHERE bucket IS NULL;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("common", "0009_viewtotal"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="viewersketch",
+            name="bucket",
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.RemoveConstraint(
+            model_name="viewersketch",
+            name="unique_viewer_sketch_per_object_and_bucket",
+        ),
+        migrations.AddConstraint(
+            model_name="viewersketch",
+            constraint=models.UniqueConstraint(
+                fields=("content_type", "object_id", "bucket"),
+                name="unique_viewer_sketch_per_object_and_bucket",
+                nulls_distinct=False,
+            ),
+        ),
+        migrations.RunSQL(MOVE_TOTALS_SQL, reverse_sql=RESTORE_TOTALS_SQL),
+        migrations.RemoveField(
+            model_name="viewtotal",
+            name="viewers",
+        ),
+    ]
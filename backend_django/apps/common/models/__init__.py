@@ -1,2 +1,6 @@
 from .base import TimeStampedModel
-from .content_view import ContentView
\ No newline at end of file
+from .content_view import ContentView
+from .engagement import EngagementScore, EngagementWatermark, TrendingRanking
+from .view_rollup import RollupGranularity, RollupWatermark, ViewRollup
+from .view_total import ViewTotal
+from .viewer_sketch import ViewerSketch
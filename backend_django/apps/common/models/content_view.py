@@ -11,6 +11,14 @@ from .base import TimeStampedModel
 
 User = settings.AUTH_USER_MODEL
 
+
+def current_month(now=None):
+    """
+    Partition key for a view recorded at ``now``: the first day of its UTC month.
+    """
+    return (now or timezone.now()).date().replace(day=1)
+
+
 class ContentView(TimeStampedModel):
     content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
     object_id = models.UUIDField()
@@ -28,15 +36,38 @@ class ContentView(TimeStampedModel):
 
     last_viewed = models.DateTimeField(auto_now=True)
 
+    # The table is range-partitioned on this column (see
+    # services/partitions.py), so a viewer gets one row per object per month.
+    month = models.DateField(default=current_month, editable=False)
+
     class Meta:
         verbose_name = _("Content View")
         verbose_name_plural = _("Content Views")
         constraints = [
+            # NULL user/IP must still collide so anonymous views dedupe and
+            # bulk upserts can target this constraint with ON CONFLICT.
+            # Postgres requires the partition key in every unique constraint.
             models.UniqueConstraint(
-                fields=["content_type", "object_id", "user", "viewer_ip"],
-                name="unique_content_view_per_user_or_ip",
+                fields=["content_type", "object_id", "user", "viewer_ip", "month"],
+                name="unique_content_view_per_viewer_per_month",
+                nulls_distinct=False,
             )
         ]
+        indexes = [
+            # Per-object counts and distinct viewers, optionally since a
+            # watermark; INCLUDE makes them index-only scans.
+            models.Index(
+                fields=["content_type", "object_id", "created_at"],
+                include=["user", "viewer_ip"],
+                name="content_view_object_recent_idx",
+            ),
+            # A user's recent views; also serves the user FK.
+            models.Index(fields=["user", "created_at"], name="content_view_user_recent_idx"),
+            # Rollup windows and the first-view lookup.
+            models.Index(fields=["created_at"], name="content_view_created_idx"),
+            # Viewers seen in a rollup window, for the unique-viewer sketches.
+            models.Index(fields=["last_viewed"], name="content_view_last_viewed_idx"),
+        ]
 
     def __str__(self) -> str:
         viewer = getattr(self.user, "full_name", None) if self.user else None
@@ -51,15 +82,18 @@ class ContentView(TimeStampedModel):
         viewer_ip: Optional[str],
     ) -> None:
         content_type = ContentType.objects.get_for_model(content_object)
+        now = timezone.now()
 
         lookup = {
             "content_type": content_type,
             "object_id": content_object.id,
             "user": user,
             "viewer_ip": viewer_ip,
+            "month": current_month(now),
         }
 
-        cls.objects.update_or_create(
-            **lookup,
-            defaults={"last_viewed": timezone.now()},
-        )
\ No newline at end of file
+        view, created = cls.objects.get_or_create(**lookup)
+        if not created:
+            # The rollup job folds this viewer into the day's sketch from
+            # last_viewed, so no sketch is touched here.
+            cls.objects.filter(pk=view.pk).update(last_viewed=now, updated_at=now)
@@ -0,0 +1,65 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .base import TimeStampedModel
+
+
+class EngagementScore(TimeStampedModel):
+    """
+    Exponentially decayed view count for one object, kept in log space
+    relative to a fixed epoch (see ``services/engagement.py``).
+
+    Every object decays by the same factor over time, so ordering by
+    ``log_score`` is ordering by current velocity and only objects with new
+    views ever need their row touched.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.UUIDField()
+    log_score = models.FloatField()
+    last_view_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = _("Engagement Score")
+        verbose_name_plural = _("Engagement Scores")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"],
+                name="unique_engagement_score_per_object",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["content_type", "-log_score"],
+                name="engagement_score_rank_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.content_type} {self.object_id} ({self.log_score:.3f})"
+
+
+class TrendingRanking(models.Model):
+    """
+    Precomputed top-N of one content type by engagement velocity.
+
+    ``entries`` is ``[[object_id, log_score], ...]`` in rank order, so serving
+    the ranking is a single-row read.
+    """
+    content_type = models.OneToOneField(ContentType, on_delete=models.CASCADE)
+    entries = models.JSONField(default=list)
+    computed_at = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"Trending {self.content_type} at {self.computed_at}"
+
+
+class EngagementWatermark(models.Model):
+    """
+    ContentView rows created before ``processed_until`` are already folded
+    into EngagementScore. A single row.
+    """
+    processed_until = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"Engagement until {self.processed_until}"
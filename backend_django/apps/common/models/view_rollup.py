@@ -0,0 +1,59 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .base import TimeStampedModel
+
+
+class RollupGranularity(models.TextChoices):
+    HOUR = "hour", _("Hour")
+    DAY = "day", _("Day")
+
+
+class ViewRollup(TimeStampedModel):
+    """
+    Pre-aggregated ContentView counts for one object and one closed time bucket.
+
+    ``views`` counts ContentView rows first recorded in the bucket (so summing
+    every bucket gives ``get_view_count``); ``unique_viewers`` counts distinct
+    users, or IPs for anonymous viewers, among them.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.UUIDField()
+    granularity = models.CharField(max_length=10, choices=RollupGranularity.choices)
+    bucket_start = models.DateTimeField()
+    views = models.PositiveIntegerField(default=0)
+    unique_viewers = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = _("View Rollup")
+        verbose_name_plural = _("View Rollups")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "granularity", "bucket_start"],
+                name="unique_view_rollup_per_bucket",
+            )
+        ]
+        indexes = [
+            models.Index(
+                fields=["granularity", "bucket_start"],
+                name="view_rollup_bucket_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.content_type} {self.object_id} {self.granularity} {self.bucket_start}"
+
+
+class RollupWatermark(models.Model):
+    """
+    End of the last bucket rolled up for a granularity; rows created before
+    it are already reflected in ViewRollup.
+    """
+    granularity = models.CharField(
+        max_length=10, choices=RollupGranularity.choices, unique=True
+    )
+    processed_until = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.granularity} rollups until {self.processed_until}"
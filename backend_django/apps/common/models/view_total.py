@@ -0,0 +1,33 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .base import TimeStampedModel
+
+
+class ViewTotal(TimeStampedModel):
+    """
+    All-time view totals for one object, up to the hourly rollup watermark.
+
+    ``views`` counts ContentView rows, as ``get_view_count`` does;
+    ``unique_viewers`` is the estimate of the object's all-time
+    ViewerSketch. Both are folded in by the hourly rollup, so list pages
+    read one row per object instead of aggregating the raw table.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.UUIDField()
+    views = models.PositiveIntegerField(default=0)
+    unique_viewers = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = _("View Total")
+        verbose_name_plural = _("View Totals")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id"],
+                name="unique_view_total_per_object",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.content_type} {self.object_id}: {self.views} views"
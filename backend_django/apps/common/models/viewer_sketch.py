@@ -0,0 +1,36 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from .base import TimeStampedModel
+
+
+class ViewerSketch(TimeStampedModel):
+    """
+    HyperLogLog sketch of the distinct viewers of one object on one day, or
+    over all time when ``bucket`` is null. Viewers are identified as in
+    ``services.unique_viewers.viewer_identity``.
+
+    Sketches merge losslessly, so any range of days or set of objects can be
+    estimated by unioning their rows.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.UUIDField()
+    bucket = models.DateField(null=True, blank=True)
+    registers = models.BinaryField()
+
+    class Meta:
+        verbose_name = _("Viewer Sketch")
+        verbose_name_plural = _("Viewer Sketches")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["content_type", "object_id", "bucket"],
+                name="unique_viewer_sketch_per_object_and_bucket",
+                # One all-time (null bucket) sketch per object, which the
+                # rollup upserts with ON CONFLICT.
+                nulls_distinct=False,
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.content_type} {self.object_id} viewers on {self.bucket}"
@@ -1,22 +1,291 @@
+def _objects_condition(content_objects):
+    """
+    Q matching the given objects (of any types) by content type and id.
+    """
+    from django.contrib.contenttypes.models import ContentType
+    from django.db.models import Q
+
+    ids_by_type = {}
+    for obj in content_objects:
+        ct = ContentType.objects.get_for_model(obj)
+        ids_by_type.setdefault(ct.id, []).append(obj.pk)
+
+    if not ids_by_type:
+        return None
+
+    condition = Q()
+    for ct_id, object_ids in ids_by_type.items():
+        condition |= Q(content_type_id=ct_id, object_id__in=object_ids)
+    return condition
+
+
+def _watermark(granularity):
+    from apps.common.models import RollupWatermark
+
+    return (
+        RollupWatermark.objects.filter(granularity=granularity)
+        .values_list("processed_until", flat=True)
+        .first()
+    )
+
+
 def get_view_count(content_object):
+    """
+    Total views: closed daily rollups plus raw rows newer than the rollup
+    watermark.
+    """
     from django.contrib.contenttypes.models import ContentType
+    from django.db.models import Sum
+    from apps.common.models import RollupGranularity, ViewRollup
     from apps.common.models.content_view import ContentView
 
     ct = ContentType.objects.get_for_model(content_object)
-    return ContentView.objects.filter(
-        content_type=ct,
-        object_id=content_object.id,
-    ).count()
+    raw = ContentView.objects.filter(content_type=ct, object_id=content_object.id)
+
+    watermark = _watermark(RollupGranularity.DAY)
+    if watermark is None:
+        return raw.count()
+
+    rolled_up = (
+        ViewRollup.objects.filter(
+            content_type=ct,
+            object_id=content_object.id,
+            granularity=RollupGranularity.DAY,
+        ).aggregate(total=Sum("views"))["total"]
+        or 0
+    )
+    return rolled_up + raw.filter(created_at__gte=watermark).count()
+
+
+def get_view_counts_between(content_objects, start, end=None):
+    """
+    Views per object in ``[start, end)`` as ``{pk: count}``.
+
+    Whole hours before the hourly watermark come from ViewRollup; only the
+    ragged leading edge and the still-open tail touch the raw table.
+    """
+    from django.db.models import Count, Q, Sum
+    from django.utils import timezone
+    from apps.common.models import RollupGranularity, ViewRollup
+    from apps.common.models.content_view import ContentView
+    from apps.common.services.rollups import ceil_bucket, floor_bucket
+
+    content_objects = list(content_objects)
+    counts = {obj.pk: 0 for obj in content_objects}
+    condition = _objects_condition(content_objects)
+    if condition is None:
+        return counts
+
+    end = end or timezone.now()
+    raw_ranges = [(start, end)]
+
+    watermark = _watermark(RollupGranularity.HOUR)
+    if watermark is not None:
+        rollup_start = ceil_bucket(start, RollupGranularity.HOUR)
+        rollup_end = min(watermark, floor_bucket(end, RollupGranularity.HOUR))
+        if rollup_start < rollup_end:
+            raw_ranges = [(start, rollup_start), (rollup_end, end)]
+            rows = (
+                ViewRollup.objects.filter(
+                    condition,
+                    granularity=RollupGranularity.HOUR,
+                    bucket_start__gte=rollup_start,
+                    bucket_start__lt=rollup_end,
+                )
+                .values("object_id")
+                .annotate(total=Sum("views"))
+                .order_by()
+            )
+            for row in rows:
+                counts[row["object_id"]] += row["total"]
+
+    range_condition = Q()
+    for range_start, range_end in raw_ranges:
+        if range_start < range_end:
+            range_condition |= Q(created_at__gte=range_start, created_at__lt=range_end)
+    if not range_condition:
+        return counts
+
+    rows = (
+        ContentView.objects.filter(condition)
+        .filter(range_condition)
+        .values("object_id")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    for row in rows:
+        counts[row["object_id"]] += row["total"]
+    return counts
+
+
+def get_unique_viewers(content_object, approximate=False):
+    """
+    Distinct viewers of the object: a signed-in user once across IPs,
+    anonymous viewers by IP (``viewer_identity``, as in every other
+    unique-viewer count).
 
+    ``approximate=True`` answers from the HyperLogLog sketches (~1% error)
+    instead of scanning every view row; sketches cover views up to the last
+    hourly rollup.
+
+    The exact count needs every raw row, so once months of this object's
+    views have been pruned it falls back to the estimate.
+    """
+    if approximate:
+        return estimate_unique_viewers([content_object])
 
-def get_unique_viewers(content_object):
     from django.contrib.contenttypes.models import ContentType
+    from django.db.models import Count, Q
+    from apps.common.models import RollupGranularity, ViewTotal
     from apps.common.models.content_view import ContentView
+    from apps.common.services.unique_viewers import viewer_identity
 
     ct = ContentType.objects.get_for_model(content_object)
-    return (
-        ContentView.objects.filter(content_type=ct, object_id=content_object.id)
-        .values("user", "viewer_ip")
-        .distinct()
-        .count()
-    )
\ No newline at end of file
+    views = ContentView.objects.filter(content_type=ct, object_id=content_object.id)
+
+    watermark = _watermark(RollupGranularity.HOUR)
+    if watermark is not None:
+        rolled_up = (
+            ViewTotal.objects.filter(content_type=ct, object_id=content_object.id)
+            .values_list("views", flat=True)
+            .first()
+            or 0
+        )
+        retained = views.aggregate(n=Count("id", filter=Q(created_at__lt=watermark)))["n"]
+        if retained < rolled_up:
+            return estimate_unique_viewers([content_object])
+
+    return views.aggregate(n=Count(viewer_identity(), distinct=True))["n"]
+
+
+def estimate_unique_viewers(content_objects, start=None, end=None):
+    """
+    Approximate distinct viewers across one or more objects (of any types)
+    and an optional inclusive ``start``/``end`` date range, counting each
+    viewer once even if they saw several of the objects or came back on
+    several days. Without a range, each object's all-time sketch is read
+    instead of its daily ones.
+    """
+    from apps.common.models import ViewerSketch
+    from apps.common.services.hyperloglog import HyperLogLog
+
+    condition = _objects_condition(content_objects)
+    if condition is None:
+        return 0
+
+    sketches = ViewerSketch.objects.filter(condition)
+    if start is None and end is None:
+        sketches = sketches.filter(bucket__isnull=True)
+    else:
+        sketches = sketches.filter(bucket__isnull=False)
+    if start is not None:
+        sketches = sketches.filter(bucket__gte=start)
+    if end is not None:
+        sketches = sketches.filter(bucket__lte=end)
+
+    return HyperLogLog.union(
+        HyperLogLog.from_bytes(registers)
+        for registers in sketches.values_list("registers", flat=True).iterator()
+    ).count()
+
+
+def get_view_stats(content_objects):
+    """
+    Views and unique viewers for many objects, one query per content type.
+
+    ``content_objects`` may be a list of objects of any types, or a queryset
+    (used as a subquery, never loaded). Returns
+    ``{pk: {"views": n, "unique_viewers": m}}``; objects without views are
+    included with zeros when a list is given. Counts come from
+    ``annotate_view_stats``, so they survive pruned partitions.
+    """
+    from django.db.models import QuerySet
+
+    if isinstance(content_objects, QuerySet):
+        querysets = [content_objects]
+        stats = {}
+    else:
+        content_objects = list(content_objects)
+        pks_by_model = {}
+        for obj in content_objects:
+            pks_by_model.setdefault(obj._meta.concrete_model, []).append(obj.pk)
+        querysets = [
+            model._base_manager.filter(pk__in=pks) for model, pks in pks_by_model.items()
+        ]
+        stats = {obj.pk: {"views": 0, "unique_viewers": 0} for obj in content_objects}
+
+    for queryset in querysets:
+        rows = (
+            annotate_view_stats(queryset.order_by())
+            .filter(view_count__gt=0)
+            .values_list("pk", "view_count", "unique_viewer_count")
+        )
+        for pk, views, unique_viewers in rows:
+            stats[pk] = {"views": views, "unique_viewers": unique_viewers}
+    return stats
+
+
+def annotate_view_stats(queryset):
+    """
+    Annotate each row with ``view_count`` and ``unique_viewer_count``.
+
+    Both come from the object's ViewTotal plus the raw rows created since
+    the hourly rollup watermark, so a list page reads one total row and a
+    short index range per object, in the same query. Unique viewers are
+    approximate, and a returning viewer who gets a new row (a new month or
+    IP) may count twice until the next rollup.
+    """
+    from datetime import datetime, timezone
+
+    from django.contrib.contenttypes.models import ContentType
+    from django.db.models import (
+        Count,
+        DateTimeField,
+        IntegerField,
+        OuterRef,
+        Subquery,
+        Value,
+    )
+    from django.db.models.functions import Coalesce
+    from apps.common.models import RollupGranularity, RollupWatermark, ViewTotal
+    from apps.common.models.content_view import ContentView
+    from apps.common.services.unique_viewers import viewer_identity
+
+    ct = ContentType.objects.get_for_model(queryset.model)
+    totals = ViewTotal.objects.filter(content_type=ct, object_id=OuterRef("pk"))
+    # Inlined so the list stays a single query; without a watermark nothing
+    # has been rolled up and every row is recent.
+    watermark = Coalesce(
+        Subquery(
+            RollupWatermark.objects.filter(granularity=RollupGranularity.HOUR).values(
+                "processed_until"
+            )
+        ),
+        Value(datetime.min.replace(tzinfo=timezone.utc)),
+        output_field=DateTimeField(),
+    )
+    recent = (
+        ContentView.objects.filter(
+            content_type=ct, object_id=OuterRef("pk"), created_at__gte=watermark
+        )
+        .order_by()
+        .values("object_id")
+    )
+
+    def count(total_field, recent_count):
+        return Coalesce(
+            Subquery(totals.values(total_field), output_field=IntegerField()), 0
+        ) + Coalesce(
+            Subquery(
+                recent.annotate(n=recent_count).values("n"),
+                output_field=IntegerField(),
+            ),
+            0,
+        )
+
+    return queryset.annotate(
+        view_count=count("views", Count("id")),
+        unique_viewer_count=count(
+            "unique_viewers", Count(viewer_identity(), distinct=True)
+        ),
+    )
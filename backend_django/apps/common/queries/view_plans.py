@@ -0,0 +1,141 @@
+"""
+Hot ContentView access paths and the plan checks that guard them.
+
+Shared by ``test_query_plans`` and ``manage.py benchmark_view_queries`` so a
+missing index fails CI instead of being rediscovered in production.
+"""
+
+import json
+from datetime import timedelta
+
+from django.db import connection
+from django.db.models import Count
+from django.utils import timezone
+
+# Seq Scans reading fewer rows than this (e.g. empty future partitions) are
+# harmless and ignored.
+SEQ_SCAN_ROW_LIMIT = 1000
+DEFAULT_BUDGET_MS = 50.0
+
+SEED_SQL = """
+    INSERT INTO {table} (
+        id, created_at, updated_at, last_viewed, month,
+        content_type_id, object_id, user_id, viewer_ip
+    )
+    SELECT
+        gen_random_uuid(),
+        now() - (g || ' seconds')::interval,
+        now(),
+        now(),
+        date_trunc('month', now() AT TIME ZONE 'UTC')::date,
+        %s,
+        (%s::uuid[])[1 + (g %% %s)],
+        CASE WHEN g %% 3 = 0 THEN NULL ELSE (%s::uuid[])[1 + (g %% %s)] END,
+        ('10.' || (g / 65536 %% 256) || '.' || (g / 256 %% 256) || '.' || (g %% 256))::inet
+    FROM generate_series(%s, %s) AS g
+"""
+
+
+def seed_content_views(start, end, content_type_id, object_ids, user_ids) -> None:
+    """
+    Insert synthetic views ``start..end`` (one per second going back from
+    now, all in the current month) and refresh planner statistics.
+    """
+    from apps.common.models import ContentView
+
+    table = ContentView._meta.db_table
+    object_ids = [str(pk) for pk in object_ids]
+    user_ids = [str(pk) for pk in user_ids]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SEED_SQL.format(table=connection.ops.quote_name(table)),
+            [
+                content_type_id,
+                object_ids,
+                len(object_ids),
+                user_ids,
+                len(user_ids),
+                start,
+                end,
+            ],
+        )
+        cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+
+def hot_view_queries(content_type_id, object_id, viewer_ip) -> dict:
+    """
+    The queries behind view recording, analytics and rollups, by name.
+    """
+    from apps.common.models import ContentView
+    from apps.common.models.content_view import current_month
+
+    now = timezone.now()
+    views = ContentView.objects.order_by()
+    per_object = views.filter(content_type_id=content_type_id, object_id=object_id)
+    return {
+        "dedupe_lookup": views.filter(
+            content_type_id=content_type_id,
+            object_id=object_id,
+            user_id=None,
+            viewer_ip=viewer_ip,
+            month=current_month(now),
+        ),
+        "object_view_count": per_object.values("object_id").annotate(n=Count("id")),
+        "object_views_since_watermark": per_object.filter(
+            created_at__gte=now - timedelta(hours=1)
+        )
+        .values("object_id")
+        .annotate(n=Count("id")),
+        "object_unique_viewers": per_object.values("user", "viewer_ip").distinct(),
+        "rollup_window": views.filter(
+            created_at__gte=now - timedelta(hours=2),
+            created_at__lt=now - timedelta(hours=1),
+        )
+        .values("content_type", "object_id")
+        .annotate(n=Count("id")),
+        "viewers_seen_in_window": views.filter(
+            last_viewed__gte=now - timedelta(hours=2),
+            last_viewed__lt=now - timedelta(hours=1),
+        ).values_list("content_type_id", "object_id", "user_id", "viewer_ip", "last_viewed"),
+        "first_view": views.order_by("created_at").values("created_at")[:1],
+    }
+
+
+def explain(queryset) -> dict:
+    """
+    ``EXPLAIN (ANALYZE, FORMAT JSON)`` for a queryset, as a dict with
+    ``Plan`` and ``Execution Time``.
+    """
+    return json.loads(queryset.explain(analyze=True, format="json"))[0]
+
+
+def iter_plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from iter_plan_nodes(child)
+
+
+def plan_problems(
+    result: dict,
+    budget_ms: float | None = None,
+    seq_scan_row_limit: int = SEQ_SCAN_ROW_LIMIT,
+) -> list[str]:
+    """
+    Why a plan is unacceptable: sequential scans reading at least
+    ``seq_scan_row_limit`` rows or, when ``budget_ms`` is given, blowing the
+    latency budget. Empty when the plan is fine.
+    """
+    problems = []
+    for node in iter_plan_nodes(result["Plan"]):
+        if node["Node Type"] != "Seq Scan":
+            continue
+        scanned = node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)
+        if scanned >= seq_scan_row_limit:
+            problems.append(
+                f"Seq Scan on {node.get('Relation Name')} read {scanned:,} rows"
+            )
+
+    elapsed = result["Execution Time"]
+    if budget_ms is not None and elapsed > budget_ms:
+        problems.append(f"took {elapsed:.1f} ms (budget {budget_ms:.1f} ms)")
+    return problems
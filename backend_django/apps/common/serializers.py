@@ -0,0 +1,73 @@
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, RelatedField
+
+FIELDS_QUERY_PARAM = "fields"
+
+
+class SparseFieldsetMixin:
+    """
+    Lets read requests trim the response with ``?fields=a,b,c``.
+
+    Unknown names are ignored; write requests always get the full field set so
+    input is never silently dropped.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        request = self.context.get("request")
+        if request is None or request.method not in ("GET", "HEAD"):
+            return
+
+        requested = request.query_params.get(FIELDS_QUERY_PARAM)
+        if not requested:
+            return
+
+        wanted = {name.strip() for name in requested.split(",") if name.strip()}
+        if not wanted & set(self.fields):
+            return
+
+        for name in set(self.fields) - wanted:
+            self.fields.pop(name)
+
+
+def values_columns(serializer, annotations=()) -> dict[str, str] | None:
+    """
+    Map each serializer field to the model column (or queryset annotation) it
+    reads, or return None if any field needs a model instance (relations,
+    nested serializers, methods, dotted sources or properties).
+    """
+    model = serializer.Meta.model
+    concrete = {field.name for field in model._meta.concrete_fields} | set(annotations)
+
+    columns = {}
+    for name, field in serializer.fields.items():
+        if isinstance(
+            field,
+            (
+                RelatedField,
+                ManyRelatedField,
+                serializers.BaseSerializer,
+                serializers.SerializerMethodField,
+            ),
+        ):
+            return None
+        if field.source not in concrete:
+            return None
+        columns[name] = field.source
+    return columns
+
+
+def render_values(serializer, rows, columns: dict[str, str]) -> list[dict]:
+    """
+    Serialize ``.values()`` rows with the serializer's own field objects, so
+    output matches the regular path without instantiating model objects.
+    """
+    fields = [(name, serializer.fields[name], column) for name, column in columns.items()]
+    return [
+        {
+            name: None if row[column] is None else field.to_representation(row[column])
+            for name, field, column in fields
+        }
+        for row in rows
+    ]
@@ -1,18 +1,31 @@
-from datetime import timedelta
+from apps.common.services.rate_limit import get_limiter
 
-def is_rate_limited(user, viewer_ip) -> bool:
-    from apps.common.models.content_view import ContentView
-    from django.utils import timezone
 
-    cutoff = timezone.now() - timedelta(hours=1)
+def _identity(user, viewer_ip):
+    if user:
+        return f"user:{user.pk}"
+    if viewer_ip:
+        return f"ip:{viewer_ip}"
+    return None
 
-    qs = ContentView.objects.filter(created_at__gte=cutoff)
 
-    if user:
-        qs = qs.filter(user=user)
-    elif viewer_ip:
-        qs = qs.filter(viewer_ip=viewer_ip)
-    else:
+def is_rate_limited(user, viewer_ip, action: str = "content_view") -> bool:
+    """
+    Report whether this viewer has used up the configured limit for
+    ``action`` (see ``RATE_LIMITS``). Checking records nothing; counted
+    events go through ``count_towards_limit``.
+    """
+    identity = _identity(user, viewer_ip)
+    if identity is None:
         return True
+    return get_limiter().is_limited(action, identity)
+
 
-    return qs.count() > 30
\ No newline at end of file
+def count_towards_limit(user, viewer_ip, key=None, action: str = "content_view") -> None:
+    """
+    Record an accepted event for this viewer. Events with the same ``key``
+    (e.g. repeat views of one object) count once per limiter window.
+    """
+    identity = _identity(user, viewer_ip)
+    if identity is not None:
+        get_limiter().hit(action, identity, None if key is None else str(key))
@@ -0,0 +1,93 @@
+import hashlib
+import math
+import threading
+import time
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter sized for ``capacity`` keys at ``error_rate``
+    false positives. Bit positions come from double hashing one 128-bit
+    digest, so each operation hashes the key once.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and 0 < error_rate < 1.")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:], "big") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> bool:
+        """
+        Add a key; returns True if it was (probably) already present.
+        """
+        present = True
+        for p in self._positions(key):
+            mask = 1 << (p & 7)
+            if not self.bits[p >> 3] & mask:
+                self.bits[p >> 3] |= mask
+                present = False
+        if not present:
+            self.count += 1
+        return present
+
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class RotatingBloomFilter:
+    """
+    Two generations of Bloom filters, rotated every ``interval`` seconds or
+    as soon as the current one reaches capacity, so the false-positive rate
+    stays bounded. A key is remembered for between one and two intervals.
+    """
+
+    def __init__(self, capacity: int, interval: float, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.interval = interval
+        self.error_rate = error_rate
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _rotate_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._rotated_at >= self.interval or self._current.is_full():
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = now
+
+    def __contains__(self, key: str) -> bool:
+        """
+        Whether the key was (probably) added within the window, without
+        adding it.
+        """
+        with self._lock:
+            self._rotate_if_due()
+            return key in self._previous or key in self._current
+
+    def add(self, key: str) -> bool:
+        """
+        Add a key; returns True if it was (probably) seen within the window.
+        """
+        with self._lock:
+            self._rotate_if_due()
+            if key in self._previous:
+                # Not carried forward: the key expires with this generation,
+                # which forces a refresh within two intervals of the last one.
+                return True
+            return self._current.add(key)
@@ -0,0 +1,174 @@
+"""
+Engagement velocity: an exponentially decayed count of views per object.
+
+With decay rate ``DECAY`` the velocity of an object at time ``t`` is
+``sum(exp(-DECAY * (t - t_i)))`` over its views ``t_i``. Scores are stored as
+``log(sum(exp(DECAY * (t_i - EPOCH))))``, which never needs decaying: each
+run only folds the views recorded since the watermark into the objects they
+belong to, and the current velocity is recovered with ``current_velocity``.
+"""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import FloatField, Max, Sum, Value
+from django.db.models.functions import Cast, Exp, Extract
+
+from apps.common.models import (
+    ContentView,
+    EngagementScore,
+    EngagementWatermark,
+    TrendingRanking,
+)
+from apps.common.services.rollups import SETTLE_DELAY
+
+HALF_LIFE = timedelta(seconds=getattr(settings, "ENGAGEMENT_HALF_LIFE", 6 * 3600))
+TRENDING_SIZE = getattr(settings, "TRENDING_SIZE", 200)
+
+DECAY = math.log(2) / HALF_LIFE.total_seconds()
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+# On the first run, views older than this contribute < 0.1% and are skipped.
+INITIAL_LOOKBACK = HALF_LIFE * 10
+
+
+def _since_epoch(moment: datetime) -> float:
+    return (moment - EPOCH).total_seconds()
+
+
+def current_velocity(log_score: float, now: datetime) -> float:
+    """
+    Decayed view count at ``now`` for a stored ``log_score``.
+    """
+    return math.exp(log_score - DECAY * _since_epoch(now))
+
+
+def _log_add(a: float, b: float) -> float:
+    high, low = max(a, b), min(a, b)
+    return high + math.log1p(math.exp(low - high))
+
+
+def update_engagement(now: datetime | None = None) -> int:
+    """
+    Fold ContentView rows created since the watermark into EngagementScore,
+    then re-rank the content types that changed. Returns the number of
+    objects updated.
+    """
+    now = now or datetime.now(timezone.utc)
+    until = now - SETTLE_DELAY
+
+    with transaction.atomic():
+        watermark, _ = EngagementWatermark.objects.select_for_update().get_or_create(
+            pk=1, defaults={"processed_until": until - INITIAL_LOOKBACK}
+        )
+        start = watermark.processed_until
+        if start >= until:
+            return 0
+
+        # Weights are relative to ``until`` so every exponent is <= 0.
+        age = Value(until.timestamp()) - Cast(
+            Extract("created_at", "epoch", tzinfo=timezone.utc), FloatField()
+        )
+        batches = (
+            ContentView.objects.filter(created_at__gte=start, created_at__lt=until)
+            .values("content_type", "object_id")
+            .annotate(
+                weight=Sum(Exp(Value(-DECAY) * age)),
+                last_view_at=Max("created_at"),
+            )
+            .order_by()
+        )
+        offset = DECAY * _since_epoch(until)
+        increments = {
+            (row["content_type"], row["object_id"]): (
+                math.log(row["weight"]) + offset,
+                row["last_view_at"],
+            )
+            for row in batches.iterator()
+            if row["weight"] > 0
+        }
+
+        if increments:
+            _merge_scores(increments, now)
+            for content_type_id in {key[0] for key in increments}:
+                rebuild_ranking(content_type_id, now)
+
+        watermark.processed_until = until
+        watermark.save(update_fields=["processed_until"])
+
+    return len(increments)
+
+
+def _merge_scores(increments, now: datetime) -> None:
+    existing = {}
+    by_type = {}
+    for content_type_id, object_id in increments:
+        by_type.setdefault(content_type_id, []).append(object_id)
+    for content_type_id, object_ids in by_type.items():
+        for score in EngagementScore.objects.filter(
+            content_type_id=content_type_id, object_id__in=object_ids
+        ):
+            existing[(score.content_type_id, score.object_id)] = score
+
+    to_update, to_create = [], []
+    for key, (log_increment, last_view_at) in increments.items():
+        score = existing.get(key)
+        if score is None:
+            to_create.append(
+                EngagementScore(
+                    content_type_id=key[0],
+                    object_id=key[1],
+                    log_score=log_increment,
+                    last_view_at=last_view_at,
+                )
+            )
+        else:
+            score.log_score = _log_add(score.log_score, log_increment)
+            score.last_view_at = max(score.last_view_at, last_view_at)
+            score.updated_at = now
+            to_update.append(score)
+
+    EngagementScore.objects.bulk_create(to_create, batch_size=1000)
+    EngagementScore.objects.bulk_update(
+        to_update, ["log_score", "last_view_at", "updated_at"], batch_size=1000
+    )
+
+
+def rebuild_ranking(content_type_id: int, now: datetime, size: int = TRENDING_SIZE) -> None:
+    """
+    Store the top ``size`` objects of a content type by velocity.
+    """
+    entries = [
+        [str(object_id), log_score]
+        for object_id, log_score in EngagementScore.objects.filter(
+            content_type_id=content_type_id
+        )
+        .order_by("-log_score")
+        .values_list("object_id", "log_score")[:size]
+    ]
+    TrendingRanking.objects.update_or_create(
+        content_type_id=content_type_id,
+        defaults={"entries": entries, "computed_at": now},
+    )
+
+
+def get_trending(model, now: datetime | None = None) -> list[tuple[str, float]]:
+    """
+    Ranked ``[(object_id, velocity), ...]`` for a model, from the stored
+    ranking. One query.
+    """
+    now = now or datetime.now(timezone.utc)
+    entries = (
+        TrendingRanking.objects.filter(
+            content_type=ContentType.objects.get_for_model(model)
+        )
+        .values_list("entries", flat=True)
+        .first()
+    )
+    return [
+        (object_id, current_velocity(log_score, now))
+        for object_id, log_score in entries or []
+    ]
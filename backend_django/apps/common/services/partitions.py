@@ -0,0 +1,153 @@
+"""
+Monthly range partitions for ContentView.
+
+The table is partitioned on ``month`` (first day of the UTC month a view was
+recorded in). Partitions are named ``<table>_yYYYYmMM`` and must exist before
+rows for that month arrive: there is no DEFAULT partition to catch them.
+``create_view_partitions`` and every hourly ``rollup_views`` run create
+``CONTENT_VIEW_PARTITIONS_AHEAD`` months in advance, and a deploy check
+(``common.E001``) fails when this or next month's partition is missing. Old months are removed a whole partition at a time by
+``prune_view_partitions`` instead of row-by-row deletes.
+"""
+
+import re
+from datetime import date, datetime, timezone
+
+from django.conf import settings
+from django.db import connection, transaction
+from loguru import logger
+
+PARTITIONS_AHEAD = getattr(settings, "CONTENT_VIEW_PARTITIONS_AHEAD", 3)
+RETENTION_MONTHS = getattr(settings, "CONTENT_VIEW_RETENTION_MONTHS", 13)
+ARCHIVE_SCHEMA = getattr(settings, "CONTENT_VIEW_ARCHIVE_SCHEMA", "archive")
+
+PARTITION_SUFFIX = re.compile(r"_y(\d{4})m(\d{2})$")
+
+
+def month_start(moment: date) -> date:
+    return date(moment.year, moment.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def _parent_table() -> str:
+    from apps.common.models.content_view import ContentView
+
+    return ContentView._meta.db_table
+
+
+def list_partitions() -> dict[date, str]:
+    """
+    Attached monthly partitions as ``{month: table_name}``.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [_parent_table()],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    partitions = {}
+    for name in names:
+        match = PARTITION_SUFFIX.search(name)
+        if match:
+            partitions[date(int(match[1]), int(match[2]), 1)] = name
+    return partitions
+
+
+def ensure_partitions(ahead: int = PARTITIONS_AHEAD, today: date | None = None) -> list[str]:
+    """
+    Create any missing partitions from the current month through ``ahead``
+    months later. Returns the names of the partitions created.
+    """
+    table = _parent_table()
+    current = month_start(today or datetime.now(timezone.utc).date())
+    existing = list_partitions()
+
+    created = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        for offset in range(ahead + 1):
+            month = add_months(current, offset)
+            if month in existing:
+                continue
+            name = partition_name(table, month)
+            cursor.execute(
+                f"CREATE TABLE {connection.ops.quote_name(name)} "
+                f"PARTITION OF {connection.ops.quote_name(table)} "
+                "FOR VALUES FROM (%s) TO (%s)",
+                [month, add_months(month, 1)],
+            )
+            created.append(name)
+
+    for name in created:
+        logger.info("Created ContentView partition {}", name)
+    return created
+
+
+def prune_partitions(
+    keep_months: int = RETENTION_MONTHS,
+    archive: bool = False,
+    today: date | None = None,
+) -> list[str]:
+    """
+    Detach partitions for months older than ``keep_months`` and drop them, or
+    move them to the ``ARCHIVE_SCHEMA`` schema when ``archive`` is set.
+
+    A month is only removed once both rollup watermarks have passed its end,
+    so its views survive in ViewRollup, ViewTotal and the viewer sketches,
+    which every reader uses for closed periods (an exact
+    ``get_unique_viewers`` falls back to the sketches). Returns the partitions removed.
+    """
+    from apps.common.models import RollupGranularity, RollupWatermark
+
+    table = _parent_table()
+    cutoff = add_months(month_start(today or datetime.now(timezone.utc).date()), -keep_months)
+    watermarks = list(
+        RollupWatermark.objects.filter(
+            granularity__in=[RollupGranularity.HOUR, RollupGranularity.DAY]
+        ).values_list("processed_until", flat=True)
+    )
+    rolled_up_until = min(watermarks) if len(watermarks) == 2 else None
+
+    removed = []
+    with transaction.atomic(), connection.cursor() as cursor:
+        if archive:
+            cursor.execute(
+                f"CREATE SCHEMA IF NOT EXISTS {connection.ops.quote_name(ARCHIVE_SCHEMA)}"
+            )
+        for month, name in sorted(list_partitions().items()):
+            if month >= cutoff:
+                break
+            month_end = datetime.combine(add_months(month, 1), datetime.min.time(), timezone.utc)
+            if rolled_up_until is None or rolled_up_until < month_end:
+                logger.warning("Keeping ContentView partition {}: not rolled up yet", name)
+                continue
+
+            quoted = connection.ops.quote_name(name)
+            cursor.execute(
+                f"ALTER TABLE {connection.ops.quote_name(table)} DETACH PARTITION {quoted}"
+            )
+            if archive:
+                cursor.execute(
+                    f"ALTER TABLE {quoted} SET SCHEMA {connection.ops.quote_name(ARCHIVE_SCHEMA)}"
+                )
+            else:
+                cursor.execute(f"DROP TABLE {quoted}")
+            removed.append(name)
+
+    for name in removed:
+        logger.info("{} ContentView partition {}", "Archived" if archive else "Dropped", name)
+    return removed
@@ -0,0 +1,147 @@
+import threading
+import time
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+# action -> (max hits, window in seconds); override via settings.RATE_LIMITS.
+DEFAULT_RATE_LIMITS = {
+    "content_view": (30, 3600),
+}
+
+DEFAULT_BACKEND = "apps.common.services.rate_limit.CacheBackend"
+
+
+class InMemoryBackend:
+    """
+    Per-process counters. Good for tests and single-worker deployments.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max_entries
+        self._counters: dict[str, tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, current_key: str, previous_key: str, ttl: int) -> tuple[int, int]:
+        now = time.monotonic()
+        with self._lock:
+            if len(self._counters) >= self.max_entries:
+                self._sweep(now)
+
+            count, expires_at = self._counters.get(current_key, (0, 0.0))
+            if expires_at <= now:
+                count, expires_at = 0, now + ttl
+            count += 1
+            self._counters[current_key] = (count, expires_at)
+
+            previous, previous_expires_at = self._counters.get(previous_key, (0, 0.0))
+            if previous_expires_at <= now:
+                previous = 0
+
+        return count, previous
+
+    def peek(self, current_key: str, previous_key: str) -> tuple[int, int]:
+        now = time.monotonic()
+        with self._lock:
+            counts = []
+            for key in (current_key, previous_key):
+                count, expires_at = self._counters.get(key, (0, 0.0))
+                counts.append(count if expires_at > now else 0)
+        return counts[0], counts[1]
+
+    def add(self, key: str, ttl: int) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if self._counters.get(key, (0, 0.0))[1] > now:
+                return False
+            self._counters[key] = (0, now + ttl)
+        return True
+
+    def _sweep(self, now: float) -> None:
+        self._counters = {
+            key: value for key, value in self._counters.items() if value[1] > now
+        }
+
+
+class CacheBackend:
+    """
+    Counters in a Django cache alias, shared by every worker using it.
+    """
+
+    def __init__(self, alias: str = "default"):
+        self.alias = alias
+
+    def hit(self, current_key: str, previous_key: str, ttl: int) -> tuple[int, int]:
+        cache = caches[self.alias]
+        if cache.add(current_key, 1, timeout=ttl):
+            count = 1
+        else:
+            try:
+                count = cache.incr(current_key)
+            except ValueError:
+                # Expired between add() and incr().
+                cache.set(current_key, 1, timeout=ttl)
+                count = 1
+        return count, cache.get(previous_key, 0)
+
+    def peek(self, current_key: str, previous_key: str) -> tuple[int, int]:
+        counts = caches[self.alias].get_many([current_key, previous_key])
+        return counts.get(current_key, 0), counts.get(previous_key, 0)
+
+    def add(self, key: str, ttl: int) -> bool:
+        return caches[self.alias].add(key, 1, timeout=ttl)
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding-window counter: the previous fixed window's count is weighted by
+    how much of it still overlaps the sliding window. Two counters per
+    identity, constant work per check.
+    """
+
+    def __init__(self, backend, limits: dict[str, tuple[int, int]]):
+        self.backend = backend
+        self.limits = limits
+
+    def _keys(self, action: str, identity: str):
+        limit, window = self.limits[action]
+        now = time.time()
+        window_index = int(now // window)
+        overlap = 1 - (now % window) / window
+        current_key = f"rl:{action}:{identity}:{window_index}"
+        previous_key = f"rl:{action}:{identity}:{window_index - 1}"
+        return limit, window, overlap, current_key, previous_key
+
+    def hit(self, action: str, identity: str, member: str | None = None) -> bool:
+        """
+        Record one event and return True if the identity is over its limit.
+        With ``member`` (e.g. an object id), repeats of the same member within
+        a window are recorded once.
+        """
+        limit, window, overlap, current_key, previous_key = self._keys(action, identity)
+        if member is not None and not self.backend.add(
+            f"{current_key}:{member}", ttl=window
+        ):
+            current, previous = self.backend.peek(current_key, previous_key)
+        else:
+            current, previous = self.backend.hit(current_key, previous_key, ttl=window * 2)
+        return previous * overlap + current > limit
+
+    def is_limited(self, action: str, identity: str) -> bool:
+        """
+        Whether the identity is over its limit, without recording anything,
+        so refused attempts never extend a lockout. Same threshold as
+        ``hit``: ``limit`` events per window are allowed.
+        """
+        limit, _, overlap, current_key, previous_key = self._keys(action, identity)
+        current, previous = self.backend.peek(current_key, previous_key)
+        return previous * overlap + current > limit
+
+
+@lru_cache(maxsize=1)
+def get_limiter() -> SlidingWindowLimiter:
+    backend_path = getattr(settings, "RATE_LIMIT_BACKEND", DEFAULT_BACKEND)
+    limits = {**DEFAULT_RATE_LIMITS, **getattr(settings, "RATE_LIMITS", {})}
+    return SlidingWindowLimiter(import_string(backend_path)(), limits)
@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+# A repeat view inside this many seconds skips the database; afterwards the
+# next one is written again, refreshing ``last_viewed``. 0 disables the check.
+REFRESH_INTERVAL = getattr(settings, "CONTENT_VIEW_REFRESH_INTERVAL", 300)
+CAPACITY = getattr(settings, "CONTENT_VIEW_DEDUPE_CAPACITY", 100_000)
+ERROR_RATE = getattr(settings, "CONTENT_VIEW_DEDUPE_ERROR_RATE", 0.001)
+
+DEFAULT_BACKEND = "apps.common.services.recent_views.BloomBackend"
+
+
+class BloomBackend:
+    """
+    Per-process rotating Bloom filter. No I/O; a false positive (at most
+    ``ERROR_RATE``) drops one genuinely new view.
+    """
+
+    def __init__(self, interval: float = REFRESH_INTERVAL):
+        from apps.common.services.bloom import RotatingBloomFilter
+
+        self._filter = RotatingBloomFilter(CAPACITY, interval, ERROR_RATE)
+
+    def seen(self, key: str) -> bool:
+        return key in self._filter
+
+    def mark(self, key: str) -> None:
+        self._filter.add(key)
+
+
+class CacheBackend:
+    """
+    Exact, shared across workers: one cache read per view, plus one write
+    per view that reached the database.
+    """
+
+    def __init__(self, alias: str = "default", interval: float = REFRESH_INTERVAL):
+        self.alias = alias
+        self.interval = interval
+
+    def seen(self, key: str) -> bool:
+        return caches[self.alias].get(f"rv:{key}") is not None
+
+    def mark(self, key: str) -> None:
+        caches[self.alias].set(f"rv:{key}", 1, timeout=self.interval)
+
+
+@lru_cache(maxsize=1)
+def get_recent_views():
+    if not REFRESH_INTERVAL:
+        return None
+    backend_path = getattr(settings, "CONTENT_VIEW_DEDUPE_BACKEND", DEFAULT_BACKEND)
+    return import_string(backend_path)()
+
+
+def _viewer_key(content_type_id, object_id, user_id, viewer_ip) -> str:
+    # One key per ContentView row, which is per (user, IP): this gates row
+    # writes, not unique-viewer counts. The UTC day makes the first view of
+    # each day refresh ``last_viewed``, which feeds the daily viewer sketch.
+    day = datetime.now(timezone.utc).date().isoformat()
+    return f"{content_type_id}:{object_id}:{user_id or ''}|{viewer_ip or ''}:{day}"
+
+
+def seen_recently(content_type_id, object_id, user_id, viewer_ip) -> bool:
+    """
+    Whether this viewer's view was written within the refresh interval.
+    Checking marks nothing; call ``mark_seen`` once the write succeeded.
+    """
+    backend = get_recent_views()
+    if backend is None:
+        return False
+    return backend.seen(_viewer_key(content_type_id, object_id, user_id, viewer_ip))
+
+
+def mark_seen(content_type_id, object_id, user_id, viewer_ip) -> None:
+    """
+    Remember a written view, so repeats within the refresh interval skip
+    the database.
+    """
+    backend = get_recent_views()
+    if backend is not None:
+        backend.mark(_viewer_key(content_type_id, object_id, user_id, viewer_ip))
@@ -0,0 +1,133 @@
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from django.db.models import Q, TextField
+from django.db.models.functions import Cast, Coalesce
+
+from apps.common.services.hyperloglog import HyperLogLog
+
+# Sketches are 16 KiB in memory, so a batch of this many stays around 8 MiB.
+SKETCH_BATCH_SIZE = 500
+
+# ViewerSketch.bucket of the all-time sketch behind ViewTotal.unique_viewers.
+ALL_TIME = None
+
+
+def viewer_identity():
+    """
+    Who a ContentView row counts as for unique viewers: a signed-in viewer
+    once across IPs, anonymous viewers by IP. Every unique-viewer count and
+    sketch uses this identity.
+    """
+    return Coalesce(Cast("user_id", TextField()), Cast("viewer_ip", TextField()))
+
+
+def viewer_identity_key(user_id, viewer_ip: Optional[str]) -> Optional[str]:
+    # viewer_identity() for one row, as added to the sketches.
+    if user_id is not None:
+        return str(user_id)
+    return viewer_ip
+
+
+def bucket_for(moment: datetime) -> date:
+    return moment.astimezone(timezone.utc).date()
+
+
+def fold_viewers(start: Optional[datetime], until: datetime) -> int:
+    """
+    Fold every viewer whose ContentView row was last seen in ``[start, until)``
+    into the sketch for the day of that view and into the object's all-time
+    sketch, whose estimate becomes ``ViewTotal.unique_viewers``.
+    ``start=None`` folds everything before ``until``. Returns the number of
+    sketches written.
+
+    Runs from the hourly rollup under its watermark lock, so each sketch is
+    read, merged and written once per run and never from the request path.
+    A viewer seen on several days between two runs only lands in the last of
+    those days. Sketches are unions, so folding a row twice changes nothing.
+    """
+    from apps.common.models import ContentView
+
+    views = ContentView.objects.filter(last_viewed__lt=until)
+    if start is not None:
+        views = views.filter(last_viewed__gte=start)
+    rows = views.values_list(
+        "content_type_id", "object_id", "user_id", "viewer_ip", "last_viewed"
+    ).order_by()
+
+    written = 0
+    batch: dict[tuple, HyperLogLog] = {}
+    for content_type_id, object_id, user_id, viewer_ip, last_viewed in rows.iterator():
+        identity = viewer_identity_key(user_id, viewer_ip)
+        if identity is None:
+            continue
+        keys = [
+            (content_type_id, object_id, bucket_for(last_viewed)),
+            (content_type_id, object_id, ALL_TIME),
+        ]
+        if len(batch) >= SKETCH_BATCH_SIZE and any(key not in batch for key in keys):
+            written += _merge_sketches(batch)
+            batch = {}
+        for key in keys:
+            batch.setdefault(key, HyperLogLog()).add(identity)
+    return written + _merge_sketches(batch)
+
+
+def _merge_sketches(batch: dict[tuple, HyperLogLog]) -> int:
+    """
+    Union ``{(content_type_id, object_id, bucket): sketch}`` into the stored
+    sketches with one read and one upsert, skipping rows that don't change,
+    and refresh ``ViewTotal.unique_viewers`` from the changed all-time ones.
+    """
+    from apps.common.models import ViewerSketch, ViewTotal
+
+    if not batch:
+        return 0
+
+    days = {bucket for _, _, bucket in batch if bucket is not ALL_TIME}
+    stored = {
+        (content_type_id, object_id, bucket): registers
+        for content_type_id, object_id, bucket, registers in ViewerSketch.objects.filter(
+            Q(bucket__in=days) | Q(bucket__isnull=True),
+            object_id__in={object_id for _, object_id, _ in batch},
+        ).values_list("content_type_id", "object_id", "bucket", "registers")
+    }
+
+    sketches, totals = [], []
+    for (content_type_id, object_id, bucket), hll in batch.items():
+        registers = stored.get((content_type_id, object_id, bucket))
+        if registers is not None:
+            previous = HyperLogLog.from_bytes(registers)
+            hll.merge(previous)
+            if hll.registers == previous.registers:
+                continue
+        sketches.append(
+            ViewerSketch(
+                content_type_id=content_type_id,
+                object_id=object_id,
+                bucket=bucket,
+                registers=hll.to_bytes(),
+            )
+        )
+        if bucket is ALL_TIME:
+            totals.append(
+                ViewTotal(
+                    content_type_id=content_type_id,
+                    object_id=object_id,
+                    unique_viewers=hll.count(),
+                )
+            )
+
+    ViewerSketch.objects.bulk_create(
+        sketches,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id", "bucket"],
+        update_fields=["registers", "updated_at"],
+    )
+    ViewTotal.objects.bulk_create(
+        totals,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["unique_viewers", "updated_at"],
+    )
+    return len(sketches)
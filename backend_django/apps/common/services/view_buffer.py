@@ -0,0 +1,201 @@
+import atexit
+import threading
+from typing import Optional
+
+from django.conf import settings
+from django.db import InterfaceError, OperationalError, connection, transaction
+from django.utils import timezone
+from loguru import logger
+
+FLUSH_INTERVAL = getattr(settings, "CONTENT_VIEW_FLUSH_INTERVAL", 5.0)
+MAX_PENDING = getattr(settings, "CONTENT_VIEW_MAX_PENDING", 5000)
+MAX_BUFFERED = getattr(settings, "CONTENT_VIEW_MAX_BUFFERED", 50_000)
+MAX_ATTEMPTS = getattr(settings, "CONTENT_VIEW_MAX_FLUSH_ATTEMPTS", 3)
+
+# Errors that say nothing about the rows themselves: the whole batch is put
+# back as-is and retried on the next flush.
+TRANSIENT_ERRORS = (OperationalError, InterfaceError)
+
+UNIQUE_FIELDS = ["content_type", "object_id", "user", "viewer_ip", "month"]
+
+
+class ViewBuffer:
+    """
+    In-process write-behind buffer for ContentView.
+
+    Views are coalesced on (content_type, object_id, user, viewer_ip) and
+    written by a background thread with one ``INSERT ... ON CONFLICT DO
+    UPDATE`` per flush, so recording a view never waits on the database.
+    ``last_viewed`` reflects the flush time, i.e. it may lag by up to
+    ``flush_interval`` seconds.
+
+    If a batch fails because of its rows, it is split in halves until the
+    offending rows are isolated; those are retried on later flushes and
+    dropped (and logged) after ``max_attempts``. Once ``max_buffered`` views
+    are waiting, new ones are dropped until a flush frees room.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = FLUSH_INTERVAL,
+        max_pending: int = MAX_PENDING,
+        max_buffered: int = MAX_BUFFERED,
+        max_attempts: int = MAX_ATTEMPTS,
+        autostart: bool = True,
+    ):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_buffered = max_buffered
+        self.max_attempts = max_attempts
+        self.autostart = autostart
+        self._pending: dict[tuple, object] = {}
+        self._attempts: dict[tuple, int] = {}
+        self._overflow = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+    def add(self, content_type_id, object_id, user_id, viewer_ip) -> bool:
+        """
+        Queue a view; returns False if it was dropped because the buffer is
+        full.
+        """
+        key = (content_type_id, object_id, user_id, viewer_ip)
+        with self._lock:
+            if key not in self._pending and len(self._pending) >= self.max_buffered:
+                self._overflow += 1
+                return False
+            self._pending[key] = timezone.now()
+            full = len(self._pending) >= self.max_pending
+        if self.autostart:
+            self._ensure_worker()
+        if full:
+            self._wake.set()
+        return True
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write all pending views and return how many were written. Safe to
+        call from any thread.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            overflow, self._overflow = self._overflow, 0
+
+        if overflow:
+            logger.warning(
+                "Dropped {} content views: more than {} were waiting to be flushed",
+                overflow,
+                self.max_buffered,
+            )
+
+        if not pending:
+            return 0
+
+        try:
+            written, failed = self._write(list(pending))
+        except Exception:
+            # The database is unreachable; put the batch back untouched so
+            # the next flush retries it. Views recorded meanwhile are newer
+            # and win.
+            with self._lock:
+                for key, viewed_at in pending.items():
+                    self._requeue(key, viewed_at)
+            raise
+
+        with self._lock:
+            for key in pending.keys() - set(failed):
+                self._attempts.pop(key, None)
+            for key in failed:
+                attempts = self._attempts.pop(key, 0) + 1
+                if attempts >= self.max_attempts:
+                    logger.error(
+                        "Dropping content view {} after {} failed flushes", key, attempts
+                    )
+                elif self._requeue(key, pending[key]):
+                    self._attempts[key] = attempts
+
+        return written
+
+    def _write(self, keys: list[tuple]) -> tuple[int, list[tuple]]:
+        """
+        Upsert ``keys``, bisecting on failure. Returns the number written and
+        the keys that failed on their own.
+        """
+        from apps.common.models.content_view import ContentView
+
+        views = [
+            ContentView(
+                content_type_id=content_type_id,
+                object_id=object_id,
+                user_id=user_id,
+                viewer_ip=viewer_ip,
+            )
+            for content_type_id, object_id, user_id, viewer_ip in keys
+        ]
+        try:
+            # A savepoint, so a failed batch doesn't poison an enclosing
+            # transaction for the halves retried after it.
+            with transaction.atomic():
+                ContentView.objects.bulk_create(
+                    views,
+                    update_conflicts=True,
+                    unique_fields=UNIQUE_FIELDS,
+                    update_fields=["last_viewed", "updated_at"],
+                )
+        except TRANSIENT_ERRORS:
+            raise
+        except Exception:
+            if len(keys) == 1:
+                logger.opt(exception=True).warning("Failed to write content view {}", keys[0])
+                return 0, keys
+            middle = len(keys) // 2
+            written_head, failed_head = self._write(keys[:middle])
+            written_tail, failed_tail = self._write(keys[middle:])
+            return written_head + written_tail, failed_head + failed_tail
+
+        return len(views), []
+
+    def _requeue(self, key, viewed_at) -> bool:
+        """
+        Put a view back for the next flush unless the buffer is full. Must be
+        called with the lock held.
+        """
+        if key in self._pending:
+            return True
+        if len(self._pending) >= self.max_buffered:
+            self._overflow += 1
+            return False
+        self._pending[key] = viewed_at
+        return True
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._run, name="content-view-flusher", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush buffered content views")
+            finally:
+                # This thread owns its own DB connection; don't hold it idle.
+                connection.close()
+
+
+view_buffer = ViewBuffer()
+atexit.register(view_buffer.flush)
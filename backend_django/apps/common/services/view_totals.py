@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Optional
+
+TOTALS_BATCH_SIZE = 5000
+
+
+def fold_view_totals(start: Optional[datetime], until: datetime) -> int:
+    """
+    Add ContentView rows created in ``[start, until)`` to their objects'
+    ViewTotal. ``start=None`` folds everything before ``until``. Returns the
+    number of totals written.
+
+    Only ``views`` is folded here; ``unique_viewers`` is set from the
+    object's all-time viewer sketch by ``fold_viewers``.
+
+    Runs from the hourly rollup under its watermark lock, so totals have a
+    single writer and each row is counted once.
+    """
+    from django.db.models import Count
+
+    from apps.common.models import ContentView
+
+    views = ContentView.objects.filter(created_at__lt=until)
+    if start is not None:
+        views = views.filter(created_at__gte=start)
+
+    written = 0
+    batch: dict[tuple, int] = {}
+    rows = (
+        views.values_list("content_type_id", "object_id")
+        .annotate(n=Count("id"))
+        .order_by()
+    )
+    for content_type_id, object_id, n in rows.iterator():
+        if len(batch) >= TOTALS_BATCH_SIZE:
+            written += _merge_totals(batch)
+            batch = {}
+        batch[(content_type_id, object_id)] = n
+    return written + _merge_totals(batch)
+
+
+def _merge_totals(batch: dict[tuple, int]) -> int:
+    """
+    Add ``{(content_type_id, object_id): views}`` to the stored totals with
+    one read and one upsert.
+    """
+    from apps.common.models import ViewTotal
+
+    if not batch:
+        return 0
+
+    stored = {
+        (content_type_id, object_id): views
+        for content_type_id, object_id, views in ViewTotal.objects.filter(
+            object_id__in={object_id for _, object_id in batch}
+        ).values_list("content_type_id", "object_id", "views")
+    }
+
+    totals = [
+        ViewTotal(
+            content_type_id=content_type_id,
+            object_id=object_id,
+            views=stored.get((content_type_id, object_id), 0) + views,
+        )
+        for (content_type_id, object_id), views in batch.items()
+    ]
+    ViewTotal.objects.bulk_create(
+        totals,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["views", "updated_at"],
+    )
+    return len(totals)
@@ -1,5 +1,9 @@
+from functools import partial
 from typing import Any, Optional
 
+from loguru import logger
+from rest_framework.settings import api_settings
+
 def should_count_view(
     content_object: Any,
     user: Optional[Any],
@@ -22,10 +26,116 @@ def should_count_view(
     if not user and not viewer_ip:
         return False
 
-    # 3. Rate limiting / abuse checks
-    from apps.common.services.anti_abuse import is_rate_limited
+    # 3. Rate limiting / abuse checks. Only accepted views count towards the
+    # limit, and repeat views of one object count once per window, matching
+    # the old "new ContentView rows in the last hour" rule.
+    from apps.common.services.anti_abuse import count_towards_limit, is_rate_limited
 
     if is_rate_limited(user, viewer_ip):
         return False
 
-    return True
\ No newline at end of file
+    count_towards_limit(
+        user, viewer_ip, key=f"{type(content_object).__name__}:{content_object.id}"
+    )
+    return True
+
+def record_view(
+    content_object: Any,
+    user: Optional[Any],
+    viewer_ip: Optional[str],
+) -> None:
+    """
+    Persist a counted view, either immediately or through the write-behind
+    buffer when ``CONTENT_VIEW_RECORDING = "buffered"``.
+
+    Repeat views within ``CONTENT_VIEW_REFRESH_INTERVAL`` seconds of a
+    written one are answered from an in-memory filter and never reach the
+    database. A view is only remembered once it was written (or accepted by
+    the buffer), so a failed write is retried by the next view.
+    """
+    from django.conf import settings
+    from django.contrib.contenttypes.models import ContentType
+
+    from apps.common.models.content_view import ContentView
+    from apps.common.services.recent_views import mark_seen, seen_recently
+
+    content_type = ContentType.objects.get_for_model(content_object)
+    user_id = getattr(user, "pk", None)
+    if seen_recently(content_type.id, content_object.id, user_id, viewer_ip):
+        return
+
+    if getattr(settings, "CONTENT_VIEW_RECORDING", "sync") != "buffered":
+        ContentView.record_view(content_object, user, viewer_ip)
+    else:
+        from apps.common.services.view_buffer import view_buffer
+
+        if not view_buffer.add(content_type.id, content_object.id, user_id, viewer_ip):
+            return
+
+    mark_seen(content_type.id, content_object.id, user_id, viewer_ip)
+
+
+def get_client_ip(request) -> Optional[str]:
+    """
+    Client address, honouring ``X-Forwarded-For`` only as far as DRF's
+    ``NUM_PROXIES`` says there are trusted proxies in front of us.
+    """
+    forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    num_proxies = api_settings.NUM_PROXIES
+    if forwarded_for and num_proxies:
+        addresses = [address.strip() for address in forwarded_for.split(",")]
+        return addresses[-min(num_proxies, len(addresses))]
+    return request.META.get("REMOTE_ADDR")
+
+
+def track_view(
+    content_object: Any,
+    user: Optional[Any],
+    viewer_ip: Optional[str],
+) -> None:
+    """
+    Run the abuse checks and record the view. Never raises: losing a view is
+    better than failing whatever triggered it.
+    """
+    try:
+        if should_count_view(content_object, user, viewer_ip):
+            record_view(content_object, user, viewer_ip)
+    except Exception:
+        logger.exception(
+            "View tracking failed for {} {}",
+            type(content_object).__name__,
+            getattr(content_object, "pk", None),
+        )
+
+
+def call_on_close(response, callback) -> None:
+    """
+    Run ``callback`` when the server calls ``response.close()``, i.e. once
+    the body has been sent. It runs before the original ``close()``, so
+    before ``request_finished`` and the connection cleanup hooked to it, and
+    a failing callback is logged instead of breaking the close.
+    """
+    close = response.close
+
+    def close_after_callback():
+        try:
+            callback()
+        except Exception:
+            logger.exception("Callback on response close failed")
+        finally:
+            close()
+
+    response.close = close_after_callback
+
+
+def track_view_after_response(
+    response,
+    content_object: Any,
+    user: Optional[Any],
+    viewer_ip: Optional[str],
+) -> None:
+    """
+    Defer ``track_view`` until the server closes ``response``, i.e. after the
+    body has been sent, so tracking adds no latency to the request itself.
+    """
+    call_on_close(response, partial(track_view, content_object, user, viewer_ip))
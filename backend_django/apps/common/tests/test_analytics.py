@@ -1,6 +1,16 @@
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
 from apps.common.models import ContentView
-from apps.common.queries.analytics import get_view_count
+from django.contrib.auth import get_user_model
+
+from apps.common.queries.analytics import (
+    annotate_view_stats,
+    get_view_count,
+    get_view_stats,
+)
+from apps.common.services.rollups import run_rollups
 from apps.common.tests.utils import create_user
 
 
@@ -22,4 +32,57 @@ class AnalyticsTests(TestCase):
         )
 
         count = get_view_count(self.content)
-        self.assertEqual(count, 2)
\ No newline at end of file
+        self.assertEqual(count, 2)
+
+
+class ViewStatsTests(TestCase):
+    def setUp(self):
+        self.viewer = create_user(email="viewer@example.com")
+        self.content = create_user(email="content@example.com")
+        self.unseen = create_user(email="unseen@example.com")
+        # One user from two IPs counts as a single unique viewer.
+        ContentView.record_view(self.content, self.viewer, "10.0.0.1")
+        ContentView.record_view(self.content, self.viewer, "10.0.0.2")
+        ContentView.record_view(self.content, None, "10.0.0.3")
+
+    def test_stats_for_objects(self):
+        with self.assertNumQueries(1):
+            stats = get_view_stats([self.content, self.unseen])
+
+        self.assertEqual(stats[self.content.pk], {"views": 3, "unique_viewers": 2})
+        self.assertEqual(stats[self.unseen.pk], {"views": 0, "unique_viewers": 0})
+
+    def test_stats_for_queryset(self):
+        users = get_user_model().objects.filter(email__endswith="@example.com")
+
+        with self.assertNumQueries(1):
+            stats = get_view_stats(users)
+
+        self.assertEqual(stats, {self.content.pk: {"views": 3, "unique_viewers": 2}})
+
+    def test_stats_for_nothing(self):
+        self.assertEqual(get_view_stats([]), {})
+
+    def test_annotate_view_stats(self):
+        users = annotate_view_stats(
+            get_user_model().objects.filter(pk__in=[self.content.pk, self.unseen.pk])
+        )
+        counts = {
+            user.pk: (user.view_count, user.unique_viewer_count) for user in users
+        }
+
+        self.assertEqual(counts, {self.content.pk: (3, 2), self.unseen.pk: (0, 0)})
+
+    def test_annotate_view_stats_reads_totals_and_recent_rows(self):
+        two_days_ago = timezone.now() - timedelta(days=2)
+        ContentView.objects.update(created_at=two_days_ago, last_viewed=two_days_ago)
+        run_rollups()
+        # Rolled-up rows are no longer read, e.g. once their month is pruned.
+        ContentView.objects.all().delete()
+        ContentView.record_view(self.content, None, "10.0.0.4")
+
+        user = annotate_view_stats(
+            get_user_model().objects.filter(pk=self.content.pk)
+        ).get()
+
+        self.assertEqual((user.view_count, user.unique_viewer_count), (4, 3))
@@ -1,35 +1,116 @@
-from django.test import TestCase
-from django.utils import timezone
-from datetime import timedelta
+from unittest import mock
 
-from apps.common.models import ContentView
-from apps.common.services.anti_abuse import is_rate_limited
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from apps.common.services.anti_abuse import count_towards_limit, is_rate_limited
+from apps.common.services.rate_limit import (
+    CacheBackend,
+    InMemoryBackend,
+    SlidingWindowLimiter,
+)
 from apps.common.tests.utils import create_user
 
 
 class AntiAbuseTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.user = create_user()
-        self.content = self.user
 
     def test_rate_limit_triggered(self):
-        # Same user generating many views from different IPs
-        for _ in range(31):
-            ContentView.objects.create(
-                content_object=self.content,
-                user=self.user,
-                viewer_ip=f"127.0.0.{_ + 1}",
-            )
+        # Same user viewing many different claims: the 30 allowed, then one more
+        for i in range(31):
+            self.assertFalse(is_rate_limited(self.user, None))
+            count_towards_limit(self.user, None, key=f"claim-{i}")
 
         self.assertTrue(is_rate_limited(self.user, None))
 
     def test_rate_limit_not_triggered_under_threshold(self):
-        # Same user generating views from different IPs
         for i in range(10):
-            ContentView.objects.create(
-                content_object=self.content,
-                user=self.user,
-                viewer_ip=f"127.0.0.{i + 1}",
-            )
+            count_towards_limit(self.user, None, key=f"claim-{i}")
+
+        self.assertFalse(is_rate_limited(self.user, None))
+
+    def test_repeat_views_of_one_claim_count_once(self):
+        for _ in range(100):
+            self.assertFalse(is_rate_limited(self.user, None))
+            count_towards_limit(self.user, None, key="claim-1")
+
+        self.assertFalse(is_rate_limited(self.user, None))
+
+    def test_checking_does_not_count(self):
+        for _ in range(100):
+            is_rate_limited(self.user, None)
+
+        self.assertFalse(is_rate_limited(self.user, None))
+
+    def test_anonymous_without_ip_is_limited(self):
+        self.assertTrue(is_rate_limited(None, None))
+
+    def test_ips_are_limited_independently(self):
+        for i in range(31):
+            count_towards_limit(None, "10.0.0.1", key=i)
+
+        self.assertTrue(is_rate_limited(None, "10.0.0.1"))
+        self.assertFalse(is_rate_limited(None, "10.0.0.2"))
+
+    def test_rate_limit_does_not_query_database(self):
+        with self.assertNumQueries(0):
+            is_rate_limited(self.user, "127.0.0.1")
+            count_towards_limit(self.user, "127.0.0.1", key="claim-1")
+
+
+class SlidingWindowLimiterTests(TestCase):
+    def _limiter(self, backend):
+        return SlidingWindowLimiter(backend, {"test": (3, 60)})
+
+    def _assert_sliding_window(self, limiter):
+        with mock.patch("apps.common.services.rate_limit.time.time") as now:
+            now.return_value = 6000.0  # start of a window
+            for _ in range(3):
+                self.assertFalse(limiter.hit("test", "a"))
+            self.assertTrue(limiter.hit("test", "a"))
+
+            # Halfway into the next window, half of the 4 earlier hits still count.
+            now.return_value = 6090.0
+            self.assertFalse(limiter.hit("test", "a"))
+            self.assertTrue(limiter.hit("test", "a"))
+
+            # Two full windows later everything has expired.
+            now.return_value = 6180.0
+            self.assertFalse(limiter.hit("test", "a"))
+
+    def test_in_memory_backend(self):
+        self._assert_sliding_window(self._limiter(InMemoryBackend()))
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "ratelimit": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "ratelimit-test",
+            },
+        }
+    )
+    def test_cache_backend(self):
+        self._assert_sliding_window(self._limiter(CacheBackend("ratelimit")))
+
+    def test_members_count_once_per_window(self):
+        limiter = self._limiter(InMemoryBackend())
+        for _ in range(10):
+            self.assertFalse(limiter.hit("test", "a", member="x"))
+
+        self.assertFalse(limiter.is_limited("test", "a"))
+        limiter.hit("test", "a", member="y")
+        limiter.hit("test", "a", member="z")
+        # At the limit, not over it.
+        self.assertFalse(limiter.is_limited("test", "a"))
+        limiter.hit("test", "a", member="w")
+        self.assertTrue(limiter.is_limited("test", "a"))
+
+    def test_identities_are_independent(self):
+        limiter = self._limiter(InMemoryBackend())
+        for _ in range(4):
+            limiter.hit("test", "a")
 
-        self.assertFalse(is_rate_limited(self.user, None))
\ No newline at end of file
+        self.assertFalse(limiter.hit("test", "b"))
@@ -0,0 +1,72 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from apps.common.services.bloom import BloomFilter, RotatingBloomFilter
+
+
+class BloomFilterTests(SimpleTestCase):
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        for i in range(1000):
+            bloom.add(f"key-{i}")
+
+        self.assertTrue(all(f"key-{i}" in bloom for i in range(1000)))
+
+    def test_add_reports_presence(self):
+        bloom = BloomFilter(100)
+
+        self.assertFalse(bloom.add("a"))
+        self.assertTrue(bloom.add("a"))
+        self.assertEqual(bloom.count, 1)
+
+    def test_false_positive_rate_is_bounded(self):
+        bloom = BloomFilter(10_000, error_rate=0.01)
+        for i in range(10_000):
+            bloom.add(f"seen-{i}")
+
+        false_positives = sum(f"unseen-{i}" in bloom for i in range(10_000))
+        self.assertLess(false_positives / 10_000, 0.02)
+
+    def test_rejects_invalid_sizing(self):
+        with self.assertRaises(ValueError):
+            BloomFilter(0)
+        with self.assertRaises(ValueError):
+            BloomFilter(10, error_rate=1)
+
+
+class RotatingBloomFilterTests(SimpleTestCase):
+    @mock.patch("apps.common.services.bloom.time.monotonic")
+    def test_keys_expire_after_two_intervals(self, monotonic):
+        monotonic.return_value = 0.0
+        bloom = RotatingBloomFilter(capacity=100, interval=60)
+
+        self.assertFalse(bloom.add("a"))
+        monotonic.return_value = 30.0
+        self.assertTrue(bloom.add("a"))
+
+        # Rotated once: "a" is in the previous generation.
+        monotonic.return_value = 70.0
+        self.assertTrue(bloom.add("a"))
+
+        # Rotated again: the generation holding "a" is gone.
+        monotonic.return_value = 140.0
+        self.assertFalse(bloom.add("a"))
+
+    def test_membership_check_does_not_add(self):
+        bloom = RotatingBloomFilter(capacity=100, interval=60)
+
+        self.assertNotIn("a", bloom)
+        self.assertNotIn("a", bloom)
+        bloom.add("a")
+        self.assertIn("a", bloom)
+
+    def test_rotates_early_when_full(self):
+        bloom = RotatingBloomFilter(capacity=10, interval=3600)
+        for i in range(10):
+            bloom.add(f"key-{i}")
+
+        bloom.add("overflow")
+
+        self.assertEqual(bloom._current.count, 1)
+        self.assertTrue(bloom.add("key-0"))
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta, timezone
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from apps.common.models import ContentView, EngagementScore, EngagementWatermark
+from apps.common.services.engagement import (
+    HALF_LIFE,
+    current_velocity,
+    get_trending,
+    update_engagement,
+)
+from apps.common.tests.utils import create_user
+
+NOW = datetime(2026, 3, 10, 12, 30, tzinfo=timezone.utc)
+
+
+class EngagementTests(TestCase):
+    def setUp(self):
+        self.content = create_user()
+        self.other = create_user(email="other@example.com")
+
+    def _view(self, content, ip, created_at):
+        view = ContentView.objects.create(content_object=content, viewer_ip=ip)
+        ContentView.objects.filter(pk=view.pk).update(created_at=created_at)
+
+    def _log_score(self, content):
+        return EngagementScore.objects.get(object_id=content.pk).log_score
+
+    def test_velocity_halves_every_half_life(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(hours=1))
+        self._view(self.content, "10.0.0.2", NOW - timedelta(hours=1))
+
+        update_engagement(now=NOW)
+        log_score = self._log_score(self.content)
+
+        at_view = current_velocity(log_score, NOW - timedelta(hours=1))
+        self.assertAlmostEqual(at_view, 2.0, places=6)
+        self.assertAlmostEqual(
+            current_velocity(log_score, NOW - timedelta(hours=1) + HALF_LIFE),
+            1.0,
+            places=6,
+        )
+
+    def test_incremental_runs_match_a_single_pass(self):
+        for hours, ip in ((3, "10.0.0.1"), (2, "10.0.0.2"), (1, "10.0.0.3")):
+            self._view(self.content, ip, NOW - timedelta(hours=hours))
+
+        update_engagement(now=NOW)
+        single_pass = self._log_score(self.content)
+
+        EngagementScore.objects.all().delete()
+        EngagementWatermark.objects.all().delete()
+        update_engagement(now=NOW - timedelta(minutes=90))
+        update_engagement(now=NOW)
+
+        self.assertAlmostEqual(self._log_score(self.content), single_pass, places=9)
+
+    def test_rerun_without_new_views_changes_nothing(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(hours=1))
+        update_engagement(now=NOW)
+        log_score = self._log_score(self.content)
+
+        self.assertEqual(update_engagement(now=NOW + timedelta(minutes=1)), 0)
+        self.assertEqual(self._log_score(self.content), log_score)
+
+    def test_trending_ranks_by_velocity(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(hours=12))
+        self._view(self.content, "10.0.0.2", NOW - timedelta(hours=12))
+        self._view(self.other, "10.0.0.3", NOW - timedelta(minutes=30))
+
+        update_engagement(now=NOW)
+        trending = get_trending(get_user_model(), now=NOW)
+
+        # One fresh view beats two views that are two half-lives old.
+        self.assertEqual(
+            [object_id for object_id, _ in trending],
+            [str(self.other.pk), str(self.content.pk)],
+        )
+
+    def test_no_ranking_yet(self):
+        self.assertEqual(get_trending(get_user_model()), [])
@@ -0,0 +1,132 @@
+from datetime import date, datetime, timezone
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from apps.common.checks import check_view_partitions
+from apps.common.models import ContentView, RollupGranularity, RollupWatermark
+from apps.common.services.partitions import (
+    ARCHIVE_SCHEMA,
+    add_months,
+    ensure_partitions,
+    list_partitions,
+    month_start,
+    partition_name,
+    prune_partitions,
+)
+from apps.common.services.rollups import run_rollups
+from apps.common.tests.utils import create_user
+
+
+class MonthArithmeticTests(SimpleTestCase):
+    def test_month_start(self):
+        self.assertEqual(month_start(date(2026, 10, 18)), date(2026, 10, 1))
+
+    def test_add_months_crosses_years(self):
+        self.assertEqual(add_months(date(2026, 11, 1), 3), date(2027, 2, 1))
+        self.assertEqual(add_months(date(2026, 1, 1), -1), date(2025, 12, 1))
+
+    def test_partition_name(self):
+        self.assertEqual(
+            partition_name("common_contentview", date(2026, 3, 1)),
+            "common_contentview_y2026m03",
+        )
+
+
+class ContentViewPartitionTests(TestCase):
+    def setUp(self):
+        self.content = create_user()
+
+    def _roll_up_until(self, moment, granularities=RollupGranularity.values):
+        for granularity in granularities:
+            RollupWatermark.objects.create(granularity=granularity, processed_until=moment)
+
+    def _table_schema(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT schemaname FROM pg_tables WHERE tablename = %s", [name])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def test_ensure_partitions_is_idempotent(self):
+        created = ensure_partitions(ahead=1, today=date(2031, 1, 15))
+
+        self.assertEqual(
+            created,
+            ["common_contentview_y2031m01", "common_contentview_y2031m02"],
+        )
+        self.assertEqual(ensure_partitions(ahead=1, today=date(2031, 1, 15)), [])
+        self.assertIn(date(2031, 2, 1), list_partitions())
+
+    def test_hourly_rollup_creates_partitions_ahead(self):
+        run_rollups(now=datetime(2031, 6, 10, 12, tzinfo=timezone.utc))
+
+        self.assertIn(date(2031, 7, 1), list_partitions())
+
+    def test_deploy_check_reports_missing_partitions(self):
+        this_month = month_start(datetime.now(timezone.utc).date())
+        ensure_partitions(ahead=1)
+        self.assertEqual(check_view_partitions(None, databases=["default"]), [])
+
+        with mock.patch(
+            "apps.common.services.partitions.list_partitions",
+            return_value={this_month: "current"},
+        ):
+            errors = check_view_partitions(None, databases=["default"])
+        self.assertEqual([e.id for e in errors], ["common.E001"])
+
+        self.assertEqual(check_view_partitions(None), [])
+
+    def test_repeat_views_share_a_row_within_a_month(self):
+        ContentView.record_view(self.content, None, "10.0.0.1")
+        ContentView.record_view(self.content, None, "10.0.0.1")
+
+        self.assertEqual(ContentView.objects.count(), 1)
+
+        this_month = month_start(datetime.now(timezone.utc).date())
+        next_month = add_months(this_month, 1)
+        with mock.patch(
+            "django.utils.timezone.now",
+            return_value=datetime(next_month.year, next_month.month, 2, tzinfo=timezone.utc),
+        ):
+            ContentView.record_view(self.content, None, "10.0.0.1")
+
+        self.assertEqual(
+            sorted(ContentView.objects.values_list("month", flat=True)),
+            [this_month, next_month],
+        )
+
+    def test_prune_keeps_months_not_rolled_up(self):
+        ensure_partitions(ahead=1, today=date(2020, 1, 1))
+
+        self.assertEqual(prune_partitions(keep_months=12, today=date(2026, 10, 18)), [])
+        self.assertIn(date(2020, 1, 1), list_partitions())
+
+    def test_prune_waits_for_the_hourly_rollup(self):
+        ensure_partitions(ahead=1, today=date(2020, 1, 1))
+        self._roll_up_until(
+            datetime(2026, 10, 1, tzinfo=timezone.utc), [RollupGranularity.DAY]
+        )
+
+        self.assertEqual(prune_partitions(keep_months=12, today=date(2026, 10, 18)), [])
+
+    def test_prune_drops_old_rolled_up_months(self):
+        ensure_partitions(ahead=1, today=date(2020, 1, 1))
+        self._roll_up_until(datetime(2020, 2, 1, tzinfo=timezone.utc))
+
+        removed = prune_partitions(keep_months=12, today=date(2026, 10, 18))
+
+        # February is older than the cutoff but not fully rolled up yet.
+        self.assertEqual(removed, ["common_contentview_y2020m01"])
+        self.assertIsNone(self._table_schema("common_contentview_y2020m01"))
+        self.assertIn(date(2020, 2, 1), list_partitions())
+
+    def test_prune_can_archive(self):
+        ensure_partitions(ahead=0, today=date(2020, 1, 1))
+        self._roll_up_until(datetime(2026, 10, 1, tzinfo=timezone.utc))
+
+        removed = prune_partitions(keep_months=12, archive=True, today=date(2026, 10, 18))
+
+        self.assertEqual(removed, ["common_contentview_y2020m01"])
+        self.assertEqual(self._table_schema("common_contentview_y2020m01"), ARCHIVE_SCHEMA)
+        self.assertNotIn(date(2020, 1, 1), list_partitions())
@@ -0,0 +1,81 @@
+import uuid
+from os import getenv
+from unittest import skipUnless
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connection
+from django.test import TestCase, tag
+
+from apps.common.queries.view_plans import (
+    DEFAULT_BUDGET_MS,
+    explain,
+    hot_view_queries,
+    plan_problems,
+    seed_content_views,
+)
+from apps.common.tests.utils import create_user
+
+
+def seed(rows, objects, users):
+    users = [create_user(email=f"plan{i}@example.com") for i in range(users)]
+    object_ids = [uuid.uuid4() for _ in range(objects)]
+    content_type = ContentType.objects.get_for_model(users[0])
+    seed_content_views(
+        1, rows, content_type.id, object_ids, [user.id for user in users]
+    )
+    return hot_view_queries(content_type.id, object_ids[0], "10.0.0.3")
+
+
+class ContentViewQueryPlanTests(TestCase):
+    """
+    Every hot ContentView query must be answerable from an index. Sequential
+    scans are disabled so the check holds on a small seed: a Seq Scan that
+    still reads rows means no index can serve that query. Only plan shape is
+    checked; timings belong to ``LargeSeedQueryPlanTests`` and
+    ``benchmark_view_queries``.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.queries = seed(rows=2000, objects=50, users=5)
+
+    def setUp(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def test_hot_queries_use_indexes(self):
+        for name, queryset in self.queries.items():
+            with self.subTest(query=name):
+                self.assertEqual(
+                    plan_problems(explain(queryset), seq_scan_row_limit=1), []
+                )
+
+    def test_detects_sequential_scans(self):
+        from apps.common.models import ContentView
+
+        # No index covers updated_at, so this has to scan the table.
+        result = explain(ContentView.objects.filter(updated_at__isnull=False))
+
+        self.assertTrue(
+            any("Seq Scan" in p for p in plan_problems(result, seq_scan_row_limit=1))
+        )
+
+
+@tag("slow")
+@skipUnless(getenv("RUN_QUERY_PLAN_TESTS"), "set RUN_QUERY_PLAN_TESTS=1 to run the large-seed check")
+class LargeSeedQueryPlanTests(TestCase):
+    """
+    The same queries on a table large enough that the planner would rather
+    seq scan on its own, within the latency budget.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.queries = seed(rows=100_000, objects=2000, users=20)
+
+    def test_hot_queries_stay_fast_on_indexes(self):
+        for name, queryset in self.queries.items():
+            with self.subTest(query=name):
+                self.assertEqual(
+                    plan_problems(explain(queryset), budget_ms=DEFAULT_BUDGET_MS), []
+                )
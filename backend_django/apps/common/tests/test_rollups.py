@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+from apps.common.models import (
+    ContentView,
+    RollupGranularity,
+    RollupWatermark,
+    ViewRollup,
+    ViewTotal,
+)
+from apps.common.queries.analytics import get_view_count, get_view_counts_between
+from apps.common.services.rollups import backfill_view_totals, run_rollups
+from apps.common.tests.utils import create_user
+
+NOW = datetime(2026, 3, 10, 12, 30, tzinfo=timezone.utc)
+
+
+class ViewRollupTests(TestCase):
+    def setUp(self):
+        self.content = create_user()
+        self.other = create_user(email="other@example.com")
+        self.content_type = ContentType.objects.get_for_model(self.content)
+
+    def _view(self, content, ip, created_at, user=None):
+        view = ContentView.objects.create(
+            content_object=content, user=user, viewer_ip=ip
+        )
+        ContentView.objects.filter(pk=view.pk).update(
+            created_at=created_at, last_viewed=created_at
+        )
+
+    def test_rollup_buckets_closed_hours_and_days(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(hours=3))
+        self._view(self.content, "10.0.0.2", NOW - timedelta(hours=3))
+        self._view(self.content, "10.0.0.3", NOW - timedelta(days=1))
+        self._view(self.content, "10.0.0.4", NOW)  # open bucket
+
+        run_rollups(now=NOW)
+
+        hourly = ViewRollup.objects.get(
+            granularity=RollupGranularity.HOUR,
+            bucket_start=datetime(2026, 3, 10, 9, tzinfo=timezone.utc),
+        )
+        self.assertEqual((hourly.views, hourly.unique_viewers), (2, 2))
+
+        daily = ViewRollup.objects.get(granularity=RollupGranularity.DAY)
+        self.assertEqual(daily.bucket_start, datetime(2026, 3, 9, tzinfo=timezone.utc))
+        self.assertEqual(daily.views, 1)
+
+        self.assertEqual(
+            RollupWatermark.objects.get(granularity=RollupGranularity.HOUR).processed_until,
+            datetime(2026, 3, 10, 12, tzinfo=timezone.utc),
+        )
+
+    def test_rerun_only_processes_new_rows(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(hours=3))
+        run_rollups(now=NOW)
+
+        # A late row behind the watermark is not re-aggregated.
+        self._view(self.content, "10.0.0.2", NOW - timedelta(hours=3))
+        self.assertEqual(run_rollups(now=NOW), {"hour": 0, "day": 0})
+
+        self._view(self.content, "10.0.0.3", NOW + timedelta(minutes=40))
+        written = run_rollups(now=NOW + timedelta(hours=2))
+        self.assertEqual(written["hour"], 1)
+
+    def test_view_count_combines_rollups_and_raw_rows(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(days=2))
+        self._view(self.content, "10.0.0.2", NOW - timedelta(days=2))
+        run_rollups(now=NOW)
+        ContentView.record_view(self.content, None, "10.0.0.3")
+
+        self.assertEqual(get_view_count(self.content), 3)
+
+    def test_views_between_uses_rollups_and_open_bucket(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(hours=30))
+        self._view(self.content, "10.0.0.2", NOW - timedelta(hours=5))
+        self._view(self.other, "10.0.0.3", NOW - timedelta(hours=5))
+        run_rollups(now=NOW)
+        self._view(self.content, "10.0.0.4", NOW + timedelta(minutes=10))
+
+        counts = get_view_counts_between(
+            [self.content, self.other],
+            NOW - timedelta(hours=24),
+            NOW + timedelta(minutes=20),
+        )
+
+        self.assertEqual(counts, {self.content.pk: 2, self.other.pk: 1})
+
+    def test_hourly_rollup_accumulates_view_totals(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(hours=3))
+        self._view(self.content, "10.0.0.2", NOW - timedelta(hours=3))
+        run_rollups(now=NOW)
+        self._view(self.content, "10.0.0.3", NOW + timedelta(minutes=40))
+        run_rollups(now=NOW + timedelta(hours=2))
+
+        total = ViewTotal.objects.get()
+        self.assertEqual((total.views, total.unique_viewers), (3, 3))
+
+    def test_backfill_view_totals_runs_once(self):
+        self._view(self.content, "10.0.0.1", NOW - timedelta(days=3))
+        self._view(self.content, "10.0.0.2", NOW + timedelta(hours=1))
+        RollupWatermark.objects.create(granularity=RollupGranularity.HOUR, processed_until=NOW)
+
+        self.assertEqual(backfill_view_totals(), 1)
+        self.assertEqual(ViewTotal.objects.get().views, 1)
+        with self.assertRaises(ValueError):
+            backfill_view_totals()
@@ -0,0 +1,143 @@
+from datetime import timedelta
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.common.models import ContentView, ViewerSketch, ViewTotal
+from apps.common.queries.analytics import estimate_unique_viewers, get_unique_viewers
+from apps.common.services.hyperloglog import HyperLogLog
+from apps.common.services.rollups import rebuild_viewer_sketches, run_rollups
+from apps.common.tests.utils import create_user
+
+
+class HyperLogLogTests(SimpleTestCase):
+    def test_estimate_within_two_percent(self):
+        hll = HyperLogLog()
+        for i in range(50_000):
+            hll.add(f"viewer-{i}")
+
+        self.assertAlmostEqual(hll.count(), 50_000, delta=1_000)
+
+    def test_small_counts_are_exact_enough(self):
+        hll = HyperLogLog()
+        for i in range(100):
+            hll.add(f"viewer-{i}")
+            hll.add(f"viewer-{i}")
+
+        self.assertAlmostEqual(hll.count(), 100, delta=2)
+
+    def test_merge_is_a_union(self):
+        first, second = HyperLogLog(), HyperLogLog()
+        for i in range(1000):
+            first.add(f"viewer-{i}")
+        for i in range(500, 1500):
+            second.add(f"viewer-{i}")
+
+        merged = HyperLogLog.union([first, second])
+        self.assertAlmostEqual(merged.count(), 1500, delta=30)
+
+    def test_round_trip_serialization(self):
+        hll = HyperLogLog()
+        hll.add("viewer")
+        restored = HyperLogLog.from_bytes(hll.to_bytes())
+
+        self.assertEqual(restored.registers, hll.registers)
+        self.assertLess(len(hll.to_bytes()), 200)
+
+
+class UniqueViewerSketchTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.other = create_user(email="other@example.com")
+
+    def _view(self, content, ip):
+        ContentView.record_view(content_object=content, user=None, viewer_ip=ip)
+
+    def _roll_up(self):
+        # Far enough ahead that the current hour is closed.
+        run_rollups(now=timezone.now() + timedelta(hours=1, minutes=10))
+
+    def test_record_view_leaves_sketches_to_rollup(self):
+        self._view(self.user, "10.0.0.1")
+
+        self.assertFalse(ViewerSketch.objects.exists())
+
+    def test_rollup_maintains_sketch(self):
+        for i in range(20):
+            self._view(self.user, f"10.0.0.{i}")
+        self._view(self.user, "10.0.0.1")
+        self._roll_up()
+
+        # Today's sketch and the all-time one.
+        self.assertEqual(ViewerSketch.objects.count(), 2)
+        self.assertEqual(ViewTotal.objects.get().unique_viewers, 20)
+        self.assertEqual(get_unique_viewers(self.user), 20)
+        self.assertAlmostEqual(
+            get_unique_viewers(self.user, approximate=True), 20, delta=1
+        )
+
+    def test_every_count_uses_one_viewer_identity(self):
+        # A signed-in viewer counts once across IPs.
+        ContentView.record_view(self.user, self.other, "10.0.0.1")
+        ContentView.record_view(self.user, self.other, "10.0.0.2")
+        self._view(self.user, "10.0.0.3")
+        self._roll_up()
+
+        self.assertEqual(get_unique_viewers(self.user), 2)
+        self.assertEqual(get_unique_viewers(self.user, approximate=True), 2)
+        self.assertEqual(
+            estimate_unique_viewers([self.user], start=timezone.now().date()), 2
+        )
+        self.assertEqual(ViewTotal.objects.get().unique_viewers, 2)
+
+    def test_rebuild_refolds_retained_rows(self):
+        for i in range(5):
+            self._view(self.user, f"10.0.0.{i}")
+        self._roll_up()
+        ViewerSketch.objects.all().delete()
+
+        rebuild_viewer_sketches()
+
+        self.assertEqual(get_unique_viewers(self.user, approximate=True), 5)
+
+    def test_union_across_objects(self):
+        for i in range(10):
+            self._view(self.user, f"10.0.0.{i}")
+        for i in range(5, 15):
+            self._view(self.other, f"10.0.0.{i}")
+        self._roll_up()
+
+        self.assertAlmostEqual(
+            estimate_unique_viewers([self.user, self.other]), 15, delta=1
+        )
+
+    def test_date_range_filter(self):
+        self._view(self.user, "10.0.0.1")
+        self._roll_up()
+        today = timezone.now().date()
+
+        self.assertEqual(
+            estimate_unique_viewers([self.user], end=today - timedelta(days=1)), 0
+        )
+        self.assertEqual(estimate_unique_viewers([self.user], start=today), 1)
+
+    def test_later_runs_add_viewers_seen_since(self):
+        for i in range(10):
+            self._view(self.user, f"10.0.0.{i}")
+        self._roll_up()
+        for i in range(5, 15):
+            self._view(self.user, f"10.0.0.{i}")
+        # Seen again after the first run's window closed.
+        ContentView.objects.update(last_viewed=timezone.now() + timedelta(hours=2))
+
+        run_rollups(now=timezone.now() + timedelta(hours=3, minutes=10))
+
+        self.assertAlmostEqual(get_unique_viewers(self.user, approximate=True), 15, delta=1)
+
+    def test_exact_count_falls_back_to_estimate_after_pruning(self):
+        for i in range(3):
+            self._view(self.user, f"10.0.0.{i}")
+        self._roll_up()
+        ContentView.objects.filter(viewer_ip="10.0.0.0").delete()
+
+        self.assertEqual(get_unique_viewers(self.user), 3)
@@ -0,0 +1,116 @@
+from unittest import mock
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import OperationalError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.common.models import ContentView
+from apps.common.services import view_buffer as view_buffer_module
+from apps.common.services.view_buffer import ViewBuffer
+from apps.common.services.view_tracking import record_view
+from apps.common.tests.utils import create_user
+
+
+class ViewBufferTests(TestCase):
+    def setUp(self):
+        self.user = create_user()
+        self.content = self.user
+        self.content_type = ContentType.objects.get_for_model(self.content)
+        self.buffer = ViewBuffer(autostart=False)
+
+    def _add(self, user_id=None, viewer_ip="127.0.0.1"):
+        self.buffer.add(self.content_type.id, self.content.id, user_id, viewer_ip)
+
+    def test_duplicates_are_coalesced_before_flush(self):
+        for _ in range(5):
+            self._add(user_id=self.user.id)
+        self._add(viewer_ip="127.0.0.2")
+
+        self.assertEqual(self.buffer.pending_count(), 2)
+        self.assertEqual(self.buffer.flush(), 2)
+        self.assertEqual(ContentView.objects.count(), 2)
+        self.assertEqual(self.buffer.pending_count(), 0)
+
+    def test_flush_upserts_existing_rows(self):
+        self._add()
+        self.buffer.flush()
+        first = ContentView.objects.get()
+
+        self._add()
+        with CaptureQueriesContext(connection) as queries:
+            self.buffer.flush()
+        writes = [q for q in queries if "INSERT" in q["sql"]]
+        self.assertEqual(len(writes), 1)
+
+        view = ContentView.objects.get()
+        self.assertEqual(view.pk, first.pk)
+        self.assertGreater(view.last_viewed, first.last_viewed)
+
+    def test_anonymous_views_dedupe_across_flushes(self):
+        self._add(viewer_ip="10.0.0.1")
+        self.buffer.flush()
+        self._add(viewer_ip="10.0.0.1")
+        self.buffer.flush()
+
+        self.assertEqual(ContentView.objects.count(), 1)
+
+    def test_empty_flush_is_a_no_op(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(self.buffer.flush(), 0)
+
+    def test_failing_row_does_not_block_the_batch(self):
+        self._add(viewer_ip="10.0.0.1")
+        self._add(viewer_ip="not-an-ip")
+        self._add(viewer_ip="10.0.0.2")
+
+        self.assertEqual(self.buffer.flush(), 2)
+        self.assertEqual(ContentView.objects.count(), 2)
+        self.assertEqual(self.buffer.pending_count(), 1)
+
+    def test_failing_row_is_dropped_after_max_attempts(self):
+        buffer = ViewBuffer(max_attempts=2, autostart=False)
+        buffer.add(self.content_type.id, self.content.id, None, "not-an-ip")
+
+        buffer.flush()
+        self.assertEqual(buffer.pending_count(), 1)
+        buffer.flush()
+        self.assertEqual(buffer.pending_count(), 0)
+        self.assertEqual(ContentView.objects.count(), 0)
+
+    def test_transient_failure_requeues_the_whole_batch(self):
+        self._add(viewer_ip="10.0.0.1")
+        self._add(viewer_ip="10.0.0.2")
+
+        with mock.patch.object(
+            ContentView.objects, "bulk_create", side_effect=OperationalError
+        ) as bulk_create:
+            with self.assertRaises(OperationalError):
+                self.buffer.flush()
+
+        bulk_create.assert_called_once()
+        self.assertEqual(self.buffer.pending_count(), 2)
+        self.assertEqual(self.buffer.flush(), 2)
+
+    def test_new_views_are_dropped_when_buffer_is_full(self):
+        buffer = ViewBuffer(max_buffered=2, autostart=False)
+        for ip in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            buffer.add(self.content_type.id, self.content.id, None, ip)
+        buffer.add(self.content_type.id, self.content.id, None, "10.0.0.1")
+
+        self.assertEqual(buffer.pending_count(), 2)
+        self.assertEqual(buffer.flush(), 2)
+
+    @override_settings(CONTENT_VIEW_RECORDING="buffered")
+    def test_record_view_defers_write_in_buffered_mode(self):
+        buffer = ViewBuffer(autostart=False)
+        original = view_buffer_module.view_buffer
+        view_buffer_module.view_buffer = buffer
+        try:
+            record_view(self.content, None, "127.0.0.1")
+            self.assertEqual(ContentView.objects.count(), 0)
+
+            buffer.flush()
+            self.assertEqual(ContentView.objects.count(), 1)
+        finally:
+            view_buffer_module.view_buffer = original
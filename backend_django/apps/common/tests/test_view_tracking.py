@@ -1,7 +1,19 @@
 import uuid
+from unittest import mock
 
-from django.test import TestCase
-from apps.common.services.view_tracking import should_count_view
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import request_finished
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from apps.common.models import ContentView
+from apps.common.services.recent_views import get_recent_views
+from apps.common.services.view_tracking import (
+    call_on_close,
+    get_client_ip,
+    record_view,
+    should_count_view,
+)
 from apps.common.tests.utils import create_user
 
 class DummyContent:
@@ -11,6 +23,7 @@ class DummyContent:
 
 class ViewTrackingTests(TestCase):
     def setUp(self):
+        cache.clear()
         self.user = create_user()
         self.content = DummyContent(created_by_id=self.user.id)
 
@@ -36,4 +49,89 @@ class ViewTrackingTests(TestCase):
             user=None,
             viewer_ip="127.0.0.1",
         )
-        self.assertTrue(result)
\ No newline at end of file
+        self.assertTrue(result)
+
+
+    def test_repeat_views_of_one_claim_are_not_throttled(self):
+        content = DummyContent()
+        for _ in range(50):
+            self.assertTrue(should_count_view(content, self.user, "127.0.0.1"))
+
+    def test_many_claims_are_throttled(self):
+        results = [
+            should_count_view(DummyContent(), self.user, "127.0.0.1") for _ in range(31)
+        ]
+
+        self.assertTrue(all(results[:30]))
+        self.assertFalse(results[30])
+
+
+class RecentViewFastPathTests(TestCase):
+    def setUp(self):
+        get_recent_views.cache_clear()
+        self.addCleanup(get_recent_views.cache_clear)
+        self.content = create_user()
+
+    def test_repeat_view_skips_database(self):
+        record_view(self.content, None, "127.0.0.1")
+
+        with self.assertNumQueries(0):
+            record_view(self.content, None, "127.0.0.1")
+        self.assertEqual(ContentView.objects.count(), 1)
+
+    def test_failed_write_is_not_remembered(self):
+        with mock.patch.object(ContentView, "record_view", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                record_view(self.content, None, "127.0.0.1")
+
+        record_view(self.content, None, "127.0.0.1")
+        self.assertEqual(ContentView.objects.count(), 1)
+
+    def test_other_viewers_are_still_recorded(self):
+        viewer = create_user(email="viewer@example.com")
+        record_view(self.content, None, "127.0.0.1")
+        record_view(self.content, viewer, "127.0.0.1")
+        record_view(self.content, None, "127.0.0.2")
+
+        self.assertEqual(ContentView.objects.count(), 3)
+
+
+class ClientIpTests(SimpleTestCase):
+    def _request(self):
+        return RequestFactory().get(
+            "/", REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="6.6.6.6, 203.0.113.5"
+        )
+
+    def test_ignores_forwarded_for_without_trusted_proxies(self):
+        self.assertEqual(get_client_ip(self._request()), "10.0.0.1")
+
+    def test_uses_address_added_by_trusted_proxy(self):
+        with override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}):
+            self.assertEqual(get_client_ip(self._request()), "203.0.113.5")
+
+
+class CallOnCloseTests(SimpleTestCase):
+    def test_runs_callback_before_request_finished(self):
+        calls = []
+
+        def on_finished(**kwargs):
+            calls.append("finished")
+
+        response = HttpResponse()
+        call_on_close(response, lambda: calls.append("callback"))
+        request_finished.connect(on_finished)
+        try:
+            response.close()
+        finally:
+            request_finished.disconnect(on_finished)
+
+        self.assertEqual(calls, ["callback", "finished"])
+        self.assertTrue(response.closed)
+
+    def test_failing_callback_still_closes(self):
+        response = HttpResponse()
+        call_on_close(response, lambda: 1 / 0)
+
+        response.close()
+
+        self.assertTrue(response.closed)
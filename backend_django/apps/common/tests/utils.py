@@ -1,5 +1,9 @@
 import uuid
+from contextlib import contextmanager
+
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 User = get_user_model()
 
@@ -9,4 +13,41 @@ def create_user(email="test@example.com", **kwargs):
         "full_name": "User",
     }
     defaults.update(kwargs)
-    return User.objects.create_user(email=email, **defaults)
\ No newline at end of file
+    return User.objects.create_user(email=email, **defaults)
+
+class QueryBudgetMixin:
+    """
+    TestCase mixin for pinning the number of SQL queries an endpoint may issue.
+    """
+
+    @contextmanager
+    def assertQueryBudget(self, budget):
+        with CaptureQueriesContext(connection) as ctx:
+            yield ctx
+
+        executed = len(ctx.captured_queries)
+        if executed > budget:
+            queries = "\n".join(
+                f"{i}. {query['sql']}"
+                for i, query in enumerate(ctx.captured_queries, start=1)
+            )
+            self.fail(
+                f"{executed} queries executed, budget is {budget}:\n{queries}"
+            )
+
+    def assertQueryCountStable(self, make_request, add_rows):
+        """
+        Run ``make_request`` before and after ``add_rows`` and require the same
+        query count, so rendering cost does not scale with the page size.
+        """
+        with CaptureQueriesContext(connection) as before:
+            make_request()
+        add_rows()
+        with CaptureQueriesContext(connection) as after:
+            make_request()
+
+        self.assertEqual(
+            len(before.captured_queries),
+            len(after.captured_queries),
+            "Query count changed with the number of rows rendered.",
+        )
@@ -1,3 +1,91 @@
-from django.shortcuts import render
+import hashlib
+from calendar import timegm
 
-# Create your views here.
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+
+from apps.common.serializers import FIELDS_QUERY_PARAM
+from apps.common.services.view_tracking import get_client_ip, track_view_after_response
+
+
+class ConditionalRetrieveMixin:
+    """
+    ETag / Last-Modified support for ``retrieve`` on TimeStampedModel views.
+
+    Validators come from a single lookup against the view's queryset, so an
+    unchanged object is answered with 304 before it is loaded or serialized.
+    Models must bump ``updated_at`` whenever their rendered representation
+    changes. Nested data from related rows without their own ``updated_at``
+    is covered by listing the rendered columns in
+    ``conditional_related_fields``; those views ignore If-Modified-Since,
+    since a date cannot capture such changes.
+    """
+
+    conditional_related_fields = ()
+
+    def get_validator_values(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        filter_kwargs = {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        return (
+            self.filter_queryset(self.get_queryset())
+            .filter(**filter_kwargs)
+            .values_list("updated_at", *self.conditional_related_fields)
+            .first()
+        )
+
+    def get_etag(self, values):
+        # ?fields= changes the body, so it is part of the validator.
+        requested = self.request.query_params.get(FIELDS_QUERY_PARAM, "")
+        fields = ",".join(sorted({name.strip() for name in requested.split(",")} - {""}))
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        state = repr((self.kwargs[lookup_url_kwarg], values[0].timestamp(), values[1:], fields))
+        return quote_etag(hashlib.sha256(state.encode()).hexdigest()[:32])
+
+    def retrieve(self, request, *args, **kwargs):
+        values = self.get_validator_values()
+        if values is None:
+            # Let the normal path raise 404 / permission errors.
+            return super().retrieve(request, *args, **kwargs)
+
+        etag = self.get_etag(values)
+        last_modified = timegm(values[0].utctimetuple())
+
+        not_modified = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=None if self.conditional_related_fields else last_modified,
+        )
+        if not_modified is not None:
+            return not_modified
+
+        response = super().retrieve(request, *args, **kwargs)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        return response
+
+
+class ViewTrackingMixin:
+    """
+    Records a ContentView for each successful ``retrieve`` once the response
+    has been sent (see ``track_view_after_response``).
+
+    Only responses that loaded the object are tracked; a 304 from
+    ``ConditionalRetrieveMixin`` is a client re-validating a copy it already
+    has.
+    """
+
+    def get_object(self):
+        obj = super().get_object()
+        self._viewed_object = obj
+        return obj
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        content_object = getattr(self, "_viewed_object", None)
+        if content_object is not None and response.status_code == status.HTTP_200_OK:
+            user = request.user if request.user.is_authenticated else None
+            track_view_after_response(
+                response, content_object, user, get_client_ip(request)
+            )
+        return response
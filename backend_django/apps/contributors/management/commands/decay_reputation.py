@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from apps.contributors.services.decay import DECAY_CHUNK_SIZE, decay_reputation
+
+
+class Command(BaseCommand):
+    help = (
+        "Decay inactive contributors' reputation for the time since the last "
+        "run and apply the reputation cap (run daily). An interrupted run "
+        "resumes where it stopped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=DECAY_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        changed = decay_reputation(chunk_size=options["chunk_size"])
+        self.stdout.write(f"{changed} contributor(s) adjusted")
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.contributors.services.leaderboard import rebuild_leaderboard, refresh_leaderboard
+
+
+class Command(BaseCommand):
+    help = (
+        "Re-rank contributors whose reputation changed since the last run. "
+        "Run with --full periodically (e.g. nightly) to also pick up "
+        "activations, deactivations and deletions that leave no ReputationLog."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Rebuild the whole snapshot instead of refreshing it.",
+        )
+
+    def handle(self, *args, **options):
+        if options["full"]:
+            total = rebuild_leaderboard()
+            self.stdout.write(f"Leaderboard rebuilt with {total} contributor(s)")
+        else:
+            changed = refresh_leaderboard()
+            self.stdout.write(f"{changed} leaderboard entry(ies) updated")
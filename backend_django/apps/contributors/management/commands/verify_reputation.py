@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.contributors.services.checkpoints import AUDIT_CHUNK_SIZE, audit_reputation
+
+
+class Command(BaseCommand):
+    help = (
+        "Replay every contributor's ReputationLog from their latest checkpoint "
+        "and report scores that drifted from it. Exits non-zero on drift."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Ignore checkpoints and sum each contributor's whole history.",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            action="store_true",
+            help="Advance checkpoints to the logs replayed (run nightly).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=AUDIT_CHUNK_SIZE)
+        parser.add_argument(
+            "--show",
+            type=int,
+            default=50,
+            help="Drifted contributors to list.",
+        )
+
+    def handle(self, *args, **options):
+        result = audit_reputation(
+            use_checkpoints=not options["full"],
+            checkpoint=options["checkpoint"],
+            chunk_size=options["chunk_size"],
+        )
+        self.stdout.write(
+            f"{result['contributors']} contributor(s) audited, "
+            f"{result['checkpointed']} checkpoint(s) advanced"
+        )
+
+        drift = result["drift"]
+        if not drift:
+            return
+        for contributor_id, stored, replayed in drift[: options["show"]]:
+            self.stdout.write(
+                f"  {contributor_id}: stored {stored} != replayed {replayed} "
+                f"({stored - replayed:+})"
+            )
+        raise CommandError(f"{len(drift)} contributor(s) drifted from their ReputationLog")
@@ -0,0 +1,67 @@
+# Generated by Django 6.0.1 on 2026-10-18 18:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contributors", "0002_reputationlog"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contributor",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["-reputation_score", "id"],
+                name="contributor_active_rank_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reputationlog",
+            index=models.Index(fields=["created_at"], name="reputation_log_created_idx"),
+        ),
+        migrations.CreateModel(
+            name="LeaderboardState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("processed_until", models.DateTimeField()),
+                ("total", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="LeaderboardEntry",
+            fields=[
+                (
+                    "contributor",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="leaderboard_entry",
+                        serialize=False,
+                        to="contributors.contributor",
+                    ),
+                ),
+                ("score", models.FloatField()),
+                ("rank", models.PositiveIntegerField()),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["rank"], name="leaderboard_rank_idx"),
+                    models.Index(
+                        fields=["-score", "contributor"], name="leaderboard_score_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contributors", "0003_leaderboard"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReputationCheckpoint",
+            fields=[
+                (
+                    "contributor",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="reputation_checkpoint",
+                        serialize=False,
+                        to="contributors.contributor",
+                    ),
+                ),
+                ("score", models.FloatField()),
+                ("log_count", models.PositiveBigIntegerField()),
+                ("last_log_at", models.DateTimeField()),
+                ("last_log_id", models.UUIDField()),
+                ("checkpointed_at", models.DateTimeField()),
+            ],
+        ),
+    ]
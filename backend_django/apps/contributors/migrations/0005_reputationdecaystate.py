@@ -0,0 +1,30 @@
+# Generated by Django 6.0.1 on 2026-10-18 19:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contributors", "0004_reputationcheckpoint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReputationDecayState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("processed_until", models.DateTimeField()),
+                ("run_until", models.DateTimeField(blank=True, null=True)),
+                ("cursor", models.UUIDField(blank=True, null=True)),
+            ],
+        ),
+    ]
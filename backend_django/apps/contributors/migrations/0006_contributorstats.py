@@ -0,0 +1,71 @@
+# Generated by Django 6.0.1 on 2026-10-18 20:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+    INSERT INTO contributors_contributorstats (
+        contributor_id, total_logs, recent_activity, change_by_reason, updated_at
+    )
+    SELECT
+        l.contributor_id,
+        COUNT(*),
+        jsonb_path_query_array(
+            jsonb_agg(
+                jsonb_build_object(
+                    'id', l.id, 'change', l.change, 'reason', l.reason,
+                    'created_at', l.created_at
+                )
+                ORDER BY l.created_at DESC, l.id DESC
+            ),
+            '$[0 to 4]'
+        ),
+        (
+            SELECT jsonb_object_agg(reason, total)
+            FROM (
+                SELECT reason, SUM(change) AS total
+                FROM contributors_reputationlog
+                WHERE contributor_id = l.contributor_id
+                GROUP BY reason
+            ) AS r
+        ),
+        now()
+    FROM contributors_reputationlog AS l
+    GROUP BY l.contributor_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contributors", "0005_reputationdecaystate"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reputationlog",
+            index=models.Index(
+                fields=["contributor", "-created_at"], name="reputation_log_recent_idx"
+            ),
+        ),
+        migrations.CreateModel(
+            name="ContributorStats",
+            fields=[
+                (
+                    "contributor",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="contributors.contributor",
+                    ),
+                ),
+                ("total_logs", models.PositiveBigIntegerField(default=0)),
+                ("recent_activity", models.JSONField(default=list)),
+                ("change_by_reason", models.JSONField(default=dict)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 6.0.1 on 2026-10-18 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contributors", "0006_contributorstats"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="reputationlog",
+            index=models.Index(
+                fields=["contributor", "created_at", "id"],
+                include=["change"],
+                name="reputation_log_replay_idx",
+            ),
+        ),
+    ]
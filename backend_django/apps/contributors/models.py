@@ -3,6 +3,7 @@ from django.conf import settings
 from apps.common.models import TimeStampedModel
 from django.db.models import F
 from django.db import transaction
+from django.utils import timezone
 
 class Contributor(TimeStampedModel):
     """
@@ -21,6 +22,18 @@ class Contributor(TimeStampedModel):
     reputation_score = models.FloatField(default=0.0)
     is_active = models.BooleanField(default=True)
 
+    class Meta:
+        indexes = [
+            # Ordered scans of active contributors for leaderboard rebuilds.
+            # Partial, so it does not serve the admin's -reputation_score
+            # ordering, which also lists inactive contributors.
+            models.Index(
+                fields=["-reputation_score", "id"],
+                condition=models.Q(is_active=True),
+                name="contributor_active_rank_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.display_name or self.user.email
 
@@ -30,15 +43,19 @@ class Contributor(TimeStampedModel):
         """
         Adjust contributor reputation and record an audit log.
         """
+        from apps.contributors.services.stats import log_rows, update_contributor_stats
+
         with transaction.atomic():
             Contributor.objects.filter(pk=self.pk).update(
-                reputation_score=F("reputation_score") + change
+                reputation_score=F("reputation_score") + change,
+                updated_at=timezone.now(),
             )
-            ReputationLog.objects.create(
+            log = ReputationLog.objects.create(
                 contributor=self,
                 change=change,
                 reason=reason,
             )
+            update_contributor_stats(log_rows([log]))
 
 
 class ReputationLog(TimeStampedModel):
@@ -52,6 +69,119 @@ class ReputationLog(TimeStampedModel):
     )
     change = models.FloatField()
     reason = models.CharField(max_length=255)
-    
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["created_at"], name="reputation_log_created_idx"),
+            # A contributor's history, newest first (recent activity, replays).
+            models.Index(
+                fields=["contributor", "-created_at"], name="reputation_log_recent_idx"
+            ),
+            # Replays from a checkpoint (services/checkpoints.py): seeks on
+            # (contributor, created_at) and sums change without heap fetches.
+            models.Index(
+                fields=["contributor", "created_at", "id"],
+                include=["change"],
+                name="reputation_log_replay_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.contributor.display_name}: {self.change} ({self.reason})"
+
+
+class LeaderboardEntry(models.Model):
+    """
+    Ranked snapshot row for an active contributor, maintained by
+    ``services/leaderboard.py``. ``rank`` is 1-based and ties on score are
+    broken by contributor id, so every rank is distinct.
+    """
+    contributor = models.OneToOneField(
+        Contributor,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="leaderboard_entry",
+    )
+    score = models.FloatField()
+    rank = models.PositiveIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["rank"], name="leaderboard_rank_idx"),
+            models.Index(fields=["-score", "contributor"], name="leaderboard_score_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.rank} {self.contributor_id} ({self.score})"
+
+
+class LeaderboardState(models.Model):
+    """
+    Single row: ReputationLog rows before ``processed_until`` are reflected
+    in the snapshot, which holds ``total`` entries.
+    """
+    processed_until = models.DateTimeField()
+    total = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"Leaderboard of {self.total} until {self.processed_until}"
+
+
+class ReputationCheckpoint(models.Model):
+    """
+    Reputation implied by a contributor's ReputationLog up to and including
+    the log at (``last_log_at``, ``last_log_id``). Replays and audits start
+    here instead of summing the whole history. Maintained by
+    ``services/checkpoints.py``.
+    """
+    contributor = models.OneToOneField(
+        Contributor,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="reputation_checkpoint",
+    )
+    score = models.FloatField()
+    log_count = models.PositiveBigIntegerField()
+    last_log_at = models.DateTimeField()
+    last_log_id = models.UUIDField()
+    checkpointed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.contributor_id}: {self.score} after {self.log_count} log(s)"
+
+
+class ReputationDecayState(models.Model):
+    """
+    Single row for ``services/decay.py``: scores are decayed up to
+    ``processed_until``. While a run is in progress, ``run_until`` is its
+    target time and contributors up to ``cursor`` are done, so an
+    interrupted run resumes instead of decaying anyone twice.
+    """
+    processed_until = models.DateTimeField()
+    run_until = models.DateTimeField(null=True, blank=True)
+    cursor = models.UUIDField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Reputation decayed until {self.processed_until}"
+
+
+class ContributorStats(models.Model):
+    """
+    Denormalized ReputationLog summary for one contributor, updated in the
+    same transaction as every log write (see ``services/stats.py``).
+    ``recent_activity`` holds the newest logs as JSON, newest first, and
+    ``change_by_reason`` the summed change per reason.
+    """
+    contributor = models.OneToOneField(
+        Contributor,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="stats",
+    )
+    total_logs = models.PositiveBigIntegerField(default=0)
+    recent_activity = models.JSONField(default=list)
+    change_by_reason = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
     def __str__(self):
-        return f"{self.contributor.display_name}: {self.change} ({self.reason})"
\ No newline at end of file
+        return f"{self.contributor_id}: {self.total_logs} log(s)"
@@ -1,8 +1,9 @@
 from rest_framework import serializers
-from .models import Contributor, ReputationLog
+from apps.common.serializers import SparseFieldsetMixin
+from .models import Contributor, LeaderboardEntry, ReputationLog
 
 
-class ContributorSummarySerializer(serializers.ModelSerializer):
+class ContributorSummarySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Contributor
         fields = [
@@ -15,7 +16,7 @@ class ContributorSummarySerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "reputation_score", "is_active", "created_at"]
 
-class ContributorPublicSerializer(serializers.ModelSerializer):
+class ContributorPublicSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Contributor
         fields = [
@@ -25,7 +26,7 @@ class ContributorPublicSerializer(serializers.ModelSerializer):
             "reputation_score",
         ]
 
-class ContributorSelfSerializer(serializers.ModelSerializer):
+class ContributorSelfSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Contributor
         fields = [
@@ -61,3 +62,18 @@ class ReputationLogSerializer(serializers.ModelSerializer):
             "created_at",
         ]
         read_only_fields = fields
+
+
+class LeaderboardEntrySerializer(serializers.ModelSerializer):
+    contributor_id = serializers.UUIDField(read_only=True)
+    display_name = serializers.CharField(source="contributor.display_name", read_only=True)
+
+    class Meta:
+        model = LeaderboardEntry
+        fields = [
+            "rank",
+            "contributor_id",
+            "display_name",
+            "score",
+        ]
+        read_only_fields = fields
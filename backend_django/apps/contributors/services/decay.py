@@ -0,0 +1,144 @@
+"""
+Scheduled reputation decay and cap.
+
+Contributors with no ReputationLog activity (other than this job's own
+entries) within ``ACTIVITY_WINDOW`` see their score decay towards zero with
+half-life ``HALF_LIFE``, and every score is capped at ``REPUTATION_CAP``.
+Each chunk of contributors is handled by one statement that computes the
+new scores, updates only the rows that changed and writes one ReputationLog
+per changed contributor, so the log still replays to the stored score;
+those logs are folded into ContributorStats in the same transaction.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.contributors.models import Contributor, ReputationDecayState, ReputationLog
+from apps.contributors.services.checkpoints import NIL_UUID
+from apps.contributors.services.stats import update_contributor_stats
+
+HALF_LIFE = timedelta(days=getattr(settings, "REPUTATION_HALF_LIFE_DAYS", 180))
+ACTIVITY_WINDOW = timedelta(days=getattr(settings, "REPUTATION_ACTIVITY_WINDOW_DAYS", 30))
+REPUTATION_CAP = getattr(settings, "REPUTATION_CAP", 1000.0)
+# Decayed scores smaller than this snap to zero instead of shrinking forever.
+MIN_SCORE = 0.01
+DECAY_CHUNK_SIZE = 10_000
+
+DECAY_REASON = "Inactivity decay"
+CAP_REASON = "Reputation cap"
+
+BOUND_SQL = "SELECT id FROM {contributors} WHERE id > %s ORDER BY id OFFSET %s LIMIT 1"
+
+DECAY_SQL = """
+    WITH target AS (
+        SELECT c.id, c.reputation_score AS old_score, LEAST(
+            CASE
+                WHEN EXISTS (
+                    SELECT 1 FROM {logs} AS l
+                    WHERE l.contributor_id = c.id
+                      AND l.created_at >= %(active_since)s
+                      AND l.reason NOT IN (%(decay_reason)s, %(cap_reason)s)
+                ) THEN c.reputation_score
+                WHEN abs(c.reputation_score * %(factor)s) < %(min_score)s THEN 0
+                ELSE c.reputation_score * %(factor)s
+            END,
+            %(cap)s
+        ) AS new_score
+        FROM {contributors} AS c
+        WHERE c.id > %(after)s AND (%(last)s::uuid IS NULL OR c.id <= %(last)s::uuid)
+        FOR UPDATE OF c
+    ),
+    changed AS (
+        UPDATE {contributors} AS c
+        SET reputation_score = t.new_score, updated_at = %(now)s
+        FROM target AS t
+        WHERE c.id = t.id AND t.new_score <> t.old_score
+        RETURNING c.id, t.new_score - t.old_score AS change, t.new_score = %(cap)s AS capped
+    )
+    INSERT INTO {logs} (id, created_at, updated_at, contributor_id, change, reason)
+    SELECT
+        gen_random_uuid(), %(now)s, %(now)s, id, change,
+        CASE WHEN capped THEN %(cap_reason)s ELSE %(decay_reason)s END
+    FROM changed
+    RETURNING contributor_id, id, change, reason, created_at
+"""
+
+
+def _tables():
+    quote = connection.ops.quote_name
+    return {
+        "contributors": quote(Contributor._meta.db_table),
+        "logs": quote(ReputationLog._meta.db_table),
+    }
+
+
+def decay_reputation(now=None, chunk_size: int = DECAY_CHUNK_SIZE) -> int:
+    """
+    Decay and cap reputation for the time since the last run, up to
+    ``now``. The first run only records a starting point. Logs are stamped
+    when their chunk is written. Returns the number of contributors whose
+    score changed.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        state, created = ReputationDecayState.objects.select_for_update().get_or_create(
+            pk=1, defaults={"processed_until": now}
+        )
+        if created:
+            return 0
+        if state.run_until is None:
+            state.run_until, state.cursor = now, NIL_UUID
+            state.save(update_fields=["run_until", "cursor"])
+
+    tables = _tables()
+    bound_sql = BOUND_SQL.format(**tables)
+    decay_sql = DECAY_SQL.format(**tables)
+    changed = 0
+
+    while True:
+        # One chunk per transaction keeps row locks short; the cursor commits
+        # with the chunk, so a crash resumes after the last finished one.
+        with transaction.atomic(), connection.cursor() as cursor:
+            state = ReputationDecayState.objects.select_for_update().get(pk=1)
+            if state.run_until is None:
+                break  # finished by a concurrent run
+
+            elapsed = state.run_until - state.processed_until
+            cursor.execute(bound_sql, [state.cursor, chunk_size - 1])
+            row = cursor.fetchone()
+            last = row[0] if row else None
+
+            cursor.execute(
+                decay_sql,
+                {
+                    "after": state.cursor,
+                    "last": last,
+                    "factor": 0.5 ** (elapsed / HALF_LIFE),
+                    "active_since": state.run_until - ACTIVITY_WINDOW,
+                    "cap": REPUTATION_CAP,
+                    "min_score": MIN_SCORE,
+                    "decay_reason": DECAY_REASON,
+                    "cap_reason": CAP_REASON,
+                    # Stamped per chunk, not with the job's start time: a
+                    # long run would otherwise write logs dated well before
+                    # they commit, behind audit checkpoints that passed them.
+                    "now": timezone.now(),
+                },
+            )
+            logs = cursor.fetchall()
+            update_contributor_stats(logs)
+            changed += len(logs)
+
+            if last is None:
+                state.processed_until = state.run_until
+                state.run_until = state.cursor = None
+            else:
+                state.cursor = last
+            state.save(update_fields=["processed_until", "run_until", "cursor"])
+            if last is None:
+                break
+
+    return changed
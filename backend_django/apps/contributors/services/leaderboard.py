@@ -0,0 +1,174 @@
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Subquery
+from django.utils import timezone
+
+from apps.contributors.models import (
+    Contributor,
+    LeaderboardEntry,
+    LeaderboardState,
+    ReputationLog,
+)
+
+# Logs can commit slightly after their created_at; each refresh re-reads this
+# much history. Harmless, since a refresh only looks up current scores.
+SETTLE_DELAY = timedelta(minutes=5)
+
+REBUILD_SQL = """
+    INSERT INTO {entries} (contributor_id, score, rank)
+    SELECT id, reputation_score, ROW_NUMBER() OVER (ORDER BY reputation_score DESC, id)
+    FROM {contributors}
+    WHERE is_active
+"""
+
+# Entries strictly above the window keep their ranks, so the one closest to
+# it holds the number of entries ahead of the window.
+OFFSET_SQL = """
+    SELECT rank FROM {entries}
+    WHERE score > %s
+    ORDER BY score ASC, contributor_id DESC
+    LIMIT 1
+"""
+
+RERANK_WINDOW_SQL = """
+    UPDATE {entries} AS e
+    SET rank = %s + w.n
+    FROM (
+        SELECT contributor_id, ROW_NUMBER() OVER (ORDER BY score DESC, contributor_id) AS n
+        FROM {entries}
+        WHERE score BETWEEN %s AND %s
+    ) AS w
+    WHERE e.contributor_id = w.contributor_id AND e.rank <> %s + w.n
+"""
+
+SHIFT_BELOW_SQL = "UPDATE {entries} SET rank = rank + %s WHERE score < %s"
+
+
+def _tables():
+    quote = connection.ops.quote_name
+    return {
+        "entries": quote(LeaderboardEntry._meta.db_table),
+        "contributors": quote(Contributor._meta.db_table),
+    }
+
+
+def rebuild_leaderboard(now=None) -> int:
+    """
+    Rank every active contributor from scratch. Returns the entry count.
+    """
+    now = now or timezone.now()
+    tables = _tables()
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {tables['entries']}")
+        cursor.execute(REBUILD_SQL.format(**tables))
+        total = cursor.rowcount
+        LeaderboardState.objects.update_or_create(
+            pk=1, defaults={"processed_until": now, "total": total}
+        )
+    return total
+
+
+def refresh_leaderboard(now=None) -> int:
+    """
+    Re-rank only the contributors with ReputationLog rows since the last
+    refresh (or rebuild if there is no snapshot yet). Returns the number of
+    entries whose score or membership changed.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        state = LeaderboardState.objects.select_for_update().filter(pk=1).first()
+        if state is None:
+            rebuild_leaderboard(now)
+            return LeaderboardState.objects.get(pk=1).total
+
+        changed_ids = set(
+            ReputationLog.objects.filter(
+                created_at__gte=state.processed_until - SETTLE_DELAY
+            )
+            .order_by()
+            .values_list("contributor_id", flat=True)
+            .distinct()
+        )
+        changed = _apply_changes(state, changed_ids) if changed_ids else 0
+
+        state.processed_until = now
+        state.save(update_fields=["processed_until", "total"])
+    return changed
+
+
+def _apply_changes(state, contributor_ids) -> int:
+    old = dict(
+        LeaderboardEntry.objects.filter(contributor_id__in=contributor_ids).values_list(
+            "contributor_id", "score"
+        )
+    )
+    new = dict(
+        Contributor.objects.filter(pk__in=contributor_ids, is_active=True).values_list(
+            "id", "reputation_score"
+        )
+    )
+
+    removed = old.keys() - new.keys()
+    added = new.keys() - old.keys()
+    moved = {pk for pk in old.keys() & new.keys() if old[pk] != new[pk]}
+    scores = [old[pk] for pk in removed | moved] + [new[pk] for pk in added | moved]
+    if not scores:
+        return 0
+
+    # Only entries scored within [low, high] can change rank relative to each
+    # other; entries below it shift by the change in membership.
+    low, high = min(scores), max(scores)
+    tables = _tables()
+
+    LeaderboardEntry.objects.filter(contributor_id__in=removed).delete()
+    LeaderboardEntry.objects.bulk_update(
+        [LeaderboardEntry(contributor_id=pk, score=new[pk], rank=0) for pk in moved],
+        ["score"],
+        batch_size=1000,
+    )
+    LeaderboardEntry.objects.bulk_create(
+        [LeaderboardEntry(contributor_id=pk, score=new[pk], rank=0) for pk in added],
+        batch_size=1000,
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(OFFSET_SQL.format(**tables), [high])
+        row = cursor.fetchone()
+        offset = row[0] if row else 0
+
+        delta = len(added) - len(removed)
+        if delta:
+            cursor.execute(SHIFT_BELOW_SQL.format(**tables), [delta, low])
+        cursor.execute(RERANK_WINDOW_SQL.format(**tables), [offset, low, high, offset])
+
+    state.total += len(added) - len(removed)
+    return len(removed) + len(added) + len(moved)
+
+
+def top_contributors(limit: int):
+    """
+    The first ``limit`` leaderboard entries, with their contributors.
+    """
+    return LeaderboardEntry.objects.select_related("contributor").order_by("rank")[:limit]
+
+
+def contributor_standing(contributor) -> dict | None:
+    """
+    Rank, score, leaderboard size and percentile for one contributor, or
+    None if they are not ranked. One indexed lookup.
+    """
+    entry = (
+        LeaderboardEntry.objects.filter(contributor=contributor)
+        .annotate(total=Subquery(LeaderboardState.objects.filter(pk=1).values("total")))
+        .values("rank", "score", "total")
+        .first()
+    )
+    if entry is None:
+        return None
+
+    total = max(entry["total"] or 0, entry["rank"])
+    entry["total"] = total
+    # Share of ranked contributors at or below this one.
+    entry["percentile"] = round(100 * (total - entry["rank"] + 1) / total, 2)
+    return entry
@@ -0,0 +1,72 @@
+from collections import defaultdict
+from typing import Iterable
+from uuid import UUID
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.contributors.models import Contributor, ReputationLog
+from apps.contributors.services.stats import log_rows, update_contributor_stats
+
+# Two parameters per VALUES row; stays well under Postgres' 65535 limit.
+UPDATE_CHUNK_SIZE = 10_000
+LOG_BATCH_SIZE = 5000
+
+UPDATE_SQL = """
+    UPDATE {table} AS c
+    SET reputation_score = c.reputation_score + v.delta, updated_at = %s
+    FROM (VALUES {values}) AS v(id, delta)
+    WHERE c.id = v.id
+    RETURNING c.id
+"""
+
+
+def apply_reputation_changes(
+    changes: Iterable[tuple[UUID, float, str]],
+) -> int:
+    """
+    Settle many ``(contributor_id, change, reason)`` adjustments at once.
+
+    Changes are summed per contributor and applied with one set-based UPDATE
+    per chunk, and every adjustment still gets its own ReputationLog row,
+    all in a single transaction. Raises ValueError (and applies nothing) if
+    any contributor does not exist. Returns the number of contributors
+    updated.
+    """
+    totals = defaultdict(float)
+    logs = []
+    for contributor_id, change, reason in changes:
+        # Ids may arrive as strings in any UUID spelling; key them as UUIDs so
+        # one contributor is summed once and matches the ids Postgres returns.
+        contributor_id = UUID(str(contributor_id))
+        totals[contributor_id] += change
+        logs.append(
+            ReputationLog(contributor_id=contributor_id, change=change, reason=reason)
+        )
+
+    if not totals:
+        return 0
+
+    # A stable order keeps concurrent settlements from deadlocking.
+    deltas = sorted(totals.items())
+    table = connection.ops.quote_name(Contributor._meta.db_table)
+    now = timezone.now()
+
+    with transaction.atomic():
+        updated = set()
+        with connection.cursor() as cursor:
+            for start in range(0, len(deltas), UPDATE_CHUNK_SIZE):
+                chunk = deltas[start:start + UPDATE_CHUNK_SIZE]
+                values = ", ".join(["(%s::uuid, %s::double precision)"] * len(chunk))
+                params = [now] + [value for pk, delta in chunk for value in (str(pk), delta)]
+                cursor.execute(UPDATE_SQL.format(table=table, values=values), params)
+                updated.update(UUID(str(row[0])) for row in cursor.fetchall())
+
+        missing = [str(pk) for pk, _ in deltas if pk not in updated]
+        if missing:
+            raise ValueError(f"Unknown contributor ids: {', '.join(missing[:10])}")
+
+        ReputationLog.objects.bulk_create(logs, batch_size=LOG_BATCH_SIZE)
+        update_contributor_stats(log_rows(logs))
+
+    return len(updated)
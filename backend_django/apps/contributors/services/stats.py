@@ -0,0 +1,157 @@
+"""
+ContributorStats: a per-contributor ReputationLog summary kept in step with
+the log, so reading reputation activity never scans or counts the log.
+
+Every path that writes ReputationLog rows calls ``update_contributor_stats``
+in the same transaction. Summaries served to the API are cached per
+contributor for a short time and dropped when that contributor's stats
+change.
+"""
+
+from functools import partial
+from typing import Any, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.contributors.models import ContributorStats, ReputationLog
+
+RECENT_ACTIVITY_SIZE = 5
+CACHE_TIMEOUT = getattr(settings, "CONTRIBUTOR_STATS_CACHE_TIMEOUT", 30)
+# Five parameters per VALUES row; stays well under Postgres' 65535 limit.
+STATS_CHUNK_SIZE = 10_000
+
+# Folds a batch of new logs into each contributor's summary. New logs are
+# prepended to recent_activity, and per-reason sums are merged key by key.
+UPDATE_STATS_SQL = """
+    WITH new_logs (contributor_id, id, change, reason, created_at) AS (
+        VALUES {values}
+    ),
+    by_reason AS (
+        SELECT contributor_id, jsonb_object_agg(reason, total) AS totals
+        FROM (
+            SELECT contributor_id, reason, SUM(change) AS total
+            FROM new_logs
+            GROUP BY contributor_id, reason
+        ) AS r
+        GROUP BY contributor_id
+    )
+    INSERT INTO {stats} (
+        contributor_id, total_logs, recent_activity, change_by_reason, updated_at
+    )
+    SELECT
+        l.contributor_id,
+        COUNT(*),
+        jsonb_path_query_array(
+            jsonb_agg(
+                jsonb_build_object(
+                    'id', l.id, 'change', l.change, 'reason', l.reason,
+                    'created_at', l.created_at
+                )
+                ORDER BY l.created_at DESC, l.id DESC
+            ),
+            '$[0 to {last}]'
+        ),
+        r.totals,
+        %s
+    FROM new_logs AS l
+    JOIN by_reason AS r USING (contributor_id)
+    GROUP BY l.contributor_id, r.totals
+    ON CONFLICT (contributor_id) DO UPDATE SET
+        total_logs = {stats}.total_logs + EXCLUDED.total_logs,
+        recent_activity = jsonb_path_query_array(
+            EXCLUDED.recent_activity || {stats}.recent_activity, '$[0 to {last}]'
+        ),
+        change_by_reason = (
+            SELECT jsonb_object_agg(key, total)
+            FROM (
+                SELECT key, SUM(value::double precision) AS total
+                FROM (
+                    SELECT * FROM jsonb_each_text({stats}.change_by_reason)
+                    UNION ALL
+                    SELECT * FROM jsonb_each_text(EXCLUDED.change_by_reason)
+                ) AS merged
+                GROUP BY key
+            ) AS summed
+        ),
+        updated_at = EXCLUDED.updated_at
+"""
+
+
+def cache_key(contributor_id) -> str:
+    return f"contributors:reputation-summary:{contributor_id}"
+
+
+def log_rows(logs: Iterable[ReputationLog]) -> list[tuple]:
+    return [
+        (log.contributor_id, log.id, log.change, log.reason, log.created_at)
+        for log in logs
+    ]
+
+
+def update_contributor_stats(rows: Iterable[tuple]) -> None:
+    """
+    Fold newly written ReputationLog rows, given as ``(contributor_id,
+    log_id, change, reason, created_at)``, into ContributorStats. Call inside
+    the transaction that wrote them; cached summaries of the affected
+    contributors are dropped once it commits.
+    """
+    rows = [
+        (str(contributor_id), str(log_id), change, reason, created_at)
+        for contributor_id, log_id, change, reason, created_at in rows
+    ]
+    if not rows:
+        return
+
+    stats = connection.ops.quote_name(ContributorStats._meta.db_table)
+    row_sql = "(%s::uuid, %s::uuid, %s::double precision, %s::varchar, %s::timestamptz)"
+    now = timezone.now()
+    # A stable order keeps concurrent writers from deadlocking on stats rows.
+    rows.sort()
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(rows), STATS_CHUNK_SIZE):
+            chunk = rows[start:start + STATS_CHUNK_SIZE]
+            sql = UPDATE_STATS_SQL.format(
+                values=", ".join([row_sql] * len(chunk)),
+                stats=stats,
+                last=RECENT_ACTIVITY_SIZE - 1,
+            )
+            cursor.execute(sql, [value for row in chunk for value in row] + [now])
+
+    keys = list({cache_key(row[0]) for row in rows})
+    transaction.on_commit(partial(cache.delete_many, keys))
+
+
+def recent_logs(stats: ContributorStats | None) -> list[ReputationLog]:
+    """
+    The newest logs stored in ``stats``, as unsaved ReputationLog instances.
+    """
+    if stats is None:
+        return []
+    return [
+        ReputationLog(
+            id=entry["id"],
+            contributor_id=stats.contributor_id,
+            change=entry["change"],
+            reason=entry["reason"],
+            created_at=parse_datetime(entry["created_at"]),
+        )
+        for entry in stats.recent_activity
+    ]
+
+
+def get_or_build_reputation_summary(contributor_id, build: Callable[[], Any]) -> Any:
+    """
+    Return the cached reputation summary for a contributor, building it on
+    a miss.
+    """
+    key = cache_key(contributor_id)
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, timeout=CACHE_TIMEOUT)
+    return data
@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.contributors.models import Contributor, ReputationDecayState, ReputationLog
+from apps.contributors.services.checkpoints import audit_reputation
+from apps.contributors.services.decay import (
+    CAP_REASON,
+    DECAY_REASON,
+    HALF_LIFE,
+    REPUTATION_CAP,
+    decay_reputation,
+)
+from .factories import create_contributor
+
+
+class DecayReputationTests(TestCase):
+    def setUp(self):
+        self.start = timezone.now()
+        self.idle = create_contributor(display_name="Idle")
+        self.busy = create_contributor(display_name="Busy")
+        self.idle.adjust_reputation(100.0, "Verified claim")
+        self.busy.adjust_reputation(100.0, "Verified claim")
+        ReputationLog.objects.filter(contributor=self.idle).update(
+            created_at=self.start - timedelta(days=365)
+        )
+        decay_reputation(now=self.start)
+
+    def score(self, contributor):
+        return Contributor.objects.values_list("reputation_score", flat=True).get(
+            pk=contributor.pk
+        )
+
+    def test_first_run_only_records_a_starting_point(self):
+        self.assertEqual(self.score(self.idle), 100.0)
+        self.assertEqual(ReputationDecayState.objects.get().processed_until, self.start)
+
+    def test_inactive_contributors_decay(self):
+        changed = decay_reputation(now=self.start + HALF_LIFE)
+
+        self.assertEqual(changed, 1)
+        self.assertAlmostEqual(self.score(self.idle), 50.0)
+        self.assertEqual(self.score(self.busy), 100.0)
+        log = self.idle.reputation_logs.get(reason=DECAY_REASON)
+        self.assertAlmostEqual(log.change, -50.0)
+
+    def test_logs_are_stamped_when_written(self):
+        before = timezone.now()
+        decay_reputation(now=self.start - timedelta(hours=1) + HALF_LIFE, chunk_size=1)
+
+        for created_at in ReputationLog.objects.filter(reason=DECAY_REASON).values_list(
+            "created_at", flat=True
+        ):
+            self.assertGreaterEqual(created_at, before)
+            self.assertLessEqual(created_at, timezone.now())
+
+    def test_decay_logs_do_not_count_as_activity(self):
+        decay_reputation(now=self.start + HALF_LIFE)
+        decay_reputation(now=self.start + HALF_LIFE * 2)
+
+        self.assertAlmostEqual(self.score(self.idle), 25.0)
+
+    def test_scores_are_capped(self):
+        self.busy.adjust_reputation(REPUTATION_CAP, "Event bonus")
+
+        decay_reputation(now=self.start + timedelta(seconds=1))
+
+        self.assertEqual(self.score(self.busy), REPUTATION_CAP)
+        self.assertAlmostEqual(self.busy.reputation_logs.get(reason=CAP_REASON).change, -100.0)
+
+    def test_unchanged_rows_are_not_written(self):
+        zero = create_contributor(display_name="Zero")
+
+        decay_reputation(now=self.start + HALF_LIFE)
+
+        self.assertFalse(zero.reputation_logs.exists())
+
+    def test_log_still_replays_to_scores(self):
+        decay_reputation(now=self.start + HALF_LIFE, chunk_size=1)
+
+        self.assertEqual(audit_reputation()["drift"], [])
+
+    def test_interrupted_run_resumes_without_decaying_twice(self):
+        state = ReputationDecayState.objects.get()
+        state.run_until = self.start + HALF_LIFE
+        state.cursor = self.idle.pk  # idle already processed
+        state.save()
+        Contributor.objects.filter(pk=self.idle.pk).update(reputation_score=50.0)
+
+        decay_reputation(now=self.start + HALF_LIFE * 3)
+
+        state.refresh_from_db()
+        self.assertEqual(state.processed_until, self.start + HALF_LIFE)
+        self.assertIsNone(state.run_until)
+        self.assertEqual(self.score(self.idle), 50.0)
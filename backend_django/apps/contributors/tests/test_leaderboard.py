@@ -0,0 +1,123 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.contributors.models import Contributor, LeaderboardEntry
+from apps.contributors.services.leaderboard import (
+    SETTLE_DELAY,
+    contributor_standing,
+    rebuild_leaderboard,
+    refresh_leaderboard,
+)
+from .factories import create_contributor
+
+
+def ranking():
+    return list(
+        LeaderboardEntry.objects.order_by("rank").values_list("contributor_id", "rank")
+    )
+
+
+class LeaderboardServiceTests(APITestCase):
+    def setUp(self):
+        self.contributors = [
+            create_contributor(display_name=f"C{i}", reputation_score=float(i))
+            for i in range(6)
+        ]
+
+    def expected_ranking(self):
+        active = Contributor.objects.filter(is_active=True).order_by(
+            "-reputation_score", "id"
+        )
+        return [(c.id, rank) for rank, c in enumerate(active, start=1)]
+
+    def test_rebuild_ranks_active_contributors_by_score(self):
+        self.contributors[0].is_active = False
+        self.contributors[0].save()
+
+        total = rebuild_leaderboard()
+
+        self.assertEqual(total, 5)
+        self.assertEqual(ranking(), self.expected_ranking())
+        self.assertEqual(ranking()[0][0], self.contributors[5].id)
+
+    def test_refresh_matches_full_rebuild(self):
+        rebuild_leaderboard(timezone.now() - SETTLE_DELAY * 2)
+
+        self.contributors[1].adjust_reputation(10, "Verified claim")
+        self.contributors[4].adjust_reputation(-3.5, "Rejected evidence")
+        self.contributors[5].is_active = False
+        self.contributors[5].save()
+        self.contributors[5].adjust_reputation(1, "Bonus")
+
+        changed = refresh_leaderboard()
+
+        self.assertEqual(changed, 3)
+        self.assertEqual(ranking(), self.expected_ranking())
+        self.assertFalse(
+            LeaderboardEntry.objects.filter(contributor=self.contributors[5]).exists()
+        )
+
+    def test_refresh_without_changes_keeps_ranks(self):
+        rebuild_leaderboard(timezone.now() - timedelta(hours=1))
+        before = ranking()
+
+        self.assertEqual(refresh_leaderboard(), 0)
+        self.assertEqual(ranking(), before)
+
+    def test_first_refresh_rebuilds(self):
+        self.assertEqual(refresh_leaderboard(), 6)
+        self.assertEqual(ranking(), self.expected_ranking())
+
+    def test_standing(self):
+        rebuild_leaderboard()
+
+        top = contributor_standing(self.contributors[5])
+        bottom = contributor_standing(self.contributors[0])
+
+        self.assertEqual((top["rank"], top["total"], top["percentile"]), (1, 6, 100.0))
+        self.assertEqual(bottom["rank"], 6)
+        self.assertEqual(bottom["percentile"], round(100 / 6, 2))
+
+    def test_unranked_contributor_has_no_standing(self):
+        self.assertIsNone(contributor_standing(self.contributors[0]))
+
+
+class LeaderboardViewTests(APITestCase):
+    def setUp(self):
+        self.low = create_contributor(display_name="Low", reputation_score=1.0)
+        self.high = create_contributor(display_name="High", reputation_score=5.0)
+        rebuild_leaderboard()
+
+    def test_lists_top_contributors(self):
+        response = self.client.get(reverse("contributor-leaderboard"), {"limit": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["rank"], 1)
+        self.assertEqual(response.data[0]["display_name"], "High")
+
+    def test_invalid_limit(self):
+        response = self.client.get(reverse("contributor-leaderboard"), {"limit": "x"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_my_standing(self):
+        self.client.force_authenticate(user=self.low.user)
+
+        response = self.client.get(reverse("my-leaderboard-standing"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rank"], 2)
+        self.assertEqual(response.data["total"], 2)
+
+    def test_my_standing_requires_ranking(self):
+        unranked = create_contributor(display_name="New")
+        self.client.force_authenticate(user=unranked.user)
+
+        response = self.client.get(reverse("my-leaderboard-standing"))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
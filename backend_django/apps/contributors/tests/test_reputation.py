@@ -0,0 +1,77 @@
+import uuid
+
+from django.test import TestCase
+
+from apps.contributors.models import ReputationLog
+from apps.contributors.services.reputation import apply_reputation_changes
+from .factories import create_contributor
+
+
+class ApplyReputationChangesTests(TestCase):
+    def setUp(self):
+        self.alice = create_contributor(display_name="Alice")
+        self.bob = create_contributor(display_name="Bob")
+
+    def test_changes_are_summed_per_contributor_and_logged(self):
+        updated = apply_reputation_changes(
+            [
+                (self.alice.id, 1.5, "Verified claim"),
+                (self.bob.id, -0.5, "Rejected evidence"),
+                (self.alice.id, 2.0, "Event bonus"),
+            ]
+        )
+
+        self.alice.refresh_from_db()
+        self.bob.refresh_from_db()
+        self.assertEqual(updated, 2)
+        self.assertEqual(self.alice.reputation_score, 3.5)
+        self.assertEqual(self.bob.reputation_score, -0.5)
+        self.assertEqual(self.alice.reputation_logs.count(), 2)
+        self.assertEqual(self.bob.reputation_logs.get().reason, "Rejected evidence")
+
+    def test_query_count_does_not_grow_with_contributors(self):
+        contributors = [create_contributor(display_name=f"C{i}") for i in range(50)]
+
+        # savepoint, UPDATE ... FROM (VALUES ...), log INSERT, stats upsert, release
+        with self.assertNumQueries(5):
+            apply_reputation_changes((c.id, 1.0, "Settlement") for c in contributors)
+
+        self.assertEqual(ReputationLog.objects.count(), 50)
+
+    def test_unknown_contributor_applies_nothing(self):
+        with self.assertRaises(ValueError):
+            apply_reputation_changes(
+                [(self.alice.id, 1.0, "Bonus"), (uuid.uuid4(), 1.0, "Bonus")]
+            )
+
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.reputation_score, 0.0)
+        self.assertFalse(ReputationLog.objects.exists())
+
+    def test_string_ids_are_accepted_in_any_spelling(self):
+        updated = apply_reputation_changes(
+            [
+                (str(self.alice.id), 1.0, "Verified claim"),
+                (str(self.alice.id).upper(), 1.0, "Event bonus"),
+                (self.alice.id.hex, 1.0, "Event bonus"),
+                (str(self.bob.id), -1.0, "Rejected evidence"),
+            ]
+        )
+
+        self.alice.refresh_from_db()
+        self.assertEqual(updated, 2)
+        self.assertEqual(self.alice.reputation_score, 3.0)
+        self.assertEqual(self.alice.reputation_logs.count(), 3)
+
+    def test_unknown_string_id_applies_nothing(self):
+        with self.assertRaises(ValueError):
+            apply_reputation_changes(
+                [(str(self.alice.id), 1.0, "Bonus"), (str(uuid.uuid4()), 1.0, "Bonus")]
+            )
+
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.reputation_score, 0.0)
+
+    def test_empty_batch(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(apply_reputation_changes([]), 0)
@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.contributors.models import ContributorStats, ReputationDecayState
+from apps.contributors.services.decay import DECAY_REASON, HALF_LIFE, decay_reputation
+from apps.contributors.services.reputation import apply_reputation_changes
+from apps.contributors.services.stats import RECENT_ACTIVITY_SIZE
+from .factories import create_contributor
+
+
+class ContributorStatsTests(APITestCase):
+    def setUp(self):
+        self.contributor = create_contributor(display_name="Alice")
+
+    def stats(self, contributor=None):
+        return ContributorStats.objects.get(contributor=contributor or self.contributor)
+
+    def test_adjust_reputation_updates_stats(self):
+        self.contributor.adjust_reputation(2.0, "Verified claim")
+        self.contributor.adjust_reputation(-0.5, "Rejected evidence")
+        self.contributor.adjust_reputation(1.0, "Verified claim")
+
+        stats = self.stats()
+        self.assertEqual(stats.total_logs, 3)
+        self.assertEqual(
+            stats.change_by_reason, {"Verified claim": 3.0, "Rejected evidence": -0.5}
+        )
+        self.assertEqual(
+            [entry["change"] for entry in stats.recent_activity], [1.0, -0.5, 2.0]
+        )
+
+    def test_recent_activity_keeps_newest_logs(self):
+        for i in range(RECENT_ACTIVITY_SIZE + 2):
+            self.contributor.adjust_reputation(float(i), "Bonus")
+
+        stats = self.stats()
+        self.assertEqual(stats.total_logs, RECENT_ACTIVITY_SIZE + 2)
+        self.assertEqual(len(stats.recent_activity), RECENT_ACTIVITY_SIZE)
+        self.assertEqual(
+            stats.recent_activity[0]["id"],
+            str(self.contributor.reputation_logs.latest("created_at").id),
+        )
+
+    def test_batch_settlement_updates_stats(self):
+        bob = create_contributor(display_name="Bob")
+
+        apply_reputation_changes(
+            [
+                (self.contributor.id, 1.0, "Settlement"),
+                (bob.id, 2.0, "Settlement"),
+                (self.contributor.id, 0.5, "Event bonus"),
+            ]
+        )
+
+        self.assertEqual(self.stats().total_logs, 2)
+        self.assertEqual(self.stats(bob).change_by_reason, {"Settlement": 2.0})
+
+    def test_decay_updates_stats(self):
+        self.contributor.adjust_reputation(10.0, "Verified claim")
+        start = timezone.now() + timedelta(days=60)
+        ReputationDecayState.objects.create(processed_until=start)
+
+        decay_reputation(now=start + HALF_LIFE)
+
+        stats = self.stats()
+        self.assertEqual(stats.total_logs, 2)
+        self.assertAlmostEqual(stats.change_by_reason[DECAY_REASON], -5.0)
+
+
+class MyContributorReputationViewTests(APITestCase):
+    def setUp(self):
+        self.contributor = create_contributor()
+        self.client.force_authenticate(user=self.contributor.user)
+        self.url = reverse("my-contributor-reputation")
+
+    def test_returns_summary(self):
+        self.contributor.adjust_reputation(2.0, "Verified claim")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["reputation_score"], 2.0)
+        self.assertEqual(response.data["total_logs"], 1)
+        self.assertEqual(response.data["recent_activity"][0]["reason"], "Verified claim")
+        self.assertEqual(response.data["change_by_reason"], {"Verified claim": 2.0})
+
+    def test_contributor_without_logs(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["total_logs"], 0)
+        self.assertEqual(response.data["recent_activity"], [])
+
+    def test_summary_is_cached_until_reputation_changes(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.contributor.adjust_reputation(1.0, "Verified claim")
+        self.client.get(self.url)
+        ContributorStats.objects.filter(contributor=self.contributor).update(total_logs=99)
+
+        self.assertEqual(self.client.get(self.url).data["total_logs"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.contributor.adjust_reputation(1.0, "Verified claim")
+
+        self.assertEqual(self.client.get(self.url).data["total_logs"], 100)
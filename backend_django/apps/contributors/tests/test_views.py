@@ -20,4 +20,27 @@ class MyContributorProfileViewTests(APITestCase):
         url = reverse("my-contributor-profile")
         response = self.client.get(url)
 
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+class PublicContributorDetailViewTests(APITestCase):
+
+    def test_unchanged_contributor_returns_304(self):
+        contributor = create_contributor()
+        url = reverse("public-contributor-detail", args=[contributor.id])
+
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_reputation_change_changes_etag(self):
+        contributor = create_contributor()
+        url = reverse("public-contributor-detail", args=[contributor.id])
+        etag = self.client.get(url)["ETag"]
+
+        contributor.adjust_reputation(1.0, "Verified claim")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["reputation_score"], 1.0)
@@ -3,6 +3,8 @@ from .views import *
 
 urlpatterns = [
     path('me/', MyContributorProfileView.as_view(), name='my-contributor-profile'),
-    path('<int:pk>/', PublicContributorDetailView.as_view(), name='public-contributor-detail'),
+    path('<uuid:pk>/', PublicContributorDetailView.as_view(), name='public-contributor-detail'),
     path('reputation/', MyContributorReputationView.as_view(), name='my-contributor-reputation'),
+    path('leaderboard/', LeaderboardView.as_view(), name='contributor-leaderboard'),
+    path('leaderboard/me/', MyLeaderboardStandingView.as_view(), name='my-leaderboard-standing'),
 ]
\ No newline at end of file
@@ -1,3 +1,4 @@
+from rest_framework.exceptions import ValidationError
 from rest_framework.generics import (
     RetrieveAPIView,
     RetrieveUpdateAPIView,
@@ -6,16 +7,21 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.exceptions import NotFound
-from apps.contributors.models import Contributor
+from apps.contributors.models import Contributor, ContributorStats
 from apps.contributors.serializers import (
     ContributorSelfSerializer,
     ContributorPublicSerializer,
+    LeaderboardEntrySerializer,
+    ReputationLogSerializer,
 )
+from apps.contributors.services.leaderboard import contributor_standing, top_contributors
+from apps.contributors.services.stats import get_or_build_reputation_summary, recent_logs
 from apps.contributors.permissions import (
     IsContributorOwner,
     IsActiveContributor,
     IsTargetContributorActive,
 )
+from apps.common.views import ConditionalRetrieveMixin
 
 class MyContributorProfileView(RetrieveUpdateAPIView):
     """
@@ -34,7 +40,7 @@ class MyContributorProfileView(RetrieveUpdateAPIView):
         except Contributor.DoesNotExist:
             raise NotFound("Contributor profile not found.")
 
-class PublicContributorDetailView(RetrieveAPIView):
+class PublicContributorDetailView(ConditionalRetrieveMixin, RetrieveAPIView):
     """
     Public read-only view of an active contributor.
     """
@@ -59,14 +65,54 @@ class MyContributorReputationView(APIView):
         if not contributor:
             raise NotFound("Contributor profile not found.")
 
-        recent_logs = ReputationLogSerializer(
-            contributor.reputation_logs.order_by("-created_at")[:5],
-            many=True
-        ).data
+        # Polled by the dashboard: served from the ContributorStats row and
+        # cached briefly; any reputation change drops the cached copy.
+        def build():
+            stats = ContributorStats.objects.filter(contributor=contributor).first()
+            return {
+                "reputation_score": contributor.reputation_score,
+                "total_logs": stats.total_logs if stats else 0,
+                "recent_activity": ReputationLogSerializer(
+                    recent_logs(stats), many=True
+                ).data,
+                "change_by_reason": {
+                    reason: float(total)
+                    for reason, total in (stats.change_by_reason if stats else {}).items()
+                },
+            }
 
-        data = {
-            "reputation_score": contributor.reputation_score,
-            "total_logs": contributor.reputation_logs.count(),
-            "recent_activity": recent_logs,
-        }
-        return Response(data)
\ No newline at end of file
+        return Response(get_or_build_reputation_summary(contributor.pk, build))
+
+
+class LeaderboardView(APIView):
+    """
+    Top contributors by reputation, served from the leaderboard snapshot.
+    """
+    default_limit = 50
+    max_limit = 500
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get("limit", self.default_limit))
+        except ValueError:
+            raise ValidationError({"limit": "Must be an integer."})
+        limit = max(1, min(limit, self.max_limit))
+
+        entries = top_contributors(limit)
+        return Response(LeaderboardEntrySerializer(entries, many=True).data)
+
+
+class MyLeaderboardStandingView(APIView):
+    """
+    The authenticated contributor's rank and percentile.
+    """
+    permission_classes = [
+        IsAuthenticated,
+        IsActiveContributor,
+    ]
+
+    def get(self, request):
+        standing = contributor_standing(request.user.contributor_profile)
+        if standing is None:
+            raise NotFound("Contributor is not ranked yet.")
+        return Response(standing)
@@ -97,6 +97,19 @@ DATABASES = {
     }
 }
 
+# Shared cache for response caching, counters and rate limiting. Point this at
+# Redis/Memcached in deployments with more than one worker process: the cached
+# anonymous claim list is invalidated through this cache, and with the
+# per-process LocMemCache other workers keep serving stale pages for up to
+# CLAIM_LIST_CACHE_TIMEOUT seconds. `manage.py check --deploy` fails on that
+# combination; set CLAIM_LIST_CACHE_TIMEOUT = 0 to disable the list cache.
+CACHES = {
+    "default": {
+        "BACKEND": getenv("CACHE_BACKEND") or "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": getenv("CACHE_LOCATION") or "civicverify",
+    }
+}
+
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.Argon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",